@@ -1,13 +1,18 @@
-from flask import Flask, render_template, request, jsonify, session, Response
+from flask import Flask, render_template, request, jsonify, session, Response, url_for, send_file, stream_with_context
 import uuid
 import json
 import os
 import logging
 import re
 import sys
+import hashlib
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
 import time
 from datetime import datetime
 from poster_scraper import *
+from poster_scraper import _get_selenium_current_url
 from config import Config
 import threading
 
@@ -103,6 +108,8 @@ def setup_logging():
     werkzeug_logger.setLevel(log_level)
     werkzeug_logger.addFilter(WerkzeugAccessLogFilter())
     werkzeug_logger.propagate = True
+    # Pillow logs every plugin import at DEBUG.
+    logging.getLogger("PIL").setLevel(logging.INFO)
 
 
 setup_logging()
@@ -110,7 +117,6 @@ setup_logging()
 # Global storage for session data
 user_sessions = {}
 selenium_ready_event = threading.Event()
-BATCH_DELAY_SEC = getattr(Config, 'TPDB_BATCH_DELAY_SEC', 1.5)
 FAILED_LOG_FILE = getattr(Config, 'FAILED_LOG_FILE', os.path.join(Config.LOG_DIR, 'failed.log'))
 RESULTS_LOG_FILE = getattr(Config, 'RESULTS_LOG_FILE', os.path.join(Config.LOG_DIR, 'results.log'))
 auto_batch_jobs = {}
@@ -119,6 +125,35 @@ season_count_cache = {}
 season_count_cache_lock = threading.Lock()
 MAX_FINISHED_AUTO_BATCH_JOBS = 20
 MAX_SEASON_COUNT_CACHE_ENTRIES = 2000
+# Upload workers wait on the TPDB download and Jellyfin upload caps, so both can be busy at once.
+UPLOAD_ALL_WORKERS = JELLYFIN_UPLOAD_CONCURRENCY + TPDB_DOWNLOAD_CONCURRENCY
+# Retries search TPDB first, so more workers than browsers would only queue on the pool.
+RETRY_ALL_WORKERS = TPDB_BROWSER_POOL_SIZE
+# Auto-batch pipeline: one search worker per TPDB browser feeds a bounded queue of upload workers.
+AUTO_BATCH_SEARCH_WORKERS = TPDB_BROWSER_POOL_SIZE
+AUTO_BATCH_UPLOAD_WORKERS = UPLOAD_ALL_WORKERS
+AUTO_BATCH_UPLOAD_QUEUE_SIZE = max(1, int(getattr(Config, 'AUTO_BATCH_UPLOAD_QUEUE_SIZE', 8)))
+# Upload workers and batch jobs append to the same JSONL logs.
+log_write_lock = threading.Lock()
+IDLE_WARMUP_ENABLED = getattr(Config, 'IDLE_WARMUP_ENABLED', False)
+IDLE_WARMUP_IDLE_AFTER_SEC = getattr(Config, 'IDLE_WARMUP_IDLE_AFTER_SEC', 300)
+IDLE_WARMUP_ITEM_DELAY_SEC = getattr(Config, 'IDLE_WARMUP_ITEM_DELAY_SEC', 10)
+IDLE_WARMUP_RESCAN_SEC = getattr(Config, 'IDLE_WARMUP_RESCAN_SEC', 6 * 3600)
+IDLE_WARMUP_CHECK_SEC = 15
+idle_warmup_state = {
+    'enabled': IDLE_WARMUP_ENABLED,
+    'paused': False,
+    'status': 'disabled' if not IDLE_WARMUP_ENABLED else 'starting',
+    'total_items': 0,
+    'processed': 0,
+    'warmed': 0,
+    'deferred': 0,
+    'failed': 0,
+    'current_item': None,
+    'pass_started_at': None,
+    'pass_finished_at': None,
+}
+idle_warmup_lock = threading.Lock()
 
 
 def _prune_auto_batch_jobs():
@@ -154,17 +189,24 @@ def _touch_session(session_id):
         user_sessions[session_id]['last_seen'] = time.time()
 
 
+# File-name prefixes of the temp posters older versions wrote: the fixed auto_/manual_/retry_
+# names plus the operation names used by _upload_poster_url_to_jellyfin_item.
+LEGACY_TEMP_POSTER_PREFIXES = (
+    'auto_', 'manual_', 'retry_',
+    'auto-poster_', 'manual-upload_', 'batch-upload_', 'direct-upload_',
+    'retry-auto-poster_', 'retry-all-auto-poster_',
+)
+
+
 def _sweep_stale_temp_posters(max_age_sec=3600):
+    """Remove temp posters left behind by older versions; uploads no longer write to TEMP_POSTER_DIR."""
     if not os.path.isdir(Config.TEMP_POSTER_DIR):
         return
 
     now_ts = time.time()
     removed_count = 0
     for file_name in os.listdir(Config.TEMP_POSTER_DIR):
-        if not (
-            (file_name.startswith("auto_") or file_name.startswith("manual_"))
-            and file_name.lower().endswith(".jpg")
-        ):
+        if not (file_name.startswith(LEGACY_TEMP_POSTER_PREFIXES) and file_name.lower().endswith(".jpg")):
             continue
         file_path = os.path.join(Config.TEMP_POSTER_DIR, file_name)
         try:
@@ -177,25 +219,19 @@ def _sweep_stale_temp_posters(max_age_sec=3600):
         logging.info("Removed %d stale temp poster files.", removed_count)
 
 
-def _create_auto_batch_job(target_filter, skip_processed=False, include_season_posters=False, replace_existing_season_posters=False):
+def _create_job(kind, message, **fields):
+    """Register a background job (auto-batch, upload-all, retry-all) and return its id."""
     job_id = str(uuid.uuid4())
     now = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
     job = {
         'job_id': job_id,
-        'filter': target_filter,
-        'skip_processed': skip_processed,
-        'include_season_posters': include_season_posters,
-        'replace_existing_season_posters': replace_existing_season_posters,
+        'kind': kind,
+        **fields,
         'status': 'starting',
         'phase': 'starting',
-        'message': 'Starting automatic poster batch...',
+        'message': message,
         'cancel_requested': False,
         'current_item': None,
-        'current_item_id': None,
-        'current_item_type': None,
-        'current_item_year': None,
-        'old_poster_url': None,
-        'new_poster_url': None,
         'total_items': 0,
         'processed': 0,
         'remaining': 0,
@@ -214,6 +250,22 @@ def _create_auto_batch_job(target_filter, skip_processed=False, include_season_p
     return job_id
 
 
+def _create_auto_batch_job(target_filter, skip_processed=False, include_season_posters=False, replace_existing_season_posters=False):
+    return _create_job(
+        'auto-batch',
+        'Starting automatic poster batch...',
+        filter=target_filter,
+        skip_processed=skip_processed,
+        include_season_posters=include_season_posters,
+        replace_existing_season_posters=replace_existing_season_posters,
+        current_item_id=None,
+        current_item_type=None,
+        current_item_year=None,
+        old_poster_url=None,
+        new_poster_url=None,
+    )
+
+
 def _update_auto_batch_job(job_id, **updates):
     updates['updated_at'] = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
     with auto_batch_jobs_lock:
@@ -256,12 +308,12 @@ def _cancel_auto_batch_job(job_id):
         return dict(job)
 
 
-def _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count):
+def _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count, message='Automatic batch cancelled.'):
     _update_auto_batch_job(
         job_id,
         status='cancelled',
         phase='cancelled',
-        message='Automatic batch cancelled.',
+        message=message,
         current_item=None,
         current_item_id=None,
         old_poster_url=None,
@@ -275,6 +327,88 @@ def _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count
     )
 
 
+def _run_item_job(job_id, entries, process_entry, workers, label):
+    """
+    Run `process_entry(entry)` for every entry on up to `workers` threads, recording the
+    returned result dicts on the job in entry order. Entries that have not started are
+    skipped once the job is cancelled or a result reports a TPDB rate limit.
+    """
+    total_items = len(entries)
+    results = [None] * total_items
+    counts = {'processed': 0, 'successful': 0, 'failed': 0}
+    counts_lock = threading.Lock()
+    rate_limited = threading.Event()
+
+    def run_entry(index, entry):
+        if rate_limited.is_set() or _is_auto_batch_cancelled(job_id):
+            return
+        result = process_entry(entry)
+        if result.get('error_type') == 'tpdb_rate_limited':
+            rate_limited.set()
+        with counts_lock:
+            results[index] = result
+            counts['processed'] += 1
+            counts['successful' if result.get('success') else 'failed'] += 1
+            updates = {
+                'current_item': result.get('item_title') or result.get('item_id'),
+                'results': [entry_result for entry_result in results if entry_result is not None],
+                **counts,
+            }
+            # Keep the "Cancelling..." message once a cancel is requested; in-flight entries still count.
+            if not _is_auto_batch_cancelled(job_id):
+                updates['message'] = f"{label} {counts['processed']} of {total_items}..."
+            _update_auto_batch_job(job_id, **updates)
+
+    try:
+        _update_auto_batch_job(
+            job_id,
+            status='running',
+            phase='processing',
+            message=f"{label} 0 of {total_items}...",
+            total_items=total_items,
+            processed=0,
+        )
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="job-worker") as executor:
+            for future in [executor.submit(run_entry, index, entry) for index, entry in enumerate(entries)]:
+                future.result()
+
+        finished_results = [result for result in results if result is not None]
+        if _is_auto_batch_cancelled(job_id):
+            _finish_auto_batch_cancelled(
+                job_id, finished_results, counts['successful'], counts['failed'], message=f"{label} cancelled."
+            )
+            return
+        _update_auto_batch_job(
+            job_id,
+            status='completed',
+            phase='rate_limited' if rate_limited.is_set() else 'completed',
+            message=(
+                f"{label} stopped early: TPDB rate limit." if rate_limited.is_set()
+                else f"{label} finished: {counts['successful']} succeeded, {counts['failed']} failed."
+            ),
+            current_item=None,
+            results=finished_results,
+            done=True,
+            success=counts['failed'] == 0 and not rate_limited.is_set(),
+            error='TPDB rate limit' if rate_limited.is_set() else None,
+            **counts,
+        )
+    except Exception as e:
+        logging.exception(f"{label} job {job_id} failed")
+        _update_auto_batch_job(job_id, status='failed', phase='failed', message=str(e), done=True, success=False, error=str(e))
+
+
+def _start_item_job(kind, label, entries, process_entry, workers):
+    job_id = _create_job(kind, f"Starting {label.lower()}...")
+    threading.Thread(
+        target=_run_item_job,
+        args=(job_id, entries, process_entry, workers, label),
+        name=f"{kind}-{job_id[:8]}",
+        daemon=True,
+    ).start()
+    return job_id
+
+
 def _get_failed_log_path():
     return FAILED_LOG_FILE
 
@@ -285,14 +419,16 @@ def _get_results_log_path():
 
 def _write_failed_log_entry(entry):
     os.makedirs(Config.LOG_DIR, exist_ok=True)
-    with open(_get_failed_log_path(), 'a', encoding='utf-8') as failed_log:
-        failed_log.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    line = json.dumps(entry, ensure_ascii=False) + '\n'
+    with log_write_lock, open(_get_failed_log_path(), 'a', encoding='utf-8') as failed_log:
+        failed_log.write(line)
 
 
 def _write_results_log_entry(entry):
     os.makedirs(Config.LOG_DIR, exist_ok=True)
-    with open(_get_results_log_path(), 'a', encoding='utf-8') as results_log:
-        results_log.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    line = json.dumps(entry, ensure_ascii=False) + '\n'
+    with log_write_lock, open(_get_results_log_path(), 'a', encoding='utf-8') as results_log:
+        results_log.write(line)
 
 
 def _log_processed_item(item=None, operation='auto-poster', poster_url=None, item_id=None, item_title=None, item_type=None, item_year=None, poster_targets=None, season_results=None):
@@ -483,23 +619,11 @@ def _find_jellyfin_item(item_id):
     return next((current_item for current_item in get_jellyfin_items() if current_item.get('id') == item_id), None)
 
 
-def _safe_filename_part(value):
-    return "".join(c for c in (value or "item") if c.isalnum() or c in " _-").rstrip() or "item"
-
-
-def _upload_poster_url_to_jellyfin_item(target_id, poster_url, filename_prefix, title):
-    safe_title = _safe_filename_part(title)
-    save_path = os.path.join(Config.TEMP_POSTER_DIR, f"{filename_prefix}_{safe_title}_{target_id}.jpg")
-    if not download_image_with_cookies(poster_url, save_path):
+def _upload_poster_url_to_jellyfin_item(target_id, poster_url):
+    image = download_tpdb_image_for_upload(poster_url)
+    if not image:
         return False
-    try:
-        return upload_image_to_jellyfin_improved(target_id, save_path)
-    finally:
-        try:
-            if os.path.exists(save_path):
-                os.remove(save_path)
-        except Exception as cleanup_error:
-            logging.warning(f"Failed to cleanup temp file {save_path}: {cleanup_error}")
+    return upload_image_source_to_jellyfin(target_id, image)
 
 
 def _normalize_selection(selection):
@@ -529,12 +653,9 @@ def _upload_selection_to_jellyfin(item, selection, operation='manual-upload'):
     uploaded_any = False
     series_poster_uploaded = False
 
-    os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-    _sweep_stale_temp_posters()
-
     if primary_url:
         logging.info(f"Uploading poster to Jellyfin for {item_title}")
-        if _upload_poster_url_to_jellyfin_item(item_id, primary_url, operation, item_title):
+        if _upload_poster_url_to_jellyfin_item(item_id, primary_url):
             uploaded_any = True
             series_poster_uploaded = True
         else:
@@ -546,7 +667,7 @@ def _upload_selection_to_jellyfin(item, selection, operation='manual-upload'):
         season_title = season_selection.get('title') if isinstance(season_selection, dict) else f"Season {season_id}"
         if not season_id or not season_url:
             continue
-        if _upload_poster_url_to_jellyfin_item(season_id, season_url, operation, f"{item_title}_{season_title}"):
+        if _upload_poster_url_to_jellyfin_item(season_id, season_url):
             uploaded_any = True
             season_results.append({'season_id': season_id, 'season_title': season_title, 'success': True, 'poster_url': season_url})
         else:
@@ -577,6 +698,15 @@ def _upload_selection_to_jellyfin(item, selection, operation='manual-upload'):
     }
 
 
+def _selection_poster_urls(selection):
+    normalized = _normalize_selection(selection)
+    season_urls = [
+        season_selection.get('url') if isinstance(season_selection, dict) else season_selection
+        for season_selection in normalized['season_posters'].values()
+    ]
+    return [url for url in [normalized['series_poster_url'], *season_urls] if url]
+
+
 def _selection_from_poster_group(group, replace_existing_season_posters=False):
     show_posters = group.get('show_posters') or []
     selection = {
@@ -624,35 +754,9 @@ def _auto_fetch_and_upload_item(item, operation='retry-auto-poster'):
         }
 
     poster_url = posters[0]['url']
-    os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-    _sweep_stale_temp_posters()
-    safe_title = "".join(c for c in item_title if c.isalnum() or c in " _-").rstrip()
-    save_path = os.path.join(Config.TEMP_POSTER_DIR, f"retry_{safe_title}_{item_id}.jpg")
-
-    try:
-        if not download_image_with_cookies(poster_url, save_path):
-            error = 'Failed to download poster'
-            _log_failed_item(item, error, operation=operation, poster_url=poster_url)
-            return {
-                'item_id': item_id,
-                'item_title': item_title,
-                'success': False,
-                'error': error,
-                'poster_url': poster_url,
-            }
-
-        upload_success = upload_image_to_jellyfin_improved(item_id, save_path)
-        if upload_success:
-            _log_processed_item(item, operation=operation, poster_url=poster_url)
-            return {
-                'item_id': item_id,
-                'item_title': item_title,
-                'success': True,
-                'error': None,
-                'poster_url': poster_url,
-            }
-
-        error = 'Failed to upload to Jellyfin'
+    image = download_tpdb_image_for_upload(poster_url)
+    if not image:
+        error = 'Failed to download poster'
         _log_failed_item(item, error, operation=operation, poster_url=poster_url)
         return {
             'item_id': item_id,
@@ -661,12 +765,27 @@ def _auto_fetch_and_upload_item(item, operation='retry-auto-poster'):
             'error': error,
             'poster_url': poster_url,
         }
-    finally:
-        try:
-            if os.path.exists(save_path):
-                os.remove(save_path)
-        except Exception as cleanup_error:
-            logging.warning(f"Failed to cleanup temp file {save_path}: {cleanup_error}")
+
+    upload_success = upload_image_source_to_jellyfin(item_id, image)
+    if upload_success:
+        _log_processed_item(item, operation=operation, poster_url=poster_url)
+        return {
+            'item_id': item_id,
+            'item_title': item_title,
+            'success': True,
+            'error': None,
+            'poster_url': poster_url,
+        }
+
+    error = 'Failed to upload to Jellyfin'
+    _log_failed_item(item, error, operation=operation, poster_url=poster_url)
+    return {
+        'item_id': item_id,
+        'item_title': item_title,
+        'success': False,
+        'error': error,
+        'poster_url': poster_url,
+    }
 
 @app.route('/')
 def index():
@@ -724,46 +843,93 @@ def index():
                                current_library=current_library,
                                current_sort=sort_by)
 
-@app.route('/item/<item_id>/posters')
-def get_item_posters(item_id):
-    """Get posters for a specific item"""
-    if not selenium_ready_event.wait(timeout=30):
-        logging.error("Selenium not ready in time for /item/<item_id>/posters")
-        return jsonify({'error': 'Backend service (Selenium) is not ready. Please try again in a moment.'}), 503
 
+def _attach_preview_urls(search_result):
+    """Point every poster at a resized WebP from the /thumbnail proxy and drop any inline base64 preview."""
+    posters = list(search_result.get('posters', []))
+    for group in search_result.get('groups', []):
+        posters.extend(group.get('show_posters', []) + group.get('season_posters', []))
+    for poster in posters:
+        poster['base64'] = None
+        poster['preview_url'] = url_for(
+            'get_thumbnail',
+            url=poster.get('preview_source_url') or poster.get('url'),
+            w=TPDB_PREVIEW_THUMBNAIL_WIDTH,
+            format='webp',
+        )
+    return search_result
+
+
+DEFAULT_POSTER_SET_LIMIT = 3
+
+
+def _poster_search_kwargs(item, poster_set_limit=DEFAULT_POSTER_SET_LIMIT, requested_set_url=None, preview_by_url=True):
+    """search_tpdb_for_poster_groups kwargs for `item`; prefetch uses the defaults the poster modal sends."""
+    eligible_seasons = get_jellyfin_seasons(item['id']) if item.get('type') == 'Series' else []
+    return {
+        'item_year': item.get('year'),
+        'item_type': item.get('type'),
+        'tmdb_id': item.get('ProviderIds', {}).get('Tmdb'),
+        'eligible_seasons': eligible_seasons,
+        'max_posters': poster_set_limit if item.get('type') == 'Series' else Config.MAX_POSTERS_PER_ITEM,
+        'requested_set_urls': [requested_set_url] if requested_set_url else None,
+        'include_base64': not preview_by_url,
+    }
+
+
+def _poster_search_request(item):
+    """Resolve the poster search arguments shared by the JSON and streaming poster endpoints."""
+    poster_set_limit = request.args.get('set_limit', default=DEFAULT_POSTER_SET_LIMIT, type=int)
+    poster_set_limit = max(1, min(poster_set_limit or DEFAULT_POSTER_SET_LIMIT, Config.MAX_POSTERS_PER_ITEM))
+    # preview=url returns proxy URLs the browser loads lazily instead of inline base64 previews.
+    preview_by_url = request.args.get('preview') == 'url'
+    search_kwargs = _poster_search_kwargs(item, poster_set_limit, request.args.get('set_url'), preview_by_url)
+    return search_kwargs['eligible_seasons'], poster_set_limit, preview_by_url, search_kwargs
+
+
+def _poster_search_response(item, search_result, eligible_seasons, poster_set_limit):
+    return {
+        'item': item,
+        'posters': search_result.get('posters', []),
+        'poster_groups': search_result.get('groups', []),
+        'eligible_seasons': eligible_seasons,
+        'poster_set_limit': poster_set_limit,
+        'can_browse_more_sets': item.get('type') == 'Series' and poster_set_limit < Config.MAX_POSTERS_PER_ITEM,
+    }
+
+
+def _find_session_item(item_id):
+    """Return (item, error_response) for `item_id` in the caller's session."""
     session_id = session.get('session_id')
     if not session_id or session_id not in user_sessions:
-        return jsonify({'error': 'Session not found'}), 400
+        return None, (jsonify({'error': 'Session not found'}), 400)
     _touch_session(session_id)
 
     items = user_sessions[session_id]['items']
     item = next((i for i in items if i['id'] == item_id), None)
     if not item:
-        return jsonify({'error': 'Item not found'}), 404
+        return None, (jsonify({'error': 'Item not found'}), 404)
+    return item, None
+
+
+@app.route('/item/<item_id>/posters')
+def get_item_posters(item_id):
+    """Get posters for a specific item"""
+    if not selenium_ready_event.wait(timeout=30):
+        logging.error("Selenium not ready in time for /item/<item_id>/posters")
+        return jsonify({'error': 'Backend service (Selenium) is not ready. Please try again in a moment.'}), 503
+
+    item, error_response = _find_session_item(item_id)
+    if error_response:
+        return error_response
 
     try:
         logging.info(f"Searching posters for: {item['title']}")
-        eligible_seasons = get_jellyfin_seasons(item['id']) if item.get('type') == 'Series' else []
-        poster_set_limit = request.args.get('set_limit', default=3, type=int)
-        poster_set_limit = max(1, min(poster_set_limit or 3, Config.MAX_POSTERS_PER_ITEM))
-        requested_set_url = request.args.get('set_url')
-        search_result = search_tpdb_for_poster_groups(
-            item['title'],
-            item_year=item.get('year'),
-            item_type=item.get('type'),
-            tmdb_id=item.get('ProviderIds', {}).get('Tmdb'),
-            eligible_seasons=eligible_seasons,
-            max_posters=poster_set_limit if item.get('type') == 'Series' else Config.MAX_POSTERS_PER_ITEM,
-            requested_set_urls=[requested_set_url] if requested_set_url else None,
-        )
-        return jsonify({
-            'item': item,
-            'posters': search_result.get('posters', []),
-            'poster_groups': search_result.get('groups', []),
-            'eligible_seasons': eligible_seasons,
-            'poster_set_limit': poster_set_limit,
-            'can_browse_more_sets': item.get('type') == 'Series' and poster_set_limit < Config.MAX_POSTERS_PER_ITEM,
-        })
+        eligible_seasons, poster_set_limit, preview_by_url, search_kwargs = _poster_search_request(item)
+        search_result = search_tpdb_for_poster_groups(item['title'], **search_kwargs)
+        if preview_by_url:
+            _attach_preview_urls(search_result)
+        return jsonify(_poster_search_response(item, search_result, eligible_seasons, poster_set_limit))
     except TPDBRateLimited as e:
         logging.warning(f"TPDB challenge/rate-limit for {item_id}: {e}")
         return jsonify({'error': str(e), 'error_type': 'tpdb_rate_limited'}), 429
@@ -772,6 +938,89 @@ def get_item_posters(item_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/item/<item_id>/posters/stream')
+def stream_item_posters(item_id):
+    """
+    Stream a poster search as NDJSON: one event per line while the search runs
+    ('query', 'phase', 'candidate', 'poster', 'group'), then a final 'result' or 'error'.
+    Every event carries `elapsed_ms` since the request started.
+    """
+    if not selenium_ready_event.wait(timeout=30):
+        logging.error("Selenium not ready in time for /item/<item_id>/posters/stream")
+        return jsonify({'error': 'Backend service (Selenium) is not ready. Please try again in a moment.'}), 503
+
+    item, error_response = _find_session_item(item_id)
+    if error_response:
+        return error_response
+
+    logging.info(f"Streaming poster search for: {item['title']}")
+    eligible_seasons, poster_set_limit, preview_by_url, search_kwargs = _poster_search_request(item)
+    started_at = time.monotonic()
+    events = queue.Queue()
+
+    def publish(event):
+        event['elapsed_ms'] = round((time.monotonic() - started_at) * 1000)
+        events.put(event)
+
+    def run_search():
+        try:
+            search_result = search_tpdb_for_poster_groups(item['title'], progress_callback=publish, **search_kwargs)
+            publish({'event': 'result', 'search_result': search_result})
+        except TPDBRateLimited as e:
+            logging.warning(f"TPDB challenge/rate-limit for {item_id}: {e}")
+            publish({'event': 'error', 'error': str(e), 'error_type': 'tpdb_rate_limited'})
+        except Exception as e:
+            logging.error(f"Error streaming posters for {item_id}: {e}")
+            publish({'event': 'error', 'error': str(e)})
+
+    threading.Thread(target=run_search, name=f"poster-stream-{item_id}", daemon=True).start()
+
+    def generate():
+        while True:
+            event = events.get()
+            if event['event'] == 'poster' and preview_by_url:
+                _attach_preview_urls({'posters': [event['poster']]})
+            elif event['event'] == 'result':
+                search_result = event.pop('search_result')
+                if preview_by_url:
+                    _attach_preview_urls(search_result)
+                event.update(_poster_search_response(item, search_result, eligible_seasons, poster_set_limit))
+            yield json.dumps(event) + "\n"
+            if event['event'] in ('result', 'error'):
+                return
+
+    response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    # Keep reverse proxies from buffering the stream.
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@app.route('/prefetch', methods=['POST'])
+def prefetch_posters():
+    """
+    Queue background poster searches for the items the user is likely to open next.
+    Expects {"item_ids": [...]} in grid order; items without a Jellyfin poster go first.
+    """
+    if TPDB_PREFETCH_COUNT <= 0:
+        return jsonify({'queued': 0, 'enabled': False})
+
+    session_id = session.get('session_id')
+    if not session_id or session_id not in user_sessions:
+        return jsonify({'error': 'Session not found'}), 400
+    _touch_session(session_id)
+
+    data = request.get_json(silent=True) or {}
+    items_by_id = {item['id']: item for item in user_sessions[session_id]['items']}
+    items = [items_by_id[item_id] for item_id in data.get('item_ids', []) if item_id in items_by_id]
+    items = sorted(items, key=lambda item: bool(item.get('thumbnail_url')))[:TPDB_PREFETCH_COUNT]
+    queued = tpdb_prefetch_queue.replace([
+        (item['id'], item['title'], lambda item=item: _poster_search_kwargs(item))
+        for item in items
+    ])
+    return jsonify({'queued': queued, 'enabled': True})
+
+
 @app.route('/item/<item_id>/season-count')
 def get_item_season_count(item_id):
     session_id = session.get('session_id')
@@ -824,6 +1073,8 @@ def select_poster(item_id):
 
     user_sessions[session_id]['selections'][item_id] = selection or poster_url
     logging.debug(f"Poster selected for item {item_id}")
+    # Pull the full-size images into the image cache now so the upload does not wait on TPDB.
+    warm_tpdb_images(_selection_poster_urls(selection or poster_url))
 
     return jsonify({'success': True})
 
@@ -865,7 +1116,7 @@ def upload_poster(item_id):
 
 @app.route('/upload-all', methods=['POST'])
 def upload_all_selected():
-    """Upload all selected posters for current session."""
+    """Start a background job uploading all selected posters for the current session; poll /jobs/<job_id>."""
     if not selenium_ready_event.wait(timeout=30):
         logging.error("Selenium not ready in time for /upload-all")
         return jsonify({'error': 'Backend service (Selenium) is not ready. Please try again in a moment.'}), 503
@@ -875,43 +1126,64 @@ def upload_all_selected():
         return jsonify({'error': 'Session not found'}), 400
     _touch_session(session_id)
 
-    selections = user_sessions[session_id]['selections']
-    items = user_sessions[session_id]['items']
-    results = []
+    selections = dict(user_sessions[session_id]['selections'])
+    items_by_id = {item['id']: item for item in user_sessions[session_id]['items']}
 
     logging.info(f"Starting batch upload of {len(selections)} items")
-    os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-    _sweep_stale_temp_posters()
+    job_id = _start_item_job(
+        'upload-all',
+        'Uploading selected posters',
+        list(selections.items()),
+        lambda entry: _upload_selected_item(entry[0], items_by_id.get(entry[0]), entry[1]),
+        UPLOAD_ALL_WORKERS,
+    )
+    return jsonify({'success': True, 'job_id': job_id, 'total_items': len(selections)}), 202
 
-    for item_id, selection in selections.items():
-        item = None
-        try:
-            item = next((i for i in items if i['id'] == item_id), None)
-            if not item:
-                _log_failed_item(error='Item not found', operation='batch-upload', item_id=item_id)
-                results.append({'item_id': item_id, 'success': False, 'error': 'Item not found'})
-                continue
 
-            upload_result = _upload_selection_to_jellyfin(item, selection, operation='batch-upload')
-            results.append({
-                'item_id': item_id,
-                'item_title': item['title'],
-                'success': upload_result['success'],
-                'error': upload_result.get('error'),
-                'poster_url': upload_result.get('poster_url'),
-                'season_results': upload_result.get('season_results', []),
-            })
+def _upload_selected_item(item_id, item, selection):
+    """Upload one session selection for /upload-all and return its result entry."""
+    try:
+        if not item:
+            _log_failed_item(error='Item not found', operation='batch-upload', item_id=item_id)
+            return {'item_id': item_id, 'success': False, 'error': 'Item not found'}
 
-        except Exception as e:
-            _log_failed_item(item, e, operation='batch-upload', item_id=item_id)
-            results.append({
-                'item_id': item_id,
-                'item_title': item.get('title', 'Unknown') if item else 'Unknown',
-                'success': False,
-                'error': str(e)
-            })
+        upload_result = _upload_selection_to_jellyfin(item, selection, operation='batch-upload')
+        return {
+            'item_id': item_id,
+            'item_title': item['title'],
+            'success': upload_result['success'],
+            'error': upload_result.get('error'),
+            'poster_url': upload_result.get('poster_url'),
+            'season_results': upload_result.get('season_results', []),
+        }
+
+    except Exception as e:
+        _log_failed_item(item, e, operation='batch-upload', item_id=item_id)
+        return {
+            'item_id': item_id,
+            'item_title': item.get('title', 'Unknown') if item else 'Unknown',
+            'success': False,
+            'error': str(e)
+        }
+
+IMAGE_PROXY_MAX_AGE_SEC = 86400
+
+
+def _image_proxy_headers(response, etag=None):
+    if etag:
+        response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = IMAGE_PROXY_MAX_AGE_SEC
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    return response
+
+
+def _jellyfin_image_etag(image_url):
+    """Stable validator for Jellyfin image URLs that carry the image `tag` (it changes with the image)."""
+    if not parse_qs(urlsplit(image_url).query).get('tag'):
+        return None
+    return hashlib.md5(image_url.encode('utf-8')).hexdigest()
 
-    return jsonify({'results': results})
 
 @app.route('/jellyfin-image')
 def get_jellyfin_image():
@@ -920,25 +1192,44 @@ def get_jellyfin_image():
     if not image_url:
         return create_placeholder_thumbnail(), 200
 
+    image_etag = _jellyfin_image_etag(image_url)
+    if image_etag and request.if_none_match.contains(image_etag):
+        return _image_proxy_headers(Response(status=304), image_etag)
+
     try:
         headers = {
             "X-Emby-Token": Config.JELLYFIN_API_KEY,
             "User-Agent": "Jellyfin-Poster-Manager/1.0",
             "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
         }
-        response = requests.get(image_url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        return Response(
-            response.content,
-            mimetype=response.headers.get('content-type', 'image/jpeg'),
-            headers={
-                'Cache-Control': 'public, max-age=86400',
-                'Access-Control-Allow-Origin': '*',
-                'Content-Length': str(len(response.content)),
-                'ETag': f'"{hash(image_url)}"'
-            }
+        if not image_etag and request.headers.get('If-None-Match'):
+            headers['If-None-Match'] = request.headers['If-None-Match']
+        upstream = requests.get(image_url, headers=headers, timeout=10, stream=True)
+        if upstream.status_code == 304:
+            upstream.close()
+            response = _image_proxy_headers(Response(status=304))
+            response.headers['ETag'] = upstream.headers.get('ETag', request.headers['If-None-Match'])
+            return response
+        upstream.raise_for_status()
+
+        def stream_upstream():
+            try:
+                for chunk in upstream.iter_content(64 * 1024):
+                    if chunk:
+                        yield chunk
+            finally:
+                upstream.close()
+
+        response = Response(
+            stream_with_context(stream_upstream()),
+            mimetype=upstream.headers.get('content-type', 'image/jpeg'),
         )
+        if upstream.headers.get('Content-Length'):
+            response.headers['Content-Length'] = upstream.headers['Content-Length']
+        _image_proxy_headers(response, image_etag)
+        if not image_etag and upstream.headers.get('ETag'):
+            response.headers['ETag'] = upstream.headers['ETag']
+        return response
 
     except Exception as e:
         logging.warning(f"Error fetching Jellyfin image {image_url}: {e}")
@@ -946,37 +1237,166 @@ def get_jellyfin_image():
 
 @app.route('/thumbnail')
 def get_thumbnail():
-    """Serve TPDB thumbnails with proper headers and caching"""
+    """Serve TPDB thumbnails with proper headers and caching; `w` and `format` request a resized variant."""
     thumbnail_url = request.args.get('url')
     if not thumbnail_url or thumbnail_url == 'None':
         return create_placeholder_thumbnail(), 200
 
     try:
-        with requests.Session() as session_obj:
-            session_obj.cookies.update(get_selenium_cookies_as_dict())
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Referer": "https://theposterdb.com/",
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = session_obj.get(thumbnail_url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-        return Response(
-            response.content,
-            mimetype=response.headers.get('content-type', 'image/jpeg'),
-            headers={
-                'Cache-Control': 'public, max-age=86400',
-                'Access-Control-Allow-Origin': '*',
-                'Content-Length': str(len(response.content)),
-                'ETag': f'"{hash(thumbnail_url)}"'
-            }
+        # The content hash is the validator, so a browser revalidation never touches TPDB.
+        entry = get_tpdb_thumbnail_file(
+            thumbnail_url,
+            width=request.args.get('w', type=int),
+            image_format=request.args.get('format'),
+            timeout=10,
         )
+        if entry:
+            response = send_file(
+                entry['path'],
+                mimetype=entry['content_type'],
+                etag=False,
+                conditional=False,
+                max_age=IMAGE_PROXY_MAX_AGE_SEC,
+            )
+            _image_proxy_headers(response, entry['content_hash'])
+            return response.make_conditional(request)
+
+        image = fetch_tpdb_image(thumbnail_url, timeout=10)
+        response = _image_proxy_headers(Response(image['data'], mimetype=image['content_type']), image['content_hash'])
+        return response.make_conditional(request)
 
     except Exception as e:
         logging.warning(f"Error fetching TPDB thumbnail {thumbnail_url}: {e}")
         return create_placeholder_thumbnail(), 200
 
+def _update_idle_warmup(**updates):
+    with idle_warmup_lock:
+        idle_warmup_state.update(updates)
+
+
+def _idle_warmup_snapshot():
+    with idle_warmup_lock:
+        return dict(idle_warmup_state)
+
+
+def _idle_warmup_blocker():
+    """Return why the warm-up should wait right now, or None when the app is idle."""
+    with idle_warmup_lock:
+        if idle_warmup_state['paused']:
+            return 'paused'
+    now_ts = time.time()
+    if any(now_ts - session_data.get('last_seen', 0) < IDLE_WARMUP_IDLE_AFTER_SEC for session_data in list(user_sessions.values())):
+        return 'waiting_for_idle'
+    with auto_batch_jobs_lock:
+        if any(not job.get('done') for job in auto_batch_jobs.values()):
+            return 'waiting_for_idle'
+    return None
+
+
+def _wait_until_idle():
+    while True:
+        blocker = _idle_warmup_blocker()
+        if not blocker:
+            return
+        _update_idle_warmup(status=blocker)
+        time.sleep(IDLE_WARMUP_CHECK_SEC)
+
+
+def _warm_item_search(item):
+    """Cache the poster search, preview images and modal thumbnails for one item, at background priority."""
+    search_result = search_tpdb_for_poster_groups(item['title'], background=True, **_poster_search_kwargs(item))
+    for group in search_result.get('groups', []):
+        for poster in group.get('show_posters', []) + group.get('season_posters', []):
+            preview_url = poster.get('preview_source_url') or poster.get('url')
+            try:
+                fetch_tpdb_image(preview_url, timeout=15, background=True)
+                # Already downloaded, so this only renders the variant the poster modal asks for.
+                get_tpdb_thumbnail_file(preview_url, width=TPDB_PREVIEW_THUMBNAIL_WIDTH, image_format='webp')
+            except Exception as e:
+                logging.debug(f"Idle warm-up could not cache preview {preview_url}: {e}")
+
+
+def _run_idle_warmup():
+    """
+    Background loop that, while nobody is using the app and no batch job runs, works through
+    items without a Jellyfin poster and warms the TPDB page, search and image caches.
+    Nothing is uploaded; a new pass starts every IDLE_WARMUP_RESCAN_SEC.
+    """
+    # Searches need the restored TPDB session; without it every page would defer to a browser.
+    selenium_ready_event.wait()
+    while True:
+        _wait_until_idle()
+        try:
+            target_items = _select_auto_batch_target_items(get_jellyfin_items(), 'no-poster')
+        except Exception as e:
+            logging.warning(f"Idle warm-up could not load Jellyfin items: {e}")
+            _update_idle_warmup(status='error')
+            time.sleep(IDLE_WARMUP_CHECK_SEC * 4)
+            continue
+
+        logging.info("Idle warm-up: caching TPDB results for %d item(s) without posters.", len(target_items))
+        _update_idle_warmup(
+            status='running',
+            total_items=len(target_items),
+            processed=0,
+            warmed=0,
+            deferred=0,
+            failed=0,
+            pass_started_at=datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        )
+        for index, item in enumerate(target_items):
+            _wait_until_idle()
+            _update_idle_warmup(status='running', current_item=item.get('title'))
+            outcome = 'warmed'
+            try:
+                _warm_item_search(item)
+            except TPDBPrefetchDeferred as e:
+                logging.debug(f"Idle warm-up skipped {item.get('title')}: {e}")
+                outcome = 'deferred'
+            except Exception as e:
+                logging.warning(f"Idle warm-up failed for {item.get('title')}: {e}")
+                outcome = 'failed'
+            with idle_warmup_lock:
+                idle_warmup_state['processed'] = index + 1
+                idle_warmup_state[outcome] += 1
+            time.sleep(IDLE_WARMUP_ITEM_DELAY_SEC)
+
+        _update_idle_warmup(
+            status='done',
+            current_item=None,
+            pass_finished_at=datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        )
+        time.sleep(IDLE_WARMUP_RESCAN_SEC)
+
+
+@app.route('/warmup/pause', methods=['POST'])
+def pause_idle_warmup():
+    _update_idle_warmup(paused=True)
+    return jsonify({'success': True, 'idle_warmup': _idle_warmup_snapshot()})
+
+
+@app.route('/warmup/resume', methods=['POST'])
+def resume_idle_warmup():
+    _update_idle_warmup(paused=False)
+    return jsonify({'success': True, 'idle_warmup': _idle_warmup_snapshot()})
+
+
+def _tpdb_health_stats():
+    return {
+        'selenium_active': selenium_pool.has_drivers(),
+        'tpdb_session_active': bool(get_selenium_cookies_as_dict()),
+        'selenium_pool': get_selenium_pool_stats(),
+        'tpdb_fetch': get_tpdb_fetch_stats(),
+        'tpdb_image_cache': get_tpdb_image_cache_stats(),
+        'tpdb_page_cache': get_tpdb_page_cache_stats(),
+        'tpdb_prefetch': get_tpdb_prefetch_stats(),
+        'tpdb_rate': get_tpdb_rate_stats(),
+        'tpdb_search_result_cache': get_tpdb_search_result_cache_stats(),
+        'jellyfin_upload_ledger': get_jellyfin_upload_ledger_stats(),
+        'idle_warmup': _idle_warmup_snapshot(),
+    }
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
@@ -990,7 +1410,7 @@ def health_check():
             'jellyfin_status': jellyfin_status,
             'server_name': server_info['name'],
             'server_version': server_info.get('version', 'Unknown'),
-            'selenium_active': selenium_driver is not None,
+            **_tpdb_health_stats(),
             'active_sessions': len(user_sessions)
         })
     except Exception as e:
@@ -998,7 +1418,7 @@ def health_check():
             'status': 'unhealthy',
             'timestamp': datetime.now().isoformat(),
             'error': str(e),
-            'selenium_active': selenium_driver is not None,
+            **_tpdb_health_stats(),
             'active_sessions': len(user_sessions)
         }), 500
 
@@ -1081,16 +1501,14 @@ def _select_auto_batch_target_items(all_items, target_filter, skip_processed=Fal
     return target_items
 
 
-def _auto_search_and_upload_item(item, include_season_posters=False, replace_existing_season_posters=False):
-    item_id = item.get('id')
-    item_title = item.get('title', 'Unknown')
+def _auto_search_item(item, include_season_posters=False, replace_existing_season_posters=False):
+    """Search stage of the auto-poster flow: return the selection to upload or raise ValueError."""
     item_type = item.get('type')
-    old_poster_url = item.get('thumbnail_url')
 
     if include_season_posters and item_type == 'Series':
-        eligible_seasons = get_jellyfin_seasons(item_id)
+        eligible_seasons = get_jellyfin_seasons(item.get('id'))
         search_result = search_tpdb_for_poster_groups(
-            item_title,
+            item.get('title', 'Unknown'),
             item_year=item.get('year'),
             item_type=item_type,
             tmdb_id=item.get('ProviderIds', {}).get('Tmdb'),
@@ -1108,21 +1526,10 @@ def _auto_search_and_upload_item(item, include_season_posters=False, replace_exi
         )
         if not selection.get('series_poster_url') and not selection.get('season_posters'):
             raise ValueError('No eligible posters found')
-
-        upload_result = _upload_selection_to_jellyfin(item, selection, operation='auto-poster')
-        return {
-            'item_id': item_id,
-            'item_title': item_title,
-            'success': upload_result['success'],
-            'error': upload_result.get('error'),
-            'old_poster_url': old_poster_url,
-            'poster_url': upload_result.get('poster_url'),
-            'season_results': upload_result.get('season_results', []),
-            'season_posters_uploaded': len([season for season in upload_result.get('season_results', []) if season.get('success')]),
-        }
+        return selection
 
     posters = search_tpdb_for_posters_multiple(
-        item_title,
+        item.get('title', 'Unknown'),
         item.get('year'),
         item_type,
         tmdb_id=item.get('ProviderIds', {}).get('Tmdb'),
@@ -1130,21 +1537,212 @@ def _auto_search_and_upload_item(item, include_season_posters=False, replace_exi
     )
     if not posters:
         raise ValueError('No posters found')
+    return posters[0]['url']
 
-    poster_url = posters[0]['url']
-    result = _upload_selection_to_jellyfin(item, poster_url, operation='auto-poster')
+
+def _auto_upload_item(item, selection):
+    """Upload stage of the auto-poster flow: apply a selection from `_auto_search_item`."""
+    upload_result = _upload_selection_to_jellyfin(item, selection, operation='auto-poster')
+    season_results = upload_result.get('season_results', [])
     return {
-        'item_id': item_id,
-        'item_title': item_title,
-        'success': result['success'],
-        'error': result.get('error'),
-        'old_poster_url': old_poster_url,
-        'poster_url': poster_url,
-        'season_results': [],
-        'season_posters_uploaded': 0,
+        'item_id': item.get('id'),
+        'item_title': item.get('title', 'Unknown'),
+        'success': upload_result['success'],
+        'error': upload_result.get('error'),
+        'old_poster_url': item.get('thumbnail_url'),
+        'poster_url': upload_result.get('poster_url') or (selection if isinstance(selection, str) else None),
+        'season_results': season_results,
+        'season_posters_uploaded': len([season for season in season_results if season.get('success')]),
     }
 
 
+def _auto_search_and_upload_item(item, include_season_posters=False, replace_existing_season_posters=False):
+    selection = _auto_search_item(
+        item,
+        include_season_posters=include_season_posters,
+        replace_existing_season_posters=replace_existing_season_posters,
+    )
+    return _auto_upload_item(item, selection)
+
+
+def _auto_batch_failure(item, error):
+    return {
+        'item_id': item.get('id', 'Unknown'),
+        'item_title': item.get('title', 'Unknown'),
+        'success': False,
+        'error': error,
+        'old_poster_url': item.get('thumbnail_url'),
+        'poster_url': None
+    }
+
+
+def _run_auto_batch_pipeline(job_id, target_items, include_season_posters=False, replace_existing_season_posters=False):
+    """
+    Search and upload `target_items` as two overlapping stages. Search workers, paced by the
+    TPDB scheduler, feed a bounded queue drained by upload workers, so Jellyfin uploads for
+    earlier items run while later items are still being searched. Per-stage queue depth and
+    throughput are published on the job as `stages`. A TPDB rate limit stops new searches,
+    but items already searched are still uploaded; after a cancel they are recorded as cancelled.
+
+    Returns (results in target order, TPDB rate-limit error or None).
+    """
+    total_items = len(target_items)
+    started = time.monotonic()
+    pending = queue.Queue()
+    for index, item in enumerate(target_items):
+        pending.put((index, item))
+    upload_queue = queue.Queue(maxsize=AUTO_BATCH_UPLOAD_QUEUE_SIZE)
+    stop_event = threading.Event()
+    results = [None] * total_items
+    counts = {'processed': 0, 'successful': 0, 'failed': 0}
+    stages = {'search': {'active': 0, 'completed': 0}, 'upload': {'active': 0, 'completed': 0}}
+    state_lock = threading.Lock()
+    rate_limited = []
+
+    def stage_stats():
+        elapsed_min = max(time.monotonic() - started, 0.001) / 60
+        return {
+            name: {
+                'active': counters['active'],
+                'queued': (pending if name == 'search' else upload_queue).qsize(),
+                'completed': counters['completed'],
+                'per_minute': round(counters['completed'] / elapsed_min, 1),
+            }
+            for name, counters in stages.items()
+        }
+
+    def publish(updates):
+        # Keep the "Cancelling..." message and phase once a cancel is requested.
+        if _is_auto_batch_cancelled(job_id):
+            updates.pop('message', None)
+            updates.pop('phase', None)
+        _update_auto_batch_job(job_id, stages=stage_stats(), **updates)
+
+    def stage_started(name, **updates):
+        with state_lock:
+            stages[name]['active'] += 1
+            publish(updates)
+
+    def record_result(index, result, updates):
+        # Caller must hold state_lock.
+        results[index] = result
+        counts['processed'] += 1
+        counts['successful' if result.get('success') else 'failed'] += 1
+        updates['results'] = [entry for entry in results if entry is not None]
+        updates.update(counts)
+
+    def stage_finished(name, index=None, result=None, **updates):
+        with state_lock:
+            stages[name]['active'] -= 1
+            stages[name]['completed'] += 1
+            if result is not None:
+                record_result(index, result, updates)
+            publish(updates)
+
+    def upload_skipped(index, result):
+        with state_lock:
+            updates = {}
+            record_result(index, result, updates)
+            publish(updates)
+
+    def stopping():
+        return stop_event.is_set() or _is_auto_batch_cancelled(job_id)
+
+    def search_worker():
+        while not stopping():
+            try:
+                index, item = pending.get_nowait()
+            except queue.Empty:
+                return
+            item_title = item.get('title', 'Unknown')
+            stage_started(
+                'search',
+                phase='searching',
+                current_item=item_title,
+                current_item_id=item.get('id', 'Unknown'),
+                current_item_type=item.get('type'),
+                current_item_year=item.get('year'),
+                old_poster_url=item.get('thumbnail_url'),
+                new_poster_url=None,
+                message=f'Searching posters for {item_title}...',
+            )
+            logging.info(f"Searching item {index + 1}/{total_items}: {item_title}")
+            try:
+                selection = _auto_search_item(
+                    item,
+                    include_season_posters=include_season_posters,
+                    replace_existing_season_posters=replace_existing_season_posters,
+                )
+            except ValueError as e:
+                _log_failed_item(item, str(e), operation='auto-poster')
+                stage_finished('search', index, _auto_batch_failure(item, str(e)), phase='failed', message=f'{e} for {item_title}.')
+                continue
+            except TPDBRateLimited as e:
+                logging.warning(f"TPDB rate-limit detected during batch job; aborting early: {e}")
+                error = f'Aborted due to TPDB rate limit: {e}'
+                _log_failed_item(item, error, operation='auto-poster')
+                rate_limited.append(error)
+                stop_event.set()
+                stage_finished('search', index, _auto_batch_failure(item, error), phase='rate_limited', message='Batch aborted due to TPDB rate limit.')
+                return
+            except Exception as e:
+                logging.error(f"Error processing item {item_title}: {e}")
+                _log_failed_item(item, e, operation='auto-poster')
+                stage_finished('search', index, _auto_batch_failure(item, str(e)), phase='failed', message=f'Failed processing {item_title}.')
+                continue
+            stage_finished('search')
+            # Blocks while the upload stage is behind, so searches never run far ahead of uploads.
+            upload_queue.put((index, item, selection))
+
+    def upload_worker():
+        while True:
+            entry = upload_queue.get()
+            if entry is None:
+                return
+            index, item, selection = entry
+            item_title = item.get('title', 'Unknown')
+            if _is_auto_batch_cancelled(job_id):
+                # Already searched, so it still gets a result; uploads queued after a rate limit run normally.
+                upload_skipped(index, _auto_batch_failure(item, 'Cancelled by user'))
+                continue
+            stage_started('upload', phase='applying', message=f'Applying poster to {item_title}...')
+            try:
+                result = _auto_upload_item(item, selection)
+            except Exception as e:
+                logging.error(f"Error processing item {item_title}: {e}")
+                _log_failed_item(item, e, operation='auto-poster')
+                result = _auto_batch_failure(item, str(e))
+
+            if result.get('success'):
+                season_count = result.get('season_posters_uploaded', 0)
+                message = f'Applied poster to {item_title}.'
+                if season_count:
+                    message = f'Applied poster and {season_count} season poster(s) to {item_title}.'
+                logging.info(f"Successfully uploaded poster for: {item_title}")
+                stage_finished('upload', index, result, phase='applied', new_poster_url=result.get('poster_url'), message=message)
+            else:
+                stage_finished('upload', index, result, phase='failed', message=f'Failed to apply poster to {item_title}.')
+
+    search_threads = [
+        threading.Thread(target=search_worker, name=f"auto-batch-search-{n}", daemon=True)
+        for n in range(AUTO_BATCH_SEARCH_WORKERS)
+    ]
+    upload_threads = [
+        threading.Thread(target=upload_worker, name=f"auto-batch-upload-{n}", daemon=True)
+        for n in range(AUTO_BATCH_UPLOAD_WORKERS)
+    ]
+    for thread in search_threads + upload_threads:
+        thread.start()
+    for thread in search_threads:
+        thread.join()
+    for _ in upload_threads:
+        upload_queue.put(None)
+    for thread in upload_threads:
+        thread.join()
+
+    return [entry for entry in results if entry is not None], (rate_limited[0] if rate_limited else None)
+
+
 def _run_auto_batch_job(job_id, target_filter, skip_processed=False, library_id='', include_season_posters=False, replace_existing_season_posters=False):
     results = []
     successful_count = 0
@@ -1153,8 +1751,7 @@ def _run_auto_batch_job(job_id, target_filter, skip_processed=False, library_id=
     try:
         _update_auto_batch_job(job_id, status='running', phase='preparing', message='Preparing TPDB login...')
         try:
-            if not selenium_driver:
-                setup_selenium_and_login()
+            setup_selenium_and_login()
             logging.info("Selenium/TPDB login ready for auto-batch job.")
         except Exception as e:
             logging.error(f"Failed to setup Selenium/login to TPDB: {e}")
@@ -1200,153 +1797,34 @@ def _run_auto_batch_job(job_id, target_filter, skip_processed=False, library_id=
             return
 
         logging.info(f"Processing {total_items} items for auto-poster job")
-        os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-        _sweep_stale_temp_posters()
-
-        for i, item in enumerate(target_items):
-            if _is_auto_batch_cancelled(job_id):
-                _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count)
-                return
-
-            item_id = item.get('id', 'Unknown')
-            item_title = item.get('title', 'Unknown')
-            item_year = item.get('year')
-            item_type = item.get('type')
-            old_poster_url = item.get('thumbnail_url')
-            poster_url = None
-
-            try:
-                _update_auto_batch_job(
-                    job_id,
-                    status='running',
-                    phase='searching',
-                    current_item=item_title,
-                    current_item_id=item_id,
-                    current_item_type=item_type,
-                    current_item_year=item_year,
-                    old_poster_url=old_poster_url,
-                    new_poster_url=None,
-                    processed=i,
-                    successful=successful_count,
-                    failed=failed_count,
-                    message=f'Searching posters for {item_title}...',
-                )
-
-                logging.info(f"Processing item {i+1}/{total_items}: {item_title}")
-                result = _auto_search_and_upload_item(
-                    item,
-                    include_season_posters=include_season_posters,
-                    replace_existing_season_posters=replace_existing_season_posters,
-                )
-
-                if _is_auto_batch_cancelled(job_id):
-                    _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count)
-                    return
+        results, rate_limited_error = _run_auto_batch_pipeline(
+            job_id,
+            target_items,
+            include_season_posters=include_season_posters,
+            replace_existing_season_posters=replace_existing_season_posters,
+        )
+        successful_count = len([result for result in results if result.get('success')])
+        failed_count = len(results) - successful_count
 
-                _update_auto_batch_job(
-                    job_id,
-                    phase='applying',
-                    new_poster_url=result.get('poster_url'),
-                    message=f'Applying poster to {item_title}...'
-                )
+        if rate_limited_error:
+            _update_auto_batch_job(
+                job_id,
+                status='failed',
+                phase='rate_limited',
+                processed=len(results),
+                successful=successful_count,
+                failed=failed_count,
+                results=list(results),
+                message='Batch aborted due to TPDB rate limit.',
+                error=rate_limited_error,
+                done=True,
+                success=False,
+            )
+            return
 
-                results.append(result)
-                if result.get('success'):
-                    successful_count += 1
-                    season_count = result.get('season_posters_uploaded', 0)
-                    message = f'Applied poster to {item_title}.'
-                    if season_count:
-                        message = f'Applied poster and {season_count} season poster(s) to {item_title}.'
-                    logging.info(f"Successfully uploaded poster for: {item_title}")
-                    _update_auto_batch_job(
-                        job_id,
-                        phase='applied',
-                        processed=i + 1,
-                        successful=successful_count,
-                        results=list(results),
-                        message=message,
-                    )
-                else:
-                    failed_count += 1
-                    _update_auto_batch_job(
-                        job_id,
-                        phase='failed',
-                        processed=i + 1,
-                        failed=failed_count,
-                        results=list(results),
-                        message=f'Failed to apply poster to {item_title}.',
-                    )
-            except ValueError as e:
-                error_message = str(e)
-                result = {
-                    'item_id': item_id,
-                    'item_title': item_title,
-                    'success': False,
-                    'error': error_message,
-                    'old_poster_url': old_poster_url,
-                    'poster_url': None
-                }
-                _log_failed_item(item, error_message, operation='auto-poster')
-                results.append(result)
-                failed_count += 1
-                _update_auto_batch_job(
-                    job_id,
-                    phase='failed',
-                    processed=i + 1,
-                    failed=failed_count,
-                    results=list(results),
-                    message=f'{error_message} for {item_title}.',
-                )
-            except TPDBRateLimited as e:
-                rate_limited_error = str(e)
-                logging.warning(f"TPDB rate-limit detected during batch job; aborting early: {rate_limited_error}")
-                result = {
-                    'item_id': item_id,
-                    'item_title': item_title,
-                    'success': False,
-                    'error': f'Aborted due to TPDB rate limit: {rate_limited_error}',
-                    'old_poster_url': old_poster_url,
-                    'poster_url': None
-                }
-                _log_failed_item(item, result['error'], operation='auto-poster')
-                results.append(result)
-                failed_count += 1
-                _update_auto_batch_job(
-                    job_id,
-                    status='failed',
-                    phase='rate_limited',
-                    processed=i + 1,
-                    failed=failed_count,
-                    results=list(results),
-                    message='Batch aborted due to TPDB rate limit.',
-                    error=result['error'],
-                    done=True,
-                    success=False,
-                )
-                return
-            except Exception as e:
-                logging.error(f"Error processing item {item_title}: {e}")
-                result = {
-                    'item_id': item_id,
-                    'item_title': item_title,
-                    'success': False,
-                    'error': str(e),
-                    'old_poster_url': old_poster_url,
-                    'poster_url': None
-                }
-                _log_failed_item(item, e, operation='auto-poster')
-                results.append(result)
-                failed_count += 1
-                _update_auto_batch_job(
-                    job_id,
-                    phase='failed',
-                    processed=i + 1,
-                    failed=failed_count,
-                    results=list(results),
-                    message=f'Failed processing {item_title}.',
-                )
-            finally:
-                time.sleep(BATCH_DELAY_SEC)
+        if _is_auto_batch_cancelled(job_id):
+            _finish_auto_batch_cancelled(job_id, results, successful_count, failed_count)
+            return
 
         _update_auto_batch_job(
             job_id,
@@ -1432,8 +1910,7 @@ def batch_auto_poster():
 
         # Ensure Selenium ready (do not teardown per request)
         try:
-            if not selenium_driver:
-                setup_selenium_and_login()
+            setup_selenium_and_login()
             logging.info("Selenium/TPDB login ready for auto-batch.")
         except Exception as e:
             logging.error(f"Failed to setup Selenium/login to TPDB: {e}")
@@ -1483,8 +1960,6 @@ def batch_auto_poster():
         failed_count = 0
         rate_limited_error = None
 
-        os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-        _sweep_stale_temp_posters()
 
         for i, item in enumerate(target_items):
             try:
@@ -1518,17 +1993,9 @@ def batch_auto_poster():
                 first_poster = posters[0]
                 poster_url = first_poster['url']
 
-                safe_title = "".join(c for c in item_title if c.isalnum() or c in " _-").rstrip()
-                save_path = os.path.join(Config.TEMP_POSTER_DIR, f"auto_{safe_title}_{item_id}.jpg")
-
-                if download_image_with_cookies(poster_url, save_path):
-                    upload_success = upload_image_to_jellyfin_improved(item_id, save_path)
-
-                    try:
-                        if os.path.exists(save_path):
-                            os.remove(save_path)
-                    except Exception as cleanup_error:
-                        logging.warning(f"Failed to cleanup temp file {save_path}: {cleanup_error}")
+                image = download_tpdb_image_for_upload(poster_url)
+                if image:
+                    upload_success = upload_image_source_to_jellyfin(item_id, image)
 
                     if upload_success:
                         _log_processed_item(item, operation='auto-poster', poster_url=poster_url)
@@ -1585,8 +2052,6 @@ def batch_auto_poster():
                     'poster_url': None
                 })
                 failed_count += 1
-            finally:
-                time.sleep(BATCH_DELAY_SEC)
 
         if rate_limited_error:
             return jsonify({
@@ -1700,7 +2165,7 @@ def retry_failed_item():
 
 @app.route('/failed-items/retry-all', methods=['POST'])
 def retry_all_failed_items():
-    """Retry auto-fetching and uploading posters for recent failed item IDs."""
+    """Start a background job retrying recent failed item IDs; poll /jobs/<job_id>."""
     if not selenium_ready_event.wait(timeout=30):
         logging.error("Selenium not ready in time for /failed-items/retry-all")
         return jsonify({'success': False, 'error': 'Backend service (Selenium) is not ready. Please try again in a moment.'}), 503
@@ -1718,39 +2183,45 @@ def retry_all_failed_items():
         if item_id and item_id not in item_ids:
             item_ids.append(item_id)
 
-    results = []
-    for item_id in item_ids:
-        try:
-            item = _find_jellyfin_item(item_id)
-            if not item:
-                _log_failed_item(error='Item not found', operation='retry-all-auto-poster', item_id=item_id)
-                results.append({'item_id': item_id, 'success': False, 'error': 'Item not found'})
-                continue
+    job_id = _start_item_job('retry-all', 'Retrying failed items', item_ids, _retry_failed_item, RETRY_ALL_WORKERS)
+    return jsonify({'success': True, 'job_id': job_id, 'total_items': len(item_ids)}), 202
+
+
+def _retry_failed_item(item_id):
+    """Retry one failed item for the retry-all job and return its result entry."""
+    try:
+        item = _find_jellyfin_item(item_id)
+        if not item:
+            _log_failed_item(error='Item not found', operation='retry-all-auto-poster', item_id=item_id)
+            return {'item_id': item_id, 'success': False, 'error': 'Item not found'}
+
+        result = _auto_fetch_and_upload_item(item, operation='retry-all-auto-poster')
+        if result.get('success'):
+            _log_resolved_item(item, operation='retry-all-auto-poster', poster_url=result.get('poster_url'))
+        return result
+    except TPDBRateLimited as e:
+        _log_failed_item(error=e, operation='retry-all-auto-poster', item_id=item_id)
+        return {'item_id': item_id, 'success': False, 'error': str(e), 'error_type': 'tpdb_rate_limited'}
+    except Exception as e:
+        logging.error(f"Error retrying failed item {item_id}: {e}")
+        _log_failed_item(error=e, operation='retry-all-auto-poster', item_id=item_id)
+        return {'item_id': item_id, 'success': False, 'error': str(e)}
 
-            result = _auto_fetch_and_upload_item(item, operation='retry-all-auto-poster')
-            if result.get('success'):
-                _log_resolved_item(item, operation='retry-all-auto-poster', poster_url=result.get('poster_url'))
-            results.append(result)
-        except TPDBRateLimited as e:
-            _log_failed_item(error=e, operation='retry-all-auto-poster', item_id=item_id)
-            results.append({'item_id': item_id, 'success': False, 'error': str(e)})
-            break
-        except Exception as e:
-            logging.error(f"Error retrying failed item {item_id}: {e}")
-            _log_failed_item(error=e, operation='retry-all-auto-poster', item_id=item_id)
-            results.append({'item_id': item_id, 'success': False, 'error': str(e)})
-        finally:
-            time.sleep(BATCH_DELAY_SEC)
-
-    successful_count = len([result for result in results if result.get('success')])
-    failed_count = len(results) - successful_count
-    return jsonify({
-        'success': failed_count == 0,
-        'results': results,
-        'processed': len(results),
-        'successful': successful_count,
-        'failed': failed_count,
-    })
+
+@app.route('/jobs/<job_id>')
+def job_progress(job_id):
+    job = _get_auto_batch_job(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    job = _cancel_auto_batch_job(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
 
 
 @app.route('/jellyfin-items')
@@ -1802,17 +2273,9 @@ def upload_poster_direct():
         if not item:
             return jsonify({'success': False, 'error': 'Item not found'}), 404
 
-        os.makedirs(Config.TEMP_POSTER_DIR, exist_ok=True)
-        _sweep_stale_temp_posters()
-        save_path = os.path.join(Config.TEMP_POSTER_DIR, f"manual_{item_id}.jpg")
-
-        if download_image_with_cookies(poster_url, save_path):
-            upload_success = upload_image_to_jellyfin_improved(item_id, save_path)
-            try:
-                if os.path.exists(save_path):
-                    os.remove(save_path)
-            except Exception as cleanup_error:
-                logging.warning(f"Failed to cleanup temp file {save_path}: {cleanup_error}")
+        image = download_tpdb_image_for_upload(poster_url)
+        if image:
+            upload_success = upload_image_source_to_jellyfin(item_id, image)
 
             if upload_success:
                 _log_processed_item(item, operation='direct-upload', poster_url=poster_url)
@@ -1845,6 +2308,8 @@ def create_placeholder_thumbnail():
 
 def background_setup():
     try:
+        # Uploads stream from the image cache now; clear posters older versions left behind.
+        _sweep_stale_temp_posters(max_age_sec=0)
         setup_selenium_and_login()
 
         try:
@@ -1867,6 +2332,8 @@ if __name__ == '__main__':
 
     setup_thread = threading.Thread(target=background_setup, daemon=True)
     setup_thread.start()
+    if IDLE_WARMUP_ENABLED:
+        threading.Thread(target=_run_idle_warmup, name="idle-warmup", daemon=True).start()
 
     try:
         app.run(debug=Config.DEBUG, host=host, port=port)
@@ -0,0 +1,184 @@
+"""
+Micro-benchmark for TPDB page parsing.
+
+Compares the original full-document `html.parser` parse with per-link card lookups
+against `_parse_tpdb_html` + `_index_tpdb_cards` on a synthetic set page. Run from the repository root (needs a config.py):
+
+    python benchmarks/tpdb_parsing.py [--cards 400] [--repeat 5]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import poster_scraper  # noqa: E402
+from poster_scraper import (  # noqa: E402
+    ITEM_POSTER_SELECTOR,
+    SEARCH_RESULT_SELECTOR,
+    _index_tpdb_cards,
+    _parse_tpdb_html,
+    _tpdb_absolute_url,
+)
+
+
+def _poster_card(poster_id, season_number):
+    return (
+        '<div class="col-6 col-lg-2 col-md-4 mb-4"><div class="hovereffect rounded">'
+        f'<picture><source srcset="https://images.theposterdb.com/prod/public/images/posters/optimized/{poster_id}.webp 1x">'
+        f'<img class="tpdb-poster" src="https://images.theposterdb.com/prod/public/images/posters/optimized/{poster_id}.webp" alt="poster"></picture>'
+        f'<div class="overlay" data-poster-id="{poster_id}" data-poster-type="Season">'
+        f'<a class="bg-transparent border-0 text-white" href="/api/assets/{poster_id}"><i class="fas fa-download"></i></a></div>'
+        '</div><div class="d-flex flex-column">'
+        f'<p class="text-break mb-0">Benchmark Show (2020) - Season {season_number}</p>'
+        '<a href="/set/12345">24 Posters</a>'
+        '<span class="uploaded-by">by <a href="/user/uploader">uploader</a></span>'
+        '</div></div>'
+    )
+
+
+def build_set_page(card_count):
+    scripts = "".join(
+        f"<script>window.__chunk{index} = {{payload: '{'x' * 2000}'}};</script>"
+        for index in range(40)
+    )
+    cards = "".join(_poster_card(1000 + index, index % 12 + 1) for index in range(card_count))
+    return (
+        "<!DOCTYPE html><html><head><title>Set | ThePosterDB</title>"
+        f"<style>{'.c{color:red}' * 2000}</style>{scripts}</head>"
+        f'<body><nav>{"<a href=/nav>nav</a>" * 200}</nav><div class="row">{cards}</div></body></html>'
+    )
+
+
+def build_search_page(result_count):
+    results = "".join(
+        '<a class="btn btn-dark-lighter flex-grow-1 text-truncate py-2 text-left position-relative" '
+        f'href="/posters/show/{index}"><span class="text-truncate">Result {index} (2020)</span></a>'
+        for index in range(result_count)
+    )
+    return f"<html><head><title>Search</title>{'<script>var a=1;</script>' * 200}</head><body>{results}</body></html>"
+
+
+def _legacy_season_key(link):
+    # Per-link text walk over three ancestor levels, as done before the card index.
+    parts = [link.get_text(" ", strip=True), link.get("title", ""), link.get("aria-label", ""), link.get("href", "")]
+    current = link.parent
+    for _ in range(3):
+        if not current:
+            break
+        parts.extend([current.get_text(" ", strip=True), current.get("title", ""), current.get("aria-label", "")])
+        current = current.parent
+    for image in link.find_all("img"):
+        parts.extend([image.get("alt", ""), image.get("title", ""), image.get("src", ""), image.get("data-src", "")])
+    text = re.sub(r"\s+", " ", " ".join(part for part in parts if part)).strip().lower()
+    if re.search(r"\b(specials?|season\s+0|s00)\b", text):
+        return "specials"
+    for pattern in (r"\bseason[\s._-]*(\d{1,2})\b", r"\bs[\s._-]*(\d{1,2})\b"):
+        match = re.search(pattern, text)
+        if match:
+            return "specials" if int(match.group(1)) == 0 else str(int(match.group(1)))
+    return None
+
+
+def _legacy_card_metadata(link):
+    # Six-level parent walk plus four CSS lookups per link, as done before the card index.
+    card = link.parent
+    current = link
+    for _ in range(6):
+        if not current:
+            break
+        if "hovereffect" in (current.get("class") or []) or current.select_one("div.overlay[data-poster-id]"):
+            card = current
+            break
+        current = current.parent
+    set_link = card.select_one('a[href*="/set/"]')
+    uploader_link = card.select_one(".uploaded-by a")
+    overlay = card.select_one(".overlay[data-poster-id]")
+    preview_source = card.select_one("source[srcset], img.tpdb-poster[src]")
+    set_url = _tpdb_absolute_url(set_link.get("href")) if set_link else None
+    preview_href = preview_source.get("srcset") or preview_source.get("src") if preview_source else None
+    if preview_href:
+        preview_href = preview_href.split(",")[0].strip().split(" ")[0]
+    set_match = re.search(r"/set/(\d+)", set_url) if set_url else None
+    return {
+        "set_id": set_match.group(1) if set_match else None,
+        "set_url": set_url,
+        "set_poster_count": set_link.get_text(strip=True) if set_link else None,
+        "uploader": uploader_link.get_text(strip=True) if uploader_link else "Unknown",
+        "tpdb_poster_id": overlay.get("data-poster-id") if overlay else None,
+        "tpdb_poster_type": overlay.get("data-poster-type") if overlay else None,
+        "preview_url": _tpdb_absolute_url(preview_href),
+    }
+
+
+def _extract_posters(soup):
+    return [(_legacy_season_key(link), _legacy_card_metadata(link)) for link in soup.select(ITEM_POSTER_SELECTOR)]
+
+
+def _index_posters(soup):
+    return [(card['season_key'], card['metadata']) for card in _index_tpdb_cards(soup)]
+
+
+def _time(label, func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<40} {best * 1000:9.1f} ms")
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    set_page = build_set_page(args.cards)
+    search_page = build_search_page(50)
+    print(f"parser={poster_scraper.TPDB_HTML_PARSER} set_page={len(set_page) // 1024} KiB cards={args.cards}")
+
+    def old_set():
+        return _extract_posters(BeautifulSoup(set_page, "html.parser"))
+
+    def new_set():
+        soup = _parse_tpdb_html(set_page, "set")
+        posters = _index_posters(soup)
+        soup.decompose()
+        return posters
+
+    def old_set_parse():
+        return BeautifulSoup(set_page, "html.parser")
+
+    def new_set_parse():
+        return _parse_tpdb_html(set_page, "set")
+
+    def old_search():
+        return len(BeautifulSoup(search_page, "html.parser").select(SEARCH_RESULT_SELECTOR))
+
+    def new_search():
+        soup = _parse_tpdb_html(search_page, "search")
+        count = len(soup.select(SEARCH_RESULT_SELECTOR))
+        soup.decompose()
+        return count
+
+    _time("set page parse (html.parser, full)", old_set_parse, args.repeat)
+    _time("set page parse (_parse_tpdb_html)", new_set_parse, args.repeat)
+    old_set_time, old_posters = _time("set page (html.parser, full)", old_set, args.repeat)
+    new_set_time, new_posters = _time("set page (_parse_tpdb_html)", new_set, args.repeat)
+    old_search_time, old_count = _time("search page (html.parser, full)", old_search, args.repeat)
+    new_search_time, new_count = _time("search page (_parse_tpdb_html)", new_search, args.repeat)
+
+    if old_posters != new_posters or old_count != new_count:
+        print("WARNING: parsed results differ between the two paths")
+    print(f"speedup: set x{old_set_time / new_set_time:.1f}, search x{old_search_time / new_search_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
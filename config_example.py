@@ -14,15 +14,49 @@ class Config:
     TPDB_SEARCH_URL_TEMPLATE = "https://theposterdb.com/search?term={query}"
     TPDB_EMAIL = ""
     TPDB_PASSWORD = ""
+    TPDB_BROWSER_POOL_SIZE = 2
+    TPDB_BROWSER_CHECKOUT_TIMEOUT_SEC = 300
+    TPDB_HTTP_FIRST = True
+    TPDB_LIGHTWEIGHT_BROWSER = True
+    TPDB_SUBPAGE_CONCURRENCY = 3
+    TPDB_PREVIEW_WORKERS = 4
+    # Drops near-duplicate posters before they are shown or counted (needs Pillow);
+    # preview=url searches fingerprint the cached /thumbnail previews for this.
+    TPDB_DEDUP_POSTERS = True
+    TPDB_DEDUP_MAX_DISTANCE = 4
+    TPDB_PREFETCH_COUNT = 3
 
     # TMDB Configuration
     TMDB_API_KEY = ""
 
     # Application Settings
     MAX_POSTERS_PER_ITEM = 18
-    TPDB_BATCH_DELAY_SEC = 1.5
+    TPDB_RATE_BUDGETS = {
+        'page': {'initial_rate': 0.8, 'min_rate': 0.1, 'max_rate': 2.0},
+        'image': {'initial_rate': 1.3, 'min_rate': 0.2, 'max_rate': 4.0},
+    }
     TPDB_DEBUG_SNAPSHOTS = True
+    # Only swept at startup for temp posters left by older versions; uploads no longer write here.
     TEMP_POSTER_DIR = "temp_posters"
     LOG_DIR = "logs"
+    CACHE_DIR = "cache"
+    TPDB_SESSION_FILE = os.path.join(CACHE_DIR, "tpdb_session.json")
+    TPDB_PAGE_CACHE_ENABLED = True
+    TPDB_PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    JELLYFIN_UPLOAD_LEDGER_PATH = os.path.join(CACHE_DIR, "jellyfin_uploads.sqlite3")
+    JELLYFIN_UPLOAD_CONCURRENCY = 4
+    TPDB_DOWNLOAD_CONCURRENCY = 2
+    AUTO_BATCH_UPLOAD_QUEUE_SIZE = 8
+    TPDB_IMAGE_CACHE_ENABLED = True
+    TPDB_IMAGE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+    TPDB_THUMBNAIL_MAX_WIDTH = 1200
+    TPDB_THUMBNAIL_QUALITY = 82
+    TPDB_SEARCH_RESULT_CACHE_TTL_SEC = 1800
+    TPDB_SEARCH_RESULT_CACHE_MAX_ENTRIES = 200
+    TPDB_PAGE_CACHE_TTL_SEC = {'search': 6 * 3600, 'item': 24 * 3600, 'set': 24 * 3600, 'season': 24 * 3600}
+    IDLE_WARMUP_ENABLED = False
+    IDLE_WARMUP_IDLE_AFTER_SEC = 300
+    IDLE_WARMUP_ITEM_DELAY_SEC = 10
+    IDLE_WARMUP_RESCAN_SEC = 6 * 3600
     FAILED_LOG_FILE = os.path.join(LOG_DIR, "failed.log")
     RESULTS_LOG_FILE = os.path.join(LOG_DIR, "results.log")
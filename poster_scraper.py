@@ -1,9 +1,9 @@
 import requests
 import json
 from io import BytesIO
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
@@ -15,23 +15,147 @@ import time
 import re
 import os
 import hashlib
+import sqlite3
+import zlib
 import base64
+import tempfile
 from datetime import datetime
 import threading
+import copy
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
 from config import Config
 import logging
 from requests.exceptions import ChunkedEncodingError, ConnectionError
 
-# Global Selenium driver
-selenium_driver = None
-selenium_lock = threading.RLock()
+try:
+    import lxml  # noqa: F401
+    TPDB_HTML_PARSER = "lxml"
+except ImportError:
+    TPDB_HTML_PARSER = "html.parser"
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# TPDB cookies captured from the most recent Selenium login (name -> value for requests,
+# full Selenium cookie dicts for seeding new Chrome drivers)
+tpdb_cookies = {}
+tpdb_browser_cookies = []
+# Bumped whenever the captured cookies change, so the HTTP session knows to resync its jar
+tpdb_cookies_version = 0
+tpdb_cookies_lock = threading.Lock()
+
+# Shared keep-alive HTTP session for all TPDB traffic (pages, images, session checks)
+tpdb_http_session = None
+tpdb_http_session_cookies_version = None
+tpdb_http_session_lock = threading.Lock()
+tpdb_fetch_stats = {'http_pages': 0, 'browser_pages': 0, 'http_fallbacks': {}}
+tpdb_fetch_stats_lock = threading.Lock()
+
+# TMDB id -> resolved TPDB search query
+tmdb_title_cache = {}
+tmdb_title_cache_lock = threading.Lock()
+MAX_TMDB_TITLE_CACHE_ENTRIES = 5000
 
 SEARCH_RESULT_SELECTOR = "a.btn.btn-dark-lighter.flex-grow-1.text-truncate.py-2.text-left.position-relative"
 ITEM_POSTER_SELECTOR = "a.bg-transparent.border-0.text-white"
-TPDB_PAGE_REQUEST_DELAY_SEC = 1.25
-TPDB_IMAGE_PREVIEW_DELAY_SEC = 0.75
-TPDB_IMAGE_PREVIEW_RETRY_DELAY_SEC = 3
+TPDB_RATE_BUDGETS = {
+    kind: {**budget, **getattr(Config, "TPDB_RATE_BUDGETS", {}).get(kind, {})}
+    for kind, budget in {
+        'page': {
+            'initial_rate': 0.8,
+            'min_rate': 0.1,
+            'max_rate': 2.0,
+            'burst': 2,
+            'increase_step': 0.05,
+            'decrease_factor': 0.5,
+            'cooldown_sec': 2,
+        },
+        'image': {
+            'initial_rate': 1.3,
+            'min_rate': 0.2,
+            'max_rate': 4.0,
+            'burst': 4,
+            'increase_step': 0.1,
+            'decrease_factor': 0.5,
+            'cooldown_sec': 3,
+        },
+    }.items()
+}
+TPDB_BROWSER_POOL_SIZE = max(1, int(getattr(Config, "TPDB_BROWSER_POOL_SIZE", 2)))
+TPDB_BROWSER_CHECKOUT_TIMEOUT_SEC = getattr(Config, "TPDB_BROWSER_CHECKOUT_TIMEOUT_SEC", 300)
+TPDB_HTTP_FIRST = getattr(Config, "TPDB_HTTP_FIRST", True)
+TPDB_LIGHTWEIGHT_BROWSER = getattr(Config, "TPDB_LIGHTWEIGHT_BROWSER", True)
+TPDB_BROWSER_POLL_SEC = 0.2
+TPDB_SUBPAGE_CONCURRENCY = max(1, int(getattr(Config, "TPDB_SUBPAGE_CONCURRENCY", 3)))
+TPDB_PREVIEW_WORKERS = max(1, int(getattr(Config, "TPDB_PREVIEW_WORKERS", 4)))
+TPDB_DEDUP_POSTERS = getattr(Config, "TPDB_DEDUP_POSTERS", True)
+TPDB_DEDUP_MAX_DISTANCE = getattr(Config, "TPDB_DEDUP_MAX_DISTANCE", 4)
+TPDB_DEDUP_MAX_COLOR_DELTA = 24
+TPDB_PREFETCH_COUNT = max(0, int(getattr(Config, "TPDB_PREFETCH_COUNT", 3)))
+# Tokens a background request leaves in its bucket, so a foreground request arriving next is not delayed.
+TPDB_BACKGROUND_TOKEN_RESERVE = 1
+TPDB_BACKGROUND_POLL_SEC = 0.5
+TPDB_BROWSER_BLOCKED_URLS = (
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*images.theposterdb.com*", "*/api/assets/*",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+) + tuple(getattr(Config, "TPDB_BROWSER_EXTRA_BLOCKED_URLS", ()))
+TPDB_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+# Raw-HTML markers for SEARCH_RESULT_SELECTOR / ITEM_POSTER_SELECTOR content on HTTP loads.
+SEARCH_RESULT_HTML_MARKER = "btn-dark-lighter"
+ITEM_POSTER_HTML_MARKER = "data-poster-id"
+CACHE_DIR = getattr(Config, "CACHE_DIR", "cache")
+TPDB_SESSION_FILE = getattr(Config, "TPDB_SESSION_FILE", os.path.join(CACHE_DIR, "tpdb_session.json"))
+TPDB_LOGIN_URL = "https://theposterdb.com/login"
+TPDB_PAGE_CACHE_ENABLED = getattr(Config, "TPDB_PAGE_CACHE_ENABLED", True)
+TPDB_IMAGE_CACHE_ENABLED = getattr(Config, "TPDB_IMAGE_CACHE_ENABLED", True)
+TPDB_IMAGE_CACHE_DIR = getattr(Config, "TPDB_IMAGE_CACHE_DIR", os.path.join(CACHE_DIR, "images"))
+TPDB_IMAGE_CACHE_MAX_BYTES = getattr(Config, "TPDB_IMAGE_CACHE_MAX_BYTES", 1024 * 1024 * 1024)
+TPDB_THUMBNAIL_MIN_WIDTH = 64
+TPDB_THUMBNAIL_MAX_WIDTH = getattr(Config, "TPDB_THUMBNAIL_MAX_WIDTH", 1200)
+TPDB_THUMBNAIL_WIDTH_STEP = 50
+TPDB_THUMBNAIL_QUALITY = getattr(Config, "TPDB_THUMBNAIL_QUALITY", 82)
+# Width of the /thumbnail previews the poster modal loads; preview=url searches fingerprint these.
+TPDB_PREVIEW_THUMBNAIL_WIDTH = 400
+TPDB_THUMBNAIL_FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+}
+# Per-request overrides on the shared TPDB session (which already sends the user agent and referer)
+TPDB_IMAGE_HEADERS = {
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+}
+TPDB_PAGE_CACHE_PATH = getattr(Config, "TPDB_PAGE_CACHE_PATH", os.path.join(CACHE_DIR, "tpdb_pages.sqlite3"))
+TPDB_PAGE_CACHE_MAX_BYTES = getattr(Config, "TPDB_PAGE_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+JELLYFIN_UPLOAD_CONCURRENCY = max(1, int(getattr(Config, "JELLYFIN_UPLOAD_CONCURRENCY", 4)))
+TPDB_DOWNLOAD_CONCURRENCY = max(1, int(getattr(Config, "TPDB_DOWNLOAD_CONCURRENCY", 2)))
+JELLYFIN_UPLOAD_LEDGER_PATH = getattr(
+    Config, "JELLYFIN_UPLOAD_LEDGER_PATH", os.path.join(CACHE_DIR, "jellyfin_uploads.sqlite3")
+)
+# Caps on concurrent poster downloads from TPDB and image POSTs to Jellyfin during uploads
+tpdb_download_slots = threading.BoundedSemaphore(TPDB_DOWNLOAD_CONCURRENCY)
+jellyfin_upload_slots = threading.BoundedSemaphore(JELLYFIN_UPLOAD_CONCURRENCY)
+TPDB_SEARCH_RESULT_CACHE_TTL_SEC = getattr(Config, "TPDB_SEARCH_RESULT_CACHE_TTL_SEC", 1800)
+TPDB_SEARCH_RESULT_CACHE_MAX_ENTRIES = getattr(Config, "TPDB_SEARCH_RESULT_CACHE_MAX_ENTRIES", 200)
+TPDB_SEARCH_RESULT_CACHE_MAX_BYTES = getattr(Config, "TPDB_SEARCH_RESULT_CACHE_MAX_BYTES", 128 * 1024 * 1024)
+TPDB_PAGE_CACHE_TTL_SEC = {
+    'search': 6 * 3600,
+    'item': 24 * 3600,
+    'set': 24 * 3600,
+    'season': 24 * 3600,
+    **getattr(Config, "TPDB_PAGE_CACHE_TTL_SEC", {}),
+}
 RATE_LIMIT_MARKERS = (
     "rate limit",
     "too many requests",
@@ -65,12 +189,12 @@ class TPDBRateLimited(Exception):
     """Raised when TPDB responds with a likely rate-limit/challenge page."""
 
 
-def _iter_file_chunks(file_obj, chunk_size=1024 * 1024):
-    while True:
-        data = file_obj.read(chunk_size)
-        if not data:
-            break
-        yield data
+class TPDBPrefetchDeferred(Exception):
+    """Raised when a background prefetch would need a pooled browser; the search is dropped uncached."""
+
+
+class SeleniumPoolTimeout(Exception):
+    """Raised when no pooled Selenium driver frees up within the checkout timeout (not a page timeout)."""
 
 
 def _is_login_url(url):
@@ -109,11 +233,13 @@ def _write_tpdb_debug_snapshot(page_source, context_label):
 
 
 def _raise_if_rate_limited(page_source, current_url, context_label="search", check_content_markers=True):
-    page_lower = (page_source or "").lower()
     title = (_extract_html_title(page_source) or "unknown title")
     title_lower = title.lower()
     title_looks_challenge = any(marker in title_lower for marker in RATE_LIMIT_TITLE_MARKERS)
-    page_looks_challenge = check_content_markers and any(marker in page_lower for marker in RATE_LIMIT_MARKERS)
+    page_looks_challenge = False
+    if check_content_markers and not title_looks_challenge:
+        page_lower = (page_source or "").lower()
+        page_looks_challenge = any(marker in page_lower for marker in RATE_LIMIT_MARKERS)
 
     if _is_rate_limit_url(current_url) or title_looks_challenge or page_looks_challenge:
         snapshot_path = _write_tpdb_debug_snapshot(page_source, f"{context_label}_challenge")
@@ -123,12 +249,25 @@ def _raise_if_rate_limited(page_source, current_url, context_label="search", che
         raise TPDBRateLimited(details)
 
 
+def _page_source_when_ready(selector, empty_markers):
+    """WebDriverWait condition returning the page source once `selector` or an empty-state notice shows up."""
+    def condition(driver):
+        if driver.find_elements(By.CSS_SELECTOR, selector):
+            return driver.page_source
+        # Read the source at most once per poll.
+        page_source = driver.page_source or ""
+        page_lower = page_source.lower()
+        if any(marker in page_lower for marker in empty_markers):
+            return page_source
+        return False
+    return condition
+
+
 def _wait_for_search_results_ready(driver, timeout=15):
+    """Wait for TPDB search results; returns the ready page source."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.find_elements(By.CSS_SELECTOR, SEARCH_RESULT_SELECTOR)
-            or "no results" in (d.page_source or "").lower()
-            or "0 results" in (d.page_source or "").lower()
+        return WebDriverWait(driver, timeout, poll_frequency=TPDB_BROWSER_POLL_SEC).until(
+            _page_source_when_ready(SEARCH_RESULT_SELECTOR, ("no results", "0 results"))
         )
     except TimeoutException as exc:
         _raise_if_rate_limited(driver.page_source, driver.current_url, "search_timeout")
@@ -136,132 +275,356 @@ def _wait_for_search_results_ready(driver, timeout=15):
 
 
 def _wait_for_item_posters_ready(driver, timeout=15):
+    """Wait for TPDB poster cards; returns the ready page source."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.find_elements(By.CSS_SELECTOR, ITEM_POSTER_SELECTOR)
-            or "no posters" in (d.page_source or "").lower()
-            or "no poster" in (d.page_source or "").lower()
+        return WebDriverWait(driver, timeout, poll_frequency=TPDB_BROWSER_POLL_SEC).until(
+            _page_source_when_ready(ITEM_POSTER_SELECTOR, ("no poster",))
         )
     except TimeoutException as exc:
         _raise_if_rate_limited(driver.page_source, driver.current_url, "item_timeout")
         raise TimeoutError("Timed out waiting for TPDB item poster page to load.") from exc
 
 
+class TPDBRateScheduler:
+    """
+    Process-wide token buckets that pace every TPDB request, one bucket per traffic kind.
+    Each success raises a bucket's rate additively; a challenge/rate-limit page cuts it
+    multiplicatively and pauses the bucket for a growing cool-down (AIMD).
+    Background requests (prefetch) only take spare tokens and wait while any foreground
+    search is running or foreground requests are queued.
+    """
+
+    def __init__(self, budgets):
+        self._condition = threading.Condition()
+        self._foreground_searches = 0
+        now = time.monotonic()
+        self._buckets = {}
+        for kind, budget in budgets.items():
+            self._buckets[kind] = {
+                **budget,
+                'rate': budget['initial_rate'],
+                'tokens': 1.0,
+                'updated': now,
+                'paused_until': 0.0,
+                'waiting': 0,
+                'background_waiting': 0,
+                'granted': 0,
+                'background_granted': 0,
+                'successes': 0,
+                'challenges': 0,
+                'consecutive_challenges': 0,
+            }
+
+    def _refill(self, bucket, now):
+        # Caller must hold self._condition.
+        elapsed = max(now - bucket['updated'], 0)
+        bucket['tokens'] = min(bucket['burst'], bucket['tokens'] + elapsed * bucket['rate'])
+        bucket['updated'] = now
+
+    def acquire(self, kind, background=False):
+        """Block until the `kind` bucket grants one request."""
+        bucket = self._buckets[kind]
+        waiting_key = 'background_waiting' if background else 'waiting'
+        needed_tokens = min(1 + TPDB_BACKGROUND_TOKEN_RESERVE, bucket['burst']) if background else 1
+        with self._condition:
+            bucket[waiting_key] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(bucket, now)
+                    wait_sec = bucket['paused_until'] - now
+                    if wait_sec <= 0:
+                        if background and (self._foreground_searches or bucket['waiting']):
+                            wait_sec = TPDB_BACKGROUND_POLL_SEC
+                        elif bucket['tokens'] >= needed_tokens:
+                            bucket['tokens'] -= 1
+                            bucket['background_granted' if background else 'granted'] += 1
+                            return
+                        else:
+                            wait_sec = (needed_tokens - bucket['tokens']) / bucket['rate']
+                    self._condition.wait(wait_sec)
+            finally:
+                bucket[waiting_key] -= 1
+
+    @contextmanager
+    def foreground_search(self):
+        """Mark a user-facing search as running; background requests hold off until it ends."""
+        with self._condition:
+            self._foreground_searches += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._foreground_searches -= 1
+                self._condition.notify_all()
+
+    def record_success(self, kind):
+        bucket = self._buckets[kind]
+        with self._condition:
+            bucket['successes'] += 1
+            bucket['consecutive_challenges'] = 0
+            bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + bucket['increase_step'])
+
+    def record_challenge(self, kind):
+        """Back off after TPDB served a challenge; returns the cool-down in seconds."""
+        bucket = self._buckets[kind]
+        with self._condition:
+            bucket['challenges'] += 1
+            bucket['consecutive_challenges'] += 1
+            bucket['rate'] = max(bucket['min_rate'], bucket['rate'] * bucket['decrease_factor'])
+            cooldown_sec = bucket['cooldown_sec'] * bucket['consecutive_challenges']
+            bucket['paused_until'] = max(bucket['paused_until'], time.monotonic() + cooldown_sec)
+            bucket['tokens'] = 0.0
+            self._condition.notify_all()
+        return cooldown_sec
+
+    def stats(self):
+        with self._condition:
+            now = time.monotonic()
+            return {
+                kind: {
+                    'rate_per_sec': round(bucket['rate'], 3),
+                    'max_rate_per_sec': bucket['max_rate'],
+                    'queue_depth': bucket['waiting'],
+                    'background_queue_depth': bucket['background_waiting'],
+                    'paused_for_sec': round(max(bucket['paused_until'] - now, 0), 1),
+                    'granted': bucket['granted'],
+                    'background_granted': bucket['background_granted'],
+                    'successes': bucket['successes'],
+                    'challenges': bucket['challenges'],
+                }
+                for kind, bucket in self._buckets.items()
+            }
+
+
+tpdb_rate_scheduler = TPDBRateScheduler(TPDB_RATE_BUDGETS)
+
+
+def get_tpdb_rate_stats():
+    return tpdb_rate_scheduler.stats()
+
+
 def _get_selenium_current_url():
-    global selenium_driver
-    if not selenium_driver:
-        return None
+    return selenium_pool.last_url
+
+
+def _create_selenium_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-gpu")
+    if not getattr(Config, "DEBUG", False):
+        chrome_options.add_argument("--disable-logging")
+        chrome_options.add_argument("--log-level=3")
+        chrome_options.add_argument("--disable-webgpu")
+        chrome_options.add_argument("--disable-vulkan")
+        chrome_options.add_argument("--disable-features=WebGPU,Vulkan,UseSkiaRenderer")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--lang=en-US")
+    chrome_options.add_argument(f"--user-agent={TPDB_USER_AGENT}")
+    excluded_switches = ["enable-automation"]
+    if not getattr(Config, "DEBUG", False):
+        excluded_switches.append("enable-logging")
+    chrome_options.add_experimental_option("excludeSwitches", excluded_switches)
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    if TPDB_LIGHTWEIGHT_BROWSER:
+        # Scraping only needs the DOM: skip images/notifications and return from get() at DOMContentLoaded.
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        chrome_options.page_load_strategy = "eager"
+    chrome_service = None
+    if not getattr(Config, "DEBUG", False):
+        chrome_service = Service(log_output=os.devnull)
+
+    driver = webdriver.Chrome(options=chrome_options, service=chrome_service)
+    driver.set_page_load_timeout(30)
     try:
-        return selenium_driver.current_url
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
+        )
     except Exception:
-        return None
+        # Non-fatal if CDP is unavailable in some Selenium/driver combinations.
+        pass
+    if TPDB_LIGHTWEIGHT_BROWSER:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(TPDB_BROWSER_BLOCKED_URLS)})
+        except Exception as cdp_error:
+            logging.debug(f"Could not block heavy resources via CDP: {cdp_error}")
+    return driver
 
 
-def setup_selenium_and_login(force=False):
+def _login_selenium_driver(driver, reuse_session=True):
     """
-    Initialize a singleton Selenium driver and log into ThePosterDB.
-    Safe to call multiple times; it will reuse the global driver if available.
-    force=True re-authenticates the existing driver session.
+    Log `driver` into TPDB. With `reuse_session`, the saved session cookies are injected
+    first and the login form is only submitted when TPDB still shows it.
     """
-    global selenium_driver
-    with selenium_lock:
-        if selenium_driver and not force:
-            logging.info("Selenium already initialized.")
-            return
+    saved_cookies = _load_tpdb_browser_cookies() if reuse_session else []
+    if saved_cookies:
+        _inject_tpdb_cookies(driver, saved_cookies)
+    tpdb_rate_scheduler.acquire('page')
+    driver.get(TPDB_LOGIN_URL)
+    if saved_cookies and not _is_login_url(driver.current_url):
+        _raise_if_rate_limited(
+            driver.page_source,
+            driver.current_url,
+            "login_reuse",
+            check_content_markers=False,
+        )
+        logging.info("Reused saved TPDB session; skipped the login form.")
+        _store_tpdb_cookies(driver)
+        return
 
-        created_driver = False
-        if not selenium_driver:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-gpu")
-            if not getattr(Config, "DEBUG", False):
-                chrome_options.add_argument("--disable-logging")
-                chrome_options.add_argument("--log-level=3")
-                chrome_options.add_argument("--disable-webgpu")
-                chrome_options.add_argument("--disable-vulkan")
-                chrome_options.add_argument("--disable-features=WebGPU,Vulkan,UseSkiaRenderer")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_argument("--lang=en-US")
-            chrome_options.add_argument(
-                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-            )
-            excluded_switches = ["enable-automation"]
-            if not getattr(Config, "DEBUG", False):
-                excluded_switches.append("enable-logging")
-            chrome_options.add_experimental_option("excludeSwitches", excluded_switches)
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_service = None
-            if not getattr(Config, "DEBUG", False):
-                chrome_service = Service(log_output=os.devnull)
-
-            selenium_driver = webdriver.Chrome(options=chrome_options, service=chrome_service)
-            selenium_driver.set_page_load_timeout(30)
-            try:
-                selenium_driver.execute_cdp_cmd(
-                    "Page.addScriptToEvaluateOnNewDocument",
-                    {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
-                )
-            except Exception:
-                # Non-fatal if CDP is unavailable in some Selenium/driver combinations.
-                pass
-            created_driver = True
+    # The regular sign-in page can contain challenge-related keywords in embedded scripts.
+    # For this initial page load, rely on URL/title checks only to avoid false positives.
+    _raise_if_rate_limited(
+        driver.page_source,
+        driver.current_url,
+        "login",
+        check_content_markers=False,
+    )
+    WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.NAME, "login")))
+
+    email_input = driver.find_element(By.NAME, "login")
+    password_input = driver.find_element(By.NAME, "password")
+    email_input.clear()
+    email_input.send_keys(Config.TPDB_EMAIL)
+    password_input.clear()
+    password_input.send_keys(Config.TPDB_PASSWORD)
+    password_input.send_keys(Keys.RETURN)
+
+    WebDriverWait(driver, 20).until(lambda d: not _is_login_url(d.current_url))
+    # After sign-in, /feed is expected. Avoid content-marker checks here because
+    # regular TPDB pages can include Cloudflare-related script text.
+    _raise_if_rate_limited(
+        driver.page_source,
+        driver.current_url,
+        "login_submit",
+        check_content_markers=False,
+    )
+    if _is_login_url(driver.current_url):
+        raise RuntimeError("TPDB login failed: still on /login after submitting credentials.")
 
-        try:
-            selenium_driver.get("https://theposterdb.com/login")
-            # The regular sign-in page can contain challenge-related keywords in embedded scripts.
-            # For this initial page load, rely on URL/title checks only to avoid false positives.
-            _raise_if_rate_limited(
-                selenium_driver.page_source,
-                selenium_driver.current_url,
-                "login",
-                check_content_markers=False,
-            )
-            WebDriverWait(selenium_driver, 15).until(EC.presence_of_element_located((By.NAME, "login")))
-
-            email_input = selenium_driver.find_element(By.NAME, "login")
-            password_input = selenium_driver.find_element(By.NAME, "password")
-            email_input.clear()
-            email_input.send_keys(Config.TPDB_EMAIL)
-            password_input.clear()
-            password_input.send_keys(Config.TPDB_PASSWORD)
-            password_input.send_keys(Keys.RETURN)
-
-            WebDriverWait(selenium_driver, 20).until(lambda d: not _is_login_url(d.current_url))
-            # After sign-in, /feed is expected. Avoid content-marker checks here because
-            # regular TPDB pages can include Cloudflare-related script text.
-            _raise_if_rate_limited(
-                selenium_driver.page_source,
-                selenium_driver.current_url,
-                "login_submit",
-                check_content_markers=False,
-            )
-            if _is_login_url(selenium_driver.current_url):
-                raise RuntimeError("TPDB login failed: still on /login after submitting credentials.")
+    _store_tpdb_cookies(driver)
 
-            if force:
-                logging.info("Selenium re-authenticated with ThePosterDB.")
-            else:
-                logging.info("Selenium initialized and logged into ThePosterDB.")
-        except Exception:
-            logging.exception("Failed to login to ThePosterDB (force=%s)", force)
-            if created_driver:
-                teardown_selenium()
-            raise
 
-def teardown_selenium(timeout=5):
-    """Shutdown Selenium driver without letting a stuck ChromeDriver block app exit."""
-    global selenium_driver
-    with selenium_lock:
-        driver = selenium_driver
-        selenium_driver = None
+def _store_tpdb_cookies(driver):
+    try:
+        browser_cookies = driver.get_cookies()
+    except Exception as cookie_error:
+        logging.warning(f"Could not read TPDB cookies from Selenium: {cookie_error}")
+        return
+    _set_tpdb_cookies(browser_cookies)
+    _save_tpdb_session(browser_cookies)
+
+
+def _set_tpdb_cookies(browser_cookies):
+    global tpdb_cookies, tpdb_browser_cookies, tpdb_cookies_version
+    with tpdb_cookies_lock:
+        tpdb_browser_cookies = [dict(cookie) for cookie in browser_cookies]
+        tpdb_cookies = {cookie['name']: cookie['value'] for cookie in browser_cookies}
+        tpdb_cookies_version += 1
+
+
+def _save_tpdb_session(browser_cookies):
+    """Persist the login cookies (owner read/write only) so a restart can skip the login form."""
+    if not TPDB_SESSION_FILE:
+        return
+    temp_path = f"{TPDB_SESSION_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(TPDB_SESSION_FILE) or ".", exist_ok=True)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as session_file:
+            json.dump({'saved_at': time.time(), 'cookies': browser_cookies}, session_file)
+        os.replace(temp_path, TPDB_SESSION_FILE)
+    except OSError as save_error:
+        logging.warning(f"Could not save TPDB session to {TPDB_SESSION_FILE}: {save_error}")
+
+
+def _load_tpdb_browser_cookies():
+    """Cookies from the current session, else from the session file; expired cookies are dropped."""
+    with tpdb_cookies_lock:
+        browser_cookies = list(tpdb_browser_cookies)
+    if not browser_cookies and TPDB_SESSION_FILE and os.path.exists(TPDB_SESSION_FILE):
+        try:
+            with open(TPDB_SESSION_FILE, "r") as session_file:
+                browser_cookies = json.load(session_file).get('cookies') or []
+        except (OSError, ValueError) as load_error:
+            logging.warning(f"Could not read saved TPDB session {TPDB_SESSION_FILE}: {load_error}")
+            return []
+    now = time.time()
+    return [
+        cookie for cookie in browser_cookies
+        if cookie.get('name') and (not cookie.get('expiry') or cookie['expiry'] > now)
+    ]
 
-    if not driver:
+
+def _inject_tpdb_cookies(driver, browser_cookies):
+    """Seed a fresh driver with saved cookies (CDP avoids an extra page load to set the domain)."""
+    cdp_cookies = []
+    for cookie in browser_cookies:
+        cdp_cookie = {
+            'name': cookie['name'],
+            'value': cookie.get('value', ''),
+            'domain': cookie.get('domain') or urlsplit(Config.TPDB_BASE_URL).hostname,
+            'path': cookie.get('path') or '/',
+            'secure': bool(cookie.get('secure')),
+            'httpOnly': bool(cookie.get('httpOnly')),
+        }
+        if cookie.get('expiry'):
+            cdp_cookie['expires'] = cookie['expiry']
+        if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+            cdp_cookie['sameSite'] = cookie['sameSite']
+        cdp_cookies.append(cdp_cookie)
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
         return
+    except Exception as cdp_error:
+        logging.debug(f"Could not set TPDB cookies via CDP, using add_cookie: {cdp_error}")
+    tpdb_rate_scheduler.acquire('page')
+    driver.get(Config.TPDB_BASE_URL)
+    for cookie in browser_cookies:
+        try:
+            driver.add_cookie({key: value for key, value in cookie.items() if key != 'sameSite'})
+        except Exception as cookie_error:
+            logging.debug(f"Could not restore TPDB cookie {cookie.get('name')}: {cookie_error}")
+
+
+def restore_tpdb_session():
+    """
+    Load the saved TPDB session and check it with one HTTP request to /login, which
+    redirects away when the cookies are still signed in. Returns True when it is usable.
+    """
+    browser_cookies = _load_tpdb_browser_cookies()
+    if not browser_cookies:
+        return False
+    tpdb_rate_scheduler.acquire('page')
+    try:
+        response = _get_tpdb_http_session().get(
+            TPDB_LOGIN_URL,
+            cookies={cookie['name']: cookie['value'] for cookie in browser_cookies},
+            timeout=15,
+        )
+    except requests.RequestException as http_error:
+        logging.info(f"Could not validate saved TPDB session: {http_error}")
+        return False
+    if response.status_code != 200 or _is_login_url(response.url):
+        logging.info("Saved TPDB session is stale (status=%s, url=%s).", response.status_code, response.url)
+        return False
+    tpdb_rate_scheduler.record_success('page')
+    _set_tpdb_cookies(browser_cookies)
+    logging.info("Restored saved TPDB session; Chrome will start on demand.")
+    return True
 
+
+def _quit_selenium_driver(driver, timeout=5):
+    """Quit a Chrome driver without letting a stuck ChromeDriver block the caller."""
     def quit_driver():
         try:
             driver.quit()
@@ -271,74 +634,269 @@ def teardown_selenium(timeout=5):
     cleanup_thread = threading.Thread(target=quit_driver, daemon=True)
     cleanup_thread.start()
     cleanup_thread.join(timeout)
-    if cleanup_thread.is_alive():
-        logging.warning("Selenium driver shutdown is still running; continuing application exit.")
+    return not cleanup_thread.is_alive()
 
-def get_selenium_cookies_as_dict():
-    """Return Selenium cookies as a dict for requests.Session."""
-    global selenium_driver
-    with selenium_lock:
-        if not selenium_driver:
-            return {}
+
+class PooledSeleniumDriver:
+    """One logged-in Chrome instance owned by the Selenium pool."""
+
+    def __init__(self, slot_id, driver):
+        self.slot_id = slot_id
+        self.driver = driver
+        self.busy = False
+        self.needs_login = False
+        self.uses = 0
+        self.logins = 0
+        self.last_url = None
+        self.last_error = None
+        self.created_at = time.time()
+        self.last_used_at = None
+
+    def snapshot(self):
+        return {
+            'slot_id': self.slot_id,
+            'busy': self.busy,
+            'needs_login': self.needs_login,
+            'uses': self.uses,
+            'logins': self.logins,
+            'last_url': self.last_url,
+            'last_error': self.last_error,
+            'age_sec': round(time.time() - self.created_at, 1),
+        }
+
+
+class SeleniumDriverPool:
+    """
+    Bounded pool of logged-in Chrome drivers.
+    Drivers are created lazily up to `size` and checked out for one TPDB search at a time.
+    """
+
+    def __init__(self, size=1):
+        self.size = max(1, int(size or 1))
+        self.last_url = None
+        self._condition = threading.Condition()
+        self._drivers = []
+        self._idle = []
+        self._creating = 0
+        self._waiting = 0
+        self._next_slot_id = 1
+        self._stats = {
+            'checkouts': 0,
+            'wait_sec_total': 0.0,
+            'wait_sec_max': 0.0,
+            'logins': 0,
+            'relogins': 0,
+            'discarded': 0,
+        }
+
+    def has_drivers(self):
+        with self._condition:
+            return bool(self._drivers)
+
+    def login(self, pooled, force=False):
         try:
-            cookies = selenium_driver.get_cookies()
-            return {cookie['name']: cookie['value'] for cookie in cookies}
+            # A forced re-login means the session expired, so the saved cookies are stale.
+            _login_selenium_driver(pooled.driver, reuse_session=not force)
         except Exception:
-            return {}
+            logging.exception("Failed to login to ThePosterDB (slot=%s, force=%s)", pooled.slot_id, force)
+            raise
+        with self._condition:
+            pooled.needs_login = False
+            pooled.logins += 1
+            self._stats['relogins' if force else 'logins'] += 1
+        if force:
+            logging.info("Selenium driver %s re-authenticated with ThePosterDB.", pooled.slot_id)
+        else:
+            logging.info("Selenium driver %s initialized and logged into ThePosterDB.", pooled.slot_id)
+
+    def _create_logged_in_driver(self):
+        with self._condition:
+            slot_id = self._next_slot_id
+            self._next_slot_id += 1
+        pooled = PooledSeleniumDriver(slot_id, _create_selenium_driver())
+        try:
+            self.login(pooled)
+        except Exception:
+            _quit_selenium_driver(pooled.driver)
+            raise
+        return pooled
+
+    def acquire(self, timeout=None):
+        """Check out an idle driver, creating one if the pool is below capacity."""
+        started = time.monotonic()
+        pooled = None
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        pooled.busy = True
+                        break
+                    if len(self._drivers) + self._creating < self.size:
+                        self._creating += 1
+                        break
+                    remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                    if remaining is not None and remaining <= 0:
+                        raise SeleniumPoolTimeout("Timed out waiting for a free Selenium driver.")
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+        if pooled is None:
+            try:
+                pooled = self._create_logged_in_driver()
+            except Exception:
+                with self._condition:
+                    self._creating -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._creating -= 1
+                pooled.busy = True
+                self._drivers.append(pooled)
+        elif pooled.needs_login:
+            try:
+                self.login(pooled, force=True)
+            except Exception as login_error:
+                self.release(pooled, healthy=False, error=login_error)
+                raise
+
+        waited = time.monotonic() - started
+        with self._condition:
+            pooled.uses += 1
+            pooled.last_used_at = time.time()
+            self._stats['checkouts'] += 1
+            self._stats['wait_sec_total'] += waited
+            self._stats['wait_sec_max'] = max(self._stats['wait_sec_max'], waited)
+        return pooled
+
+    def release(self, pooled, healthy=True, error=None):
+        """Return a driver to the pool, or discard it when it is no longer usable."""
+        last_url = None
+        if healthy:
+            try:
+                last_url = pooled.driver.current_url
+            except Exception as driver_error:
+                healthy = False
+                error = error or driver_error
+
+        discard = False
+        with self._condition:
+            pooled.busy = False
+            if last_url:
+                pooled.last_url = last_url
+                self.last_url = last_url
+            if error:
+                pooled.last_error = str(error)
+            if healthy and pooled in self._drivers:
+                self._idle.append(pooled)
+            else:
+                discard = True
+                if pooled in self._drivers:
+                    self._drivers.remove(pooled)
+                    self._stats['discarded'] += 1
+            self._condition.notify()
+
+        if discard:
+            logging.warning("Discarding Selenium driver %s: %s", pooled.slot_id, error or "pool closed")
+            _quit_selenium_driver(pooled.driver)
+
+    def release_after(self, pooled, error=None):
+        """Release a driver, marking it by the exception its holder finished with (if any)."""
+        if isinstance(error, TPDBSessionExpired):
+            pooled.needs_login = True
+        if isinstance(error, WebDriverException) and not isinstance(error, TimeoutException):
+            self.release(pooled, healthy=False, error=error)
+        else:
+            self.release(pooled)
+
+    def close_all(self, timeout=5):
+        with self._condition:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for pooled in drivers:
+            if pooled.busy:
+                # The current holder quits it on release.
+                continue
+            if not _quit_selenium_driver(pooled.driver, timeout=timeout):
+                logging.warning("Selenium driver %s shutdown is still running; continuing application exit.", pooled.slot_id)
+
+    def stats(self):
+        with self._condition:
+            checkouts = self._stats['checkouts']
+            return {
+                'size': self.size,
+                'total': len(self._drivers),
+                'busy': len([pooled for pooled in self._drivers if pooled.busy]),
+                'idle': len(self._idle),
+                'creating': self._creating,
+                'waiting': self._waiting,
+                'checkouts': checkouts,
+                'avg_wait_sec': round(self._stats['wait_sec_total'] / checkouts, 3) if checkouts else 0.0,
+                'max_wait_sec': round(self._stats['wait_sec_max'], 3),
+                'logins': self._stats['logins'],
+                'relogins': self._stats['relogins'],
+                'discarded': self._stats['discarded'],
+                'drivers': [pooled.snapshot() for pooled in self._drivers],
+            }
+
+
+selenium_pool = SeleniumDriverPool(TPDB_BROWSER_POOL_SIZE)
+
+
+def get_selenium_pool_stats():
+    return selenium_pool.stats()
+
 
-def download_image_with_cookies(url, save_path):
+def setup_selenium_and_login():
     """
-    Download an image from TPDB using Selenium cookies for authentication.
+    Make sure the Selenium pool has at least one Chrome driver logged into ThePosterDB.
+    Safe to call multiple times; it will reuse pooled drivers if available.
+    A still-valid session (from this run or saved on disk) is enough on its own:
+    Chrome is then only started when a page actually needs the browser.
+    Expired sessions are re-authenticated per driver when it is next checked out.
     """
-    try:
-        # Ensure target dir exists
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    if selenium_pool.has_drivers():
+        logging.info("Selenium already initialized.")
+        return
+    if get_selenium_cookies_as_dict() or restore_tpdb_session():
+        return
 
-        with requests.Session() as session:
-            session.cookies.update(get_selenium_cookies_as_dict())
-            session.headers.update({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Referer": "https://theposterdb.com/",
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
-            })
-            response = session.get(url, stream=True, timeout=30)
-            if response.status_code == 200:
-                with open(save_path, "wb") as f:
-                    for chunk in response.iter_content(8192):
-                        if chunk:
-                            f.write(chunk)
-                logging.debug(f"Saved image to {save_path}")
-                return True
-            else:
-                logging.warning(f"Failed to download image from {url} (status {response.status_code})")
-                return False
-    except Exception as e:
-        logging.error(f"Error downloading image from {url}: {e}")
-        return False
+    pooled = selenium_pool.acquire(timeout=TPDB_BROWSER_CHECKOUT_TIMEOUT_SEC)
+    selenium_pool.release(pooled)
 
-def get_content_type(file_path):
-    ext = file_path.split('.')[-1].lower()
-    return {
-        'png': 'image/png',
-        'jpg': 'image/jpeg',
-        'jpeg': 'image/jpeg',
-        'webp': 'image/webp'
-    }.get(ext, 'application/octet-stream')
+def teardown_selenium(timeout=5):
+    """Shutdown all pooled Selenium drivers without letting a stuck ChromeDriver block app exit."""
+    selenium_pool.close_all(timeout=timeout)
+
+def get_selenium_cookies_as_dict():
+    """Return the TPDB cookies captured at the last Selenium login as a dict for requests.Session."""
+    with tpdb_cookies_lock:
+        return dict(tpdb_cookies)
 
 def calculate_hash(data):
     return hashlib.md5(data).hexdigest()
 
-def get_local_image_hash(image_path):
+def get_jellyfin_image_tag(item_id, image_type='Primary'):
+    """Return the current Jellyfin ImageTag for an item's image, '' when it has none, or None when the lookup fails."""
     try:
-        if not os.path.exists(image_path):
-            return None
-        with open(image_path, 'rb') as f:
-            data = f.read()
-            return calculate_hash(data)
+        url = f"{Config.JELLYFIN_URL}/Items/{item_id}/Images"
+        headers = {'X-Emby-Token': Config.JELLYFIN_API_KEY, 'Accept': 'application/json'}
+        response = requests.get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        return next(
+            (image.get('ImageTag') or '' for image in response.json() if image.get('ImageType') == image_type),
+            '',
+        )
     except Exception as e:
-        logging.error(f"Error calculating hash for {image_path}: {str(e)}")
+        logging.debug(f"Could not read Jellyfin image tag for {item_id}: {e}")
         return None
 
+
 def get_jellyfin_image_hash(item_id, image_type='Primary', index=0):
     try:
         url = f"{Config.JELLYFIN_URL}/Items/{item_id}/Images/{image_type}/{index}"
@@ -352,93 +910,86 @@ def get_jellyfin_image_hash(item_id, image_type='Primary', index=0):
         logging.error(f"Error getting image hash from Jellyfin: {str(e)}")
         return None
 
-def are_images_identical(item_id, image_path, image_type='Primary'):
-    if not os.path.exists(image_path):
-        return False
-    jellyfin_hash = get_jellyfin_image_hash(item_id, image_type)
-    if not jellyfin_hash:
-        return False
-    local_hash = get_local_image_hash(image_path)
-    if not local_hash:
-        return False
-    return jellyfin_hash == local_hash
-
 def get_image_as_base64(image_url):
     """
     Download image and convert to base64 data URL for embedding in UI.
     """
-    for attempt in range(2):
-        try:
-            with requests.Session() as session:
-                session.cookies.update(get_selenium_cookies_as_dict())
-                session.headers.update({
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                    "Referer": "https://theposterdb.com/",
-                    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
-                })
+    try:
+        logging.debug(f"Converting image to base64: {image_url}")
+        image = fetch_tpdb_image(image_url, timeout=15, retries=1)
+        image_data = base64.b64encode(image['data']).decode('utf-8')
+        return f"data:{image['content_type']};base64,{image_data}"
+    except Exception as e:
+        logging.warning(f"Error converting image to base64: {e}")
+        return None
 
-                logging.debug(f"Converting image to base64: {image_url}")
-                response = session.get(image_url, timeout=15)
-                if response.status_code == 429 and attempt == 0:
-                    logging.warning("TPDB preview image rate limit hit; retrying in %ss.", TPDB_IMAGE_PREVIEW_RETRY_DELAY_SEC)
-                    time.sleep(TPDB_IMAGE_PREVIEW_RETRY_DELAY_SEC)
-                    continue
-                response.raise_for_status()
 
-                image_data = base64.b64encode(response.content).decode('utf-8')
-                content_type = response.headers.get('content-type', 'image/jpeg')
-                return f"data:{content_type};base64,{image_data}"
-        except Exception as e:
-            logging.warning(f"Error converting image to base64: {e}")
-            return None
-    return None
+WHITESPACE_RE = re.compile(r"\s+")
+SEASON_SPECIALS_RE = re.compile(r"\b(specials?|season\s+0|s00)\b")
+SEASON_NUMBER_RES = (
+    re.compile(r"\bseason[\s._-]*(\d{1,2})\b"),
+    re.compile(r"\bs[\s._-]*(\d{1,2})\b"),
+)
+TPDB_SET_ID_RE = re.compile(r"/set/(\d+)")
 
 
 def _normalize_tpdb_text(value):
-    return re.sub(r"\s+", " ", (value or "")).strip()
+    return WHITESPACE_RE.sub(" ", (value or "")).strip()
+
+
+def _season_text_facts(parts):
+    """Whether the joined `parts` mention specials, plus the first number each SEASON_NUMBER_RES finds."""
+    text = _normalize_tpdb_text(" ".join(part for part in parts if part)).lower()
+    numbers = []
+    for pattern in SEASON_NUMBER_RES:
+        match = pattern.search(text)
+        numbers.append(int(match.group(1)) if match else None)
+    return bool(SEASON_SPECIALS_RE.search(text)), numbers
 
 
-def _poster_link_text(poster_link):
-    parts = [
+def _poster_link_season_facts(poster_link, memo=None):
+    """
+    Season facts for the link itself, its three nearest ancestors and its images, nearest first.
+    Ancestors are shared by many cards on a page, so their facts are memoized by node.
+    """
+    memo = {} if memo is None else memo
+    facts = [_season_text_facts((
         poster_link.get_text(" ", strip=True),
         poster_link.get("title", ""),
         poster_link.get("aria-label", ""),
         poster_link.get("href", ""),
-    ]
+    ))]
     current = poster_link.parent
     for _ in range(3):
         if not current:
             break
-        parts.extend([
-            current.get_text(" ", strip=True),
-            current.get("title", ""),
-            current.get("aria-label", ""),
-        ])
+        key = ('season_facts', id(current))
+        if key not in memo:
+            memo[key] = _season_text_facts((
+                current.get_text(" ", strip=True),
+                current.get("title", ""),
+                current.get("aria-label", ""),
+            ))
+        facts.append(memo[key])
         current = current.parent
-    for image in poster_link.find_all("img"):
-        parts.extend([
-            image.get("alt", ""),
-            image.get("title", ""),
-            image.get("src", ""),
-            image.get("data-src", ""),
-        ])
-    return _normalize_tpdb_text(" ".join(part for part in parts if part))
-
-
-def _extract_tpdb_season_key(poster_link):
-    text = _poster_link_text(poster_link).lower()
-    if re.search(r"\b(specials?|season\s+0|s00)\b", text):
+    facts.append(_season_text_facts([
+        image.get(attribute, "")
+        for image in poster_link.find_all("img")
+        for attribute in ("alt", "title", "src", "data-src")
+    ]))
+    return facts
+
+
+def _extract_tpdb_season_key(poster_link, memo=None):
+    facts = _poster_link_season_facts(poster_link, memo)
+    if any(mentions_specials for mentions_specials, _ in facts):
         return "specials"
 
-    patterns = (
-        r"\bseason[\s._-]*(\d{1,2})\b",
-        r"\bs[\s._-]*(\d{1,2})\b",
-    )
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            season_number = int(match.group(1))
-            return "specials" if season_number == 0 else str(season_number)
+    for pattern_index in range(len(SEASON_NUMBER_RES)):
+        for _, numbers in facts:
+            season_number = numbers[pattern_index]
+            if season_number is not None:
+                return "specials" if season_number == 0 else str(season_number)
 
     return None
 
@@ -462,24 +1013,59 @@ def _tpdb_absolute_url(href):
     return None
 
 
-def _poster_card_container(poster_link):
+def _poster_card_container(poster_link, memo=None):
+    memo = {} if memo is None else memo
     current = poster_link
     for _ in range(6):
         if not current:
             return poster_link.parent
-        classes = current.get('class') or []
-        if 'hovereffect' in classes or current.select_one('div.overlay[data-poster-id]'):
+        key = ('is_card', id(current))
+        if key not in memo:
+            classes = current.get('class') or []
+            memo[key] = bool(
+                'hovereffect' in classes
+                or current.find('div', class_='overlay', attrs={'data-poster-id': True})
+            )
+        if memo[key]:
             return current
         current = current.parent
     return poster_link.parent
 
 
-def _extract_tpdb_card_metadata(poster_link):
-    card = _poster_card_container(poster_link)
-    set_link = card.select_one('a[href*="/set/"]') if card else None
-    uploader_link = card.select_one('.uploaded-by a') if card else None
-    overlay = card.select_one('.overlay[data-poster-id]') if card else None
-    preview_source = card.select_one('source[srcset], img.tpdb-poster[src]') if card else None
+def _scan_tpdb_card(card):
+    """
+    One walk over a card's descendants for the first set link, uploader link, overlay and
+    preview source (the same elements the equivalent CSS selectors would pick).
+    """
+    found = {}
+    for element in card.find_all(True):
+        classes = element.get('class') or []
+        if element.name == 'a' and 'set_link' not in found and '/set/' in (element.get('href') or ''):
+            found['set_link'] = element
+        if 'uploader_link' not in found and 'uploaded-by' in classes:
+            # Containers come before their contents in document order, so this is the first match.
+            uploader_link = element.find('a')
+            if uploader_link:
+                found['uploader_link'] = uploader_link
+        if 'overlay' not in found and 'overlay' in classes and element.has_attr('data-poster-id'):
+            found['overlay'] = element
+        if 'preview_source' not in found and (
+            (element.name == 'source' and element.has_attr('srcset'))
+            or (element.name == 'img' and 'tpdb-poster' in classes and element.has_attr('src'))
+        ):
+            found['preview_source'] = element
+        if len(found) == 4:
+            break
+    return found
+
+
+def _extract_tpdb_card_metadata(poster_link, memo=None):
+    card = _poster_card_container(poster_link, memo)
+    found = _scan_tpdb_card(card) if card else {}
+    set_link = found.get('set_link')
+    uploader_link = found.get('uploader_link')
+    overlay = found.get('overlay')
+    preview_source = found.get('preview_source')
     set_url = _tpdb_absolute_url(set_link.get('href')) if set_link else None
     preview_href = preview_source.get('srcset') or preview_source.get('src') if preview_source else None
     if preview_href:
@@ -487,7 +1073,7 @@ def _extract_tpdb_card_metadata(poster_link):
     preview_url = _tpdb_absolute_url(preview_href)
     set_id = None
     if set_url:
-        match = re.search(r"/set/(\d+)", set_url)
+        match = TPDB_SET_ID_RE.search(set_url)
         if match:
             set_id = match.group(1)
 
@@ -502,6 +1088,64 @@ def _extract_tpdb_card_metadata(poster_link):
     }
 
 
+def _index_tpdb_cards(poster_links):
+    """
+    Build one record per poster card link of a parsed TPDB page, in page order:
+    {'position', 'poster_url', 'season_key', 'metadata'}. Lookups on shared ancestors run once per page.
+    """
+    memo = {}
+    cards = []
+    for position, poster_link in enumerate(poster_links):
+        poster_url = _tpdb_absolute_url(poster_link.get('href'))
+        if not poster_url:
+            continue
+        cards.append({
+            'position': position,
+            'poster_url': poster_url,
+            'season_key': _extract_tpdb_season_key(poster_link, memo),
+            'metadata': _extract_tpdb_card_metadata(poster_link, memo),
+        })
+    return cards
+
+
+def _stored_tpdb_cards(scrape_state, url, page_kind, limit):
+    """
+    Cards indexed earlier for a page, cut to `limit`, or None when the page was not indexed that far.
+    A stored limit of None means every card on the page was indexed.
+    """
+    stored = scrape_state['page_cards'].get(f"{page_kind} {url}")
+    if stored is None or (stored['limit'] is not None and (limit is None or limit > stored['limit'])):
+        return None
+    return [card for card in stored['cards'] if limit is None or card['position'] < limit]
+
+
+def _index_tpdb_page(scrape_state, url, page_kind, page_source, limit):
+    soup = _parse_tpdb_html(page_source, page_kind)
+    poster_links = soup.select(ITEM_POSTER_SELECTOR)
+    cards = _index_tpdb_cards(poster_links[:limit])
+    soup.decompose()
+    scrape_state['page_cards'][f"{page_kind} {url}"] = {
+        'limit': limit if limit is not None and len(poster_links) > limit else None,
+        'cards': cards,
+    }
+    return cards
+
+
+def _load_tpdb_page_cards(loader, scrape_state, pages, limit, timeout):
+    """
+    Poster cards for each (url, page_kind) in `pages`, or None where the page failed to load.
+    Only pages not yet indexed up to `limit` in `scrape_state` are loaded.
+    """
+    cards_by_page = [_stored_tpdb_cards(scrape_state, url, page_kind, limit) for url, page_kind in pages]
+    pending = [index for index, cards in enumerate(cards_by_page) if cards is None]
+    sources = loader.load_many([pages[index] for index in pending], timeout=timeout)
+    for index, page_source in zip(pending, sources):
+        if page_source is not None:
+            url, page_kind = pages[index]
+            cards_by_page[index] = _index_tpdb_page(scrape_state, url, page_kind, page_source, limit)
+    return cards_by_page
+
+
 def _poster_dict(poster_id, poster_url, base64_image=None, target_type="series", season=None, group_id=None, metadata=None):
     metadata = metadata or {}
     poster = {
@@ -517,6 +1161,7 @@ def _poster_dict(poster_id, poster_url, base64_image=None, target_type="series",
         'set_url': metadata.get('set_url'),
         'set_poster_count': metadata.get('set_poster_count'),
         'tpdb_poster_id': metadata.get('tpdb_poster_id'),
+        'preview_source_url': metadata.get('preview_url') or poster_url,
     }
     if season:
         poster.update({
@@ -529,6 +1174,43 @@ def _poster_dict(poster_id, poster_url, base64_image=None, target_type="series",
     return poster
 
 
+def _emit_tpdb_progress(progress_callback, event, **payload):
+    """Send one search progress event to `progress_callback`; a failing callback never breaks the search."""
+    if progress_callback is None:
+        return
+    payload['event'] = event
+    try:
+        progress_callback(payload)
+    except Exception as e:
+        logging.debug("TPDB progress callback failed for '%s' event: %s", event, e)
+
+
+def _emit_new_tpdb_posters(progress_callback, group, show_count, season_count):
+    """Emit the posters appended to `group` since the lists had `show_count`/`season_count` entries."""
+    if progress_callback is None:
+        return
+    # Inline previews are large; they arrive with the final result.
+    for poster in group['show_posters'][show_count:] + group['season_posters'][season_count:]:
+        _emit_tpdb_progress(
+            progress_callback,
+            'poster',
+            poster={key: value for key, value in poster.items() if key != 'base64'},
+        )
+
+
+def _tpdb_group_summary(group):
+    return {
+        'id': group['id'],
+        'title': group['title'],
+        'url': group['url'],
+        'match_score': group['match_score'],
+        'show_poster_count': len(group['show_posters']),
+        'season_poster_count': len(group['season_posters']),
+        'covered_season_count': group['covered_season_count'],
+        'eligible_season_count': group['eligible_season_count'],
+    }
+
+
 def _resolve_tpdb_search_query(item_title, item_type=None, tmdb_id=None):
     tmdb_type = None
     if item_type == "Movie":
@@ -538,6 +1220,10 @@ def _resolve_tpdb_search_query(item_title, item_type=None, tmdb_id=None):
 
     search_query = item_title
     if tmdb_id and tmdb_type:
+        with tmdb_title_cache_lock:
+            cached_query = tmdb_title_cache.get((tmdb_type, str(tmdb_id)))
+        if cached_query:
+            return cached_query
         try:
             tmdb_response = requests.get(
                 f"https://api.themoviedb.org/3/{tmdb_type}/{tmdb_id}?api_key={Config.TMDB_API_KEY}&language=en-US",
@@ -554,6 +1240,10 @@ def _resolve_tpdb_search_query(item_title, item_type=None, tmdb_id=None):
             if tmdb_title:
                 search_query = f'{tmdb_title} ({year})' if year else tmdb_title
                 logging.debug(f"Using TMDB title for TPDB search: {search_query}")
+                with tmdb_title_cache_lock:
+                    if len(tmdb_title_cache) >= MAX_TMDB_TITLE_CACHE_ENTRIES:
+                        tmdb_title_cache.pop(next(iter(tmdb_title_cache)))
+                    tmdb_title_cache[(tmdb_type, str(tmdb_id))] = search_query
         except Exception as e:
             logging.warning(f"TMDB lookup failed for {item_title} ({item_type}): {e}; falling back to Jellyfin title.")
     return search_query
@@ -575,18 +1265,1057 @@ def _tpdb_url_with_query_params(url, **params):
     return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
 
 
-def _get_tpdb_preview_image(image_url, include_base64, preview_url=None):
-    if not include_base64:
+# Shared by all searches; the 'image' rate bucket still paces every download.
+tpdb_preview_executor = ThreadPoolExecutor(max_workers=TPDB_PREVIEW_WORKERS, thread_name_prefix="tpdb-preview")
+
+
+def _get_tpdb_preview_image(image_url, include_base64, preview_url=None, known_previews=None, known_fingerprints=None, background=False):
+    """
+    Start the preview work for a poster and return a Future for (data URL, fingerprint),
+    or the known data URL / None straight away. Call _dedup_new_tpdb_posters() on the new posters.
+    Without include_base64 (preview=url searches) only the fingerprint is needed for dedup; it
+    is taken from the /thumbnail variant the poster modal loads, so that is cached as well.
+    Background searches work inline so they never occupy the shared preview workers.
+    """
+    if known_previews and known_previews.get(image_url):
+        return known_previews[image_url]
+    if include_base64:
+        fetch_preview = _fetch_tpdb_preview
+    elif _tpdb_dedup_enabled() and not (known_fingerprints and image_url in known_fingerprints):
+        fetch_preview = _fetch_tpdb_preview_fingerprint
+    else:
+        return None
+    if background:
+        future = Future()
+        future.set_result(fetch_preview(preview_url or image_url, background=True))
+        return future
+    return tpdb_preview_executor.submit(fetch_preview, preview_url or image_url)
+
+
+def _fetch_tpdb_preview(image_url, background=False):
+    try:
+        image = fetch_tpdb_image(image_url, timeout=15, retries=1, background=background)
+    except Exception as e:
+        logging.warning(f"Error downloading TPDB preview {image_url}: {e}")
+        return None, None
+    data_url = f"data:{image['content_type']};base64,{base64.b64encode(image['data']).decode('utf-8')}"
+    return data_url, _tpdb_preview_fingerprint(image['data']) if _tpdb_dedup_enabled() else None
+
+
+def _fetch_tpdb_preview_fingerprint(image_url, background=False):
+    """(None, fingerprint) for a preview=url poster, read from its cached /thumbnail variant."""
+    try:
+        image = fetch_tpdb_image(image_url, timeout=15, retries=1, background=background)
+        # Already downloaded, so this only renders the variant the poster modal asks for.
+        entry = get_tpdb_thumbnail_file(image_url, width=TPDB_PREVIEW_THUMBNAIL_WIDTH, image_format='webp')
+        if entry:
+            with open(entry['path'], 'rb') as thumbnail_file:
+                image = {'data': thumbnail_file.read()}
+    except Exception as e:
+        logging.warning(f"Error downloading TPDB preview {image_url}: {e}")
+        return None, None
+    return None, _tpdb_preview_fingerprint(image['data'])
+
+
+def _tpdb_dedup_enabled():
+    return bool(TPDB_DEDUP_POSTERS and Image is not None)
+
+
+def _tpdb_preview_fingerprint(image_data):
+    """64-bit difference hash plus mean RGB of a preview, or None when it cannot be decoded."""
+    try:
+        with Image.open(BytesIO(image_data)) as image:
+            image.draft('RGB', (64, 64))
+            image = image.convert('RGB')
+            mean_color = image.resize((1, 1), Image.BOX).getpixel((0, 0))
+            pixels = list(image.convert('L').resize((9, 8), Image.BILINEAR).getdata())
+    except Exception:
+        return None
+    dhash = 0
+    for row in range(8):
+        for column in range(8):
+            dhash = (dhash << 1) | (pixels[row * 9 + column] > pixels[row * 9 + column + 1])
+    return dhash, mean_color
+
+
+def _is_near_duplicate(fingerprint, other):
+    # The color check keeps recolored variants of the same artwork apart.
+    return (
+        bin(fingerprint[0] ^ other[0]).count("1") <= TPDB_DEDUP_MAX_DISTANCE
+        and max(abs(a - b) for a, b in zip(fingerprint[1], other[1])) <= TPDB_DEDUP_MAX_COLOR_DELTA
+    )
+
+
+def _resolve_tpdb_previews(posters, known_fingerprints):
+    """
+    Wait for the preview work queued for `posters` and store their data URLs on them.
+    Returns {id(poster): fingerprint} for the posters whose preview could be fingerprinted;
+    `known_fingerprints` (by poster URL) is read first and filled with the new ones.
+    """
+    fingerprints = {}
+    for poster in posters:
+        preview = poster.get('base64')
+        fingerprint = known_fingerprints.get(poster['url'])
+        if isinstance(preview, Future):
+            poster['base64'], fingerprint = preview.result()
+        elif fingerprint is None and isinstance(preview, str) and _tpdb_dedup_enabled():
+            try:
+                fingerprint = _tpdb_preview_fingerprint(base64.b64decode(preview.split(',', 1)[1]))
+            except (IndexError, ValueError):
+                fingerprint = None
+        if fingerprint is not None:
+            fingerprints[id(poster)] = known_fingerprints[poster['url']] = fingerprint
+    return fingerprints
+
+
+def _dedup_new_tpdb_posters(group, show_count, season_count, kept_fingerprints, known_fingerprints):
+    """
+    Resolve the previews of the posters appended to `group` since the lists had
+    `show_count`/`season_count` entries and drop those that look like a poster already kept
+    for the same target (series or season). Returns how many were dropped.
+    """
+    dropped = 0
+    for field, start in (('show_posters', show_count), ('season_posters', season_count)):
+        new_posters = group[field][start:]
+        fingerprints = _resolve_tpdb_previews(new_posters, known_fingerprints) if new_posters else {}
+        kept = []
+        for poster in new_posters:
+            fingerprint = fingerprints.get(id(poster)) if _tpdb_dedup_enabled() else None
+            if fingerprint is not None:
+                target = 'series' if field == 'show_posters' else _season_key_from_jellyfin(poster)
+                seen = kept_fingerprints.setdefault(target, [])
+                if any(_is_near_duplicate(fingerprint, other) for other in seen):
+                    dropped += 1
+                    continue
+                seen.append(fingerprint)
+            kept.append(poster)
+        group[field][start:] = kept
+    return dropped
+
+
+def _update_group_season_coverage(group):
+    covered_keys = {
+        _season_key_from_jellyfin(poster)
+        for poster in group['season_posters']
+        if _season_key_from_jellyfin(poster)
+    }
+    group['covered_season_keys'] = sorted(covered_keys)
+    group['covered_season_count'] = len(covered_keys)
+
+
+def _normalize_tpdb_cache_url(url):
+    """Canonical cache key for a TPDB page URL: lowercase host, sorted query, no fragment."""
+    parts = urlsplit(url or "")
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class TPDBPageCache:
+    """
+    SQLite-backed cache of TPDB page HTML keyed by normalized URL.
+    Entries expire per page kind, keep their HTTP validators for conditional
+    revalidation, and are evicted least-recently-used once the byte cap is hit.
+    """
+
+    def __init__(self, path, max_bytes, ttl_by_kind):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_by_kind = ttl_by_kind
+        self._lock = threading.Lock()
+        self._connection = None
+        self._stats = {'hits': 0, 'stale': 0, 'misses': 0, 'revalidated': 0, 'writes': 0, 'evictions': 0}
+
+    def _connect(self):
+        # Caller must hold self._lock.
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, page_kind TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS pages_last_access ON pages(last_access)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def ttl_for(self, page_kind):
+        return self.ttl_by_kind.get(page_kind, self.ttl_by_kind.get('default', 0))
+
+    def get(self, url, page_kind):
+        """Return the cached entry (fresh or stale) or None; `entry['fresh']` says whether it may be served as-is."""
+        key = _normalize_tpdb_cache_url(url)
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?", (key,)
+                ).fetchone()
+                if not row:
+                    self._stats['misses'] += 1
+                    return None
+                connection.execute("UPDATE pages SET last_access = ? WHERE url = ?", (now, key))
+                connection.commit()
+                fresh = now - row[3] < self.ttl_for(page_kind)
+                self._stats['hits' if fresh else 'stale'] += 1
+        except sqlite3.Error as cache_error:
+            logging.warning(f"TPDB page cache read failed for {url}: {cache_error}")
+            return None
+        return {
+            'body': zlib.decompress(row[0]).decode('utf-8'),
+            'etag': row[1],
+            'last_modified': row[2],
+            'fetched_at': row[3],
+            'fresh': fresh,
+        }
+
+    def put(self, url, page_kind, page_source, etag=None, last_modified=None):
+        key = _normalize_tpdb_cache_url(url)
+        body = zlib.compress((page_source or "").encode('utf-8'))
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO pages (url, page_kind, body, size, etag, last_modified, fetched_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, page_kind, body, len(body), etag, last_modified, now, now),
+                )
+                self._stats['writes'] += 1
+                self._evict(connection)
+                connection.commit()
+        except sqlite3.Error as cache_error:
+            logging.warning(f"TPDB page cache write failed for {url}: {cache_error}")
+
+    def mark_revalidated(self, url):
+        key = _normalize_tpdb_cache_url(url)
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute("UPDATE pages SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, key))
+                connection.commit()
+                self._stats['revalidated'] += 1
+        except sqlite3.Error as cache_error:
+            logging.warning(f"TPDB page cache update failed for {url}: {cache_error}")
+
+    def _evict(self, connection):
+        # Caller must hold self._lock.
+        total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+        for url, size in connection.execute("SELECT url, size FROM pages ORDER BY last_access ASC").fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM pages WHERE url = ?", (url,))
+            total_bytes -= size
+            self._stats['evictions'] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            try:
+                count, total_bytes = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+                ).fetchone()
+            except sqlite3.Error:
+                count, total_bytes = None, None
+        stats.update({
+            'enabled': TPDB_PAGE_CACHE_ENABLED,
+            'entries': count,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+        })
+        return stats
+
+
+tpdb_page_cache = TPDBPageCache(TPDB_PAGE_CACHE_PATH, TPDB_PAGE_CACHE_MAX_BYTES, TPDB_PAGE_CACHE_TTL_SEC)
+
+
+def get_tpdb_page_cache_stats():
+    return tpdb_page_cache.stats()
+
+
+class TPDBImageCache:
+    """
+    Content-addressed on-disk store for TPDB images.
+    Image bodies live under `root` named by their md5 (so identical images are stored once);
+    a SQLite index maps each image URL to its body. Bodies are written atomically and
+    evicted least-recently-used once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, root, max_bytes):
+        # Absolute, so Flask's send_file does not resolve it against the app root.
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = None
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    def _connect(self):
+        # Caller must hold self._lock.
+        if self._connection is None:
+            os.makedirs(self.root, exist_ok=True)
+            connection = sqlite3.connect(os.path.join(self.root, "index.sqlite3"), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "content_hash TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS images ("
+                "url TEXT PRIMARY KEY, content_hash TEXT NOT NULL, content_type TEXT, fetched_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS blobs_last_access ON blobs(last_access)")
+            connection.execute("CREATE INDEX IF NOT EXISTS images_content_hash ON images(content_hash)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def blob_path(self, content_hash):
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def lookup(self, url):
+        """Return {'path', 'content_type', 'content_hash', 'size'} for a cached image URL, or None."""
+        key = _normalize_tpdb_cache_url(url)
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT images.content_hash, images.content_type, blobs.size FROM images "
+                    "JOIN blobs ON blobs.content_hash = images.content_hash WHERE images.url = ?",
+                    (key,),
+                ).fetchone()
+                if row and not os.path.exists(self.blob_path(row[0])):
+                    self._drop_blob(connection, row[0])
+                    connection.commit()
+                    row = None
+                if not row:
+                    self._stats['misses'] += 1
+                    return None
+                connection.execute("UPDATE blobs SET last_access = ? WHERE content_hash = ?", (time.time(), row[0]))
+                connection.commit()
+                self._stats['hits'] += 1
+        except sqlite3.Error as cache_error:
+            logging.warning(f"TPDB image cache read failed for {url}: {cache_error}")
+            return None
+        return {'path': self.blob_path(row[0]), 'content_type': row[1], 'content_hash': row[0], 'size': row[2]}
+
+    def read(self, url):
+        """Return {'data', 'content_type', 'content_hash'} for a cached image URL, or None."""
+        entry = self.lookup(url)
+        if not entry:
+            return None
+        try:
+            with open(entry['path'], 'rb') as image_file:
+                data = image_file.read()
+        except OSError:
+            return None
+        return {'data': data, 'content_type': entry['content_type'], 'content_hash': entry['content_hash']}
+
+    def put(self, url, data, content_type, content_hash=None):
+        content_hash = content_hash or calculate_hash(data)
+        path = self.blob_path(content_hash)
+        now = time.time()
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                try:
+                    with os.fdopen(fd, 'wb') as temp_file:
+                        temp_file.write(data)
+                    os.replace(temp_path, path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO blobs (content_hash, size, last_access) VALUES (?, ?, ?)",
+                    (content_hash, len(data), now),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO images (url, content_hash, content_type, fetched_at) VALUES (?, ?, ?, ?)",
+                    (_normalize_tpdb_cache_url(url), content_hash, content_type, now),
+                )
+                self._stats['writes'] += 1
+                self._evict(connection, keep_hash=content_hash)
+                connection.commit()
+        except (OSError, sqlite3.Error) as cache_error:
+            logging.warning(f"TPDB image cache write failed for {url}: {cache_error}")
+        return path
+
+    def _drop_blob(self, connection, content_hash):
+        # Caller must hold self._lock.
+        connection.execute("DELETE FROM images WHERE content_hash = ?", (content_hash,))
+        connection.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+        try:
+            os.remove(self.blob_path(content_hash))
+        except OSError:
+            pass
+
+    def _evict(self, connection, keep_hash=None):
+        # Caller must hold self._lock.
+        total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+        rows = connection.execute("SELECT content_hash, size FROM blobs ORDER BY last_access ASC").fetchall()
+        for content_hash, size in rows:
+            if total_bytes <= self.max_bytes:
+                break
+            if content_hash == keep_hash:
+                continue
+            self._drop_blob(connection, content_hash)
+            total_bytes -= size
+            self._stats['evictions'] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            try:
+                connection = self._connect()
+                blob_count, total_bytes = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+                ).fetchone()
+                url_count = connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+            except (OSError, sqlite3.Error):
+                blob_count, total_bytes, url_count = None, None, None
+        stats.update({
+            'enabled': TPDB_IMAGE_CACHE_ENABLED,
+            'urls': url_count,
+            'blobs': blob_count,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+        })
+        return stats
+
+
+tpdb_image_cache = TPDBImageCache(TPDB_IMAGE_CACHE_DIR, TPDB_IMAGE_CACHE_MAX_BYTES)
+# Striped locks so concurrent requests for one image URL share a single download.
+tpdb_image_fetch_locks = [threading.Lock() for _ in range(64)]
+
+
+def get_tpdb_image_cache_stats():
+    return tpdb_image_cache.stats()
+
+
+def fetch_tpdb_image(image_url, timeout=30, retries=0, background=False):
+    """
+    Return {'data', 'content_type', 'content_hash'} for a TPDB image, from the local
+    image cache when possible. Raises requests exceptions when the download fails.
+    `background` downloads only take spare 'image' tokens.
+    """
+    if TPDB_IMAGE_CACHE_ENABLED:
+        cached = tpdb_image_cache.read(image_url)
+        if cached:
+            return cached
+
+    with tpdb_image_fetch_locks[hash(_normalize_tpdb_cache_url(image_url)) % len(tpdb_image_fetch_locks)]:
+        if TPDB_IMAGE_CACHE_ENABLED:
+            cached = tpdb_image_cache.read(image_url)
+            if cached:
+                return cached
+
+        for attempt in range(retries + 1):
+            tpdb_rate_scheduler.acquire('image', background=background)
+            response = _get_tpdb_http_session().get(image_url, headers=TPDB_IMAGE_HEADERS, timeout=timeout)
+            if response.status_code == 429:
+                backoff_sec = tpdb_rate_scheduler.record_challenge('image')
+                if attempt < retries:
+                    logging.warning("TPDB image rate limit hit; retrying in %ss.", backoff_sec)
+                    continue
+            response.raise_for_status()
+            tpdb_rate_scheduler.record_success('image')
+            break
+
+        image = {
+            'data': response.content,
+            'content_type': response.headers.get('content-type', 'image/jpeg'),
+            'content_hash': calculate_hash(response.content),
+        }
+        if TPDB_IMAGE_CACHE_ENABLED:
+            tpdb_image_cache.put(image_url, image['data'], image['content_type'], image['content_hash'])
+        return image
+
+
+def fetch_tpdb_image_file(image_url, timeout=30):
+    """
+    Return the image cache entry ({'path', 'content_type', 'content_hash', 'size'}) for a
+    TPDB image, downloading it on a miss. Returns None when the image cache is disabled.
+    """
+    if not TPDB_IMAGE_CACHE_ENABLED:
+        return None
+    entry = tpdb_image_cache.lookup(image_url)
+    if entry:
+        return entry
+    fetch_tpdb_image(image_url, timeout=timeout)
+    return tpdb_image_cache.lookup(image_url)
+
+
+def _normalize_thumbnail_width(width):
+    """Round widths up to TPDB_THUMBNAIL_WIDTH_STEP so clients cannot create unbounded variants."""
+    if not width:
         return None
-    image_source = preview_url or image_url
-    if image_source == image_url:
-        time.sleep(TPDB_IMAGE_PREVIEW_DELAY_SEC)
-    return get_image_as_base64(image_source)
+    width = max(TPDB_THUMBNAIL_MIN_WIDTH, min(int(width), TPDB_THUMBNAIL_MAX_WIDTH))
+    return -(-width // TPDB_THUMBNAIL_WIDTH_STEP) * TPDB_THUMBNAIL_WIDTH_STEP
+
+
+def _render_thumbnail(source_path, width, image_format):
+    pillow_format, _ = TPDB_THUMBNAIL_FORMATS[image_format]
+    with Image.open(source_path) as source:
+        if width and source.format == 'JPEG':
+            # Let the JPEG decoder downscale by a power of two before the real resize.
+            source.draft('RGB', (width, width * 4))
+        image = source.convert('RGBA' if image_format == 'webp' and 'A' in source.getbands() else 'RGB')
+    if width and image.width > width:
+        image.thumbnail((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+    output = BytesIO()
+    save_options = {'quality': TPDB_THUMBNAIL_QUALITY}
+    if image_format == 'webp':
+        save_options['method'] = 4
+    else:
+        save_options.update({'optimize': True, 'progressive': True})
+    image.save(output, pillow_format, **save_options)
+    return output.getvalue()
+
+
+def get_tpdb_thumbnail_file(image_url, width=None, image_format=None, timeout=10):
+    """
+    Return the image cache entry for a TPDB image, resized to `width` and/or transcoded to
+    `image_format` ('webp' or 'jpeg') when asked for and Pillow is installed. Variants are
+    rendered once and kept in the image cache keyed by source content hash and size.
+    Returns None when the image cache is disabled.
+    """
+    entry = fetch_tpdb_image_file(image_url, timeout=timeout)
+    width = _normalize_thumbnail_width(width)
+    if image_format not in TPDB_THUMBNAIL_FORMATS:
+        image_format = 'webp' if width else None
+    if not entry or Image is None or not (width or image_format):
+        return entry
+
+    variant_key = f"derived://{entry['content_hash']}/{width or 'full'}.{image_format}"
+    with tpdb_image_fetch_locks[hash(variant_key) % len(tpdb_image_fetch_locks)]:
+        variant = tpdb_image_cache.lookup(variant_key)
+        if variant:
+            return variant
+        try:
+            data = _render_thumbnail(entry['path'], width, image_format)
+        except Exception as render_error:
+            logging.warning(f"Could not render {image_format} thumbnail for {image_url}: {render_error}")
+            return entry
+        tpdb_image_cache.put(variant_key, data, TPDB_THUMBNAIL_FORMATS[image_format][1])
+        return tpdb_image_cache.lookup(variant_key) or entry
+
+
+def warm_tpdb_images(image_urls):
+    """Fetch full-size TPDB images into the image cache in the background (e.g. right after a poster is picked)."""
+    image_urls = [url for url in dict.fromkeys(image_urls or []) if url]
+    if not image_urls or not TPDB_IMAGE_CACHE_ENABLED:
+        return None
+
+    def warm():
+        for image_url in image_urls:
+            try:
+                fetch_tpdb_image(image_url, timeout=30)
+            except Exception as warm_error:
+                logging.debug(f"Could not warm TPDB image {image_url}: {warm_error}")
+
+    warm_thread = threading.Thread(target=warm, daemon=True, name="tpdb-image-warm")
+    warm_thread.start()
+    return warm_thread
 
 
-def _open_tpdb_page_with_delay(url):
-    time.sleep(TPDB_PAGE_REQUEST_DELAY_SEC)
-    selenium_driver.get(url)
+def _get_tpdb_http_session():
+    """
+    Return the shared keep-alive session used for all TPDB HTTP traffic.
+    Its cookie jar is resynced from the captured login cookies only when they changed
+    (login, re-login, restored session), never by touching a browser driver.
+    """
+    global tpdb_http_session, tpdb_http_session_cookies_version
+    with tpdb_http_session_lock:
+        if tpdb_http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=4,
+                # Page loaders, sub-page workers, preview workers and proxy requests share it.
+                pool_maxsize=TPDB_BROWSER_POOL_SIZE * 2 + TPDB_SUBPAGE_CONCURRENCY + TPDB_PREVIEW_WORKERS + 4,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "User-Agent": TPDB_USER_AGENT,
+                "Referer": "https://theposterdb.com/",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            })
+            tpdb_http_session = session
+
+        with tpdb_cookies_lock:
+            cookies_version = tpdb_cookies_version
+            cookies = dict(tpdb_cookies) if cookies_version != tpdb_http_session_cookies_version else None
+        if cookies is not None:
+            tpdb_http_session.cookies.clear()
+            tpdb_http_session.cookies.update(cookies)
+            tpdb_http_session_cookies_version = cookies_version
+        return tpdb_http_session
+
+
+def _record_tpdb_fetch(source=None, fallback_reason=None):
+    with tpdb_fetch_stats_lock:
+        if source:
+            tpdb_fetch_stats[f"{source}_pages"] += 1
+        if fallback_reason:
+            fallbacks = tpdb_fetch_stats['http_fallbacks']
+            fallbacks[fallback_reason] = fallbacks.get(fallback_reason, 0) + 1
+
+
+def get_tpdb_fetch_stats():
+    with tpdb_fetch_stats_lock:
+        stats = dict(tpdb_fetch_stats)
+        stats['http_fallbacks'] = dict(tpdb_fetch_stats['http_fallbacks'])
+        return stats
+
+
+def _tpdb_html_is_ready(page_source, page_kind):
+    """Cheap check that raw HTML already contains what the browser waiters would wait for."""
+    page_lower = (page_source or "").lower()
+    if page_kind == "search":
+        return (
+            SEARCH_RESULT_HTML_MARKER in page_lower
+            or "no results" in page_lower
+            or "0 results" in page_lower
+        )
+    return ITEM_POSTER_HTML_MARKER in page_lower or "no poster" in page_lower
+
+
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+SEARCH_RESULT_STRAINER = SoupStrainer("a")
+
+
+def _parse_tpdb_html(page_source, page_kind):
+    """
+    Parse a TPDB page with the fastest available parser.
+    Search pages only keep the result links; poster pages drop scripts and styles,
+    since the card metadata lookups walk a few ancestors up from each poster link.
+    Call decompose() on the soup once the posters have been extracted.
+    """
+    if page_kind == "search":
+        return BeautifulSoup(page_source, TPDB_HTML_PARSER, parse_only=SEARCH_RESULT_STRAINER)
+    return BeautifulSoup(SCRIPT_STYLE_RE.sub("", page_source or ""), TPDB_HTML_PARSER)
+
+
+class TPDBPageLoader:
+    """
+    Loads TPDB pages for one search.
+    Pages are fetched over HTTP with the cookies captured at the last Selenium login;
+    a pooled browser is only checked out when HTTP hits a login redirect, a challenge
+    page, or HTML that does not contain the expected poster markup. Background loaders
+    take spare rate tokens only and raise TPDBPrefetchDeferred instead of using a browser.
+    """
+
+    def __init__(self, item_title=None, background=False):
+        self.item_title = item_title
+        self.background = background
+        self.pooled = None
+        self.current_url = None
+        # Set by _load_over_http when TPDB answered with a challenge or 429; load() backs off once per page.
+        self.http_challenged = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.pooled:
+            selenium_pool.release_after(self.pooled, exc)
+            self.pooled = None
+        return False
+
+    def _browser(self):
+        if self.background:
+            raise TPDBPrefetchDeferred("Background prefetch needs a browser; leaving the pool to foreground searches.")
+        if self.pooled is None:
+            self.pooled = selenium_pool.acquire(timeout=TPDB_BROWSER_CHECKOUT_TIMEOUT_SEC)
+        return self.pooled.driver
+
+    def load(self, url, page_kind, timeout=15, http_challenged=False):
+        """
+        Return the page source for `url`; raises TimeoutError when the page never becomes ready.
+        `http_challenged` says an earlier HTTP attempt at this page (by a load_many worker) was
+        challenged. A page backs off the 'page' bucket at most once, however many of its
+        requests were challenged; a browser challenge carries the cool-down as `backoff_sec`.
+        """
+        cached = tpdb_page_cache.get(url, page_kind) if TPDB_PAGE_CACHE_ENABLED else None
+        if cached and cached['fresh']:
+            self.current_url = url
+            return cached['body']
+
+        # Once a page needed the browser, keep using it for the rest of this search.
+        # Each request actually sent (HTTP attempt, browser fallback) takes its own 'page' token.
+        if TPDB_HTTP_FIRST and self.pooled is None:
+            page_source = self._load_over_http(url, page_kind, cached=cached)
+            if page_source is not None:
+                return page_source
+            http_challenged = http_challenged or self.http_challenged
+        try:
+            page_source = self._load_in_browser(url, page_kind, timeout)
+        except TPDBRateLimited as challenge:
+            challenge.backoff_sec = tpdb_rate_scheduler.record_challenge('page')
+            raise
+        except Exception:
+            if http_challenged:
+                tpdb_rate_scheduler.record_challenge('page')
+            raise
+        if http_challenged:
+            tpdb_rate_scheduler.record_challenge('page')
+        else:
+            tpdb_rate_scheduler.record_success('page')
+        if TPDB_PAGE_CACHE_ENABLED:
+            tpdb_page_cache.put(url, page_kind, page_source)
+        return page_source
+
+    def load_many(self, pages, timeout=10):
+        """
+        Load `(url, page_kind)` pages with up to TPDB_SUBPAGE_CONCURRENCY workers.
+        Returns the page sources in input order, with None for pages that timed out.
+        Every load still takes a token from the shared 'page' budget.
+        """
+        if not pages:
+            return []
+        if TPDB_SUBPAGE_CONCURRENCY <= 1 or len(pages) == 1:
+            return [self._load_or_none(self, url, page_kind, timeout) for url, page_kind in pages]
+
+        if self.pooled is not None:
+            # This loader already holds a browser. Workers checking out more drivers while it
+            # waits on them could starve concurrent searches that hold the rest of the pool, so
+            # workers stay on cache/HTTP and this loader's own browser picks up what they miss.
+            def load_page(page):
+                page_loader = TPDBPageLoader(self.item_title, background=self.background)
+                return page_loader._load_without_browser(*page), page_loader.http_challenged
+        else:
+            def load_page(page):
+                with TPDBPageLoader(self.item_title, background=self.background) as page_loader:
+                    return self._load_or_none(page_loader, page[0], page[1], timeout), False
+
+        with ThreadPoolExecutor(
+            max_workers=min(TPDB_SUBPAGE_CONCURRENCY, len(pages)),
+            thread_name_prefix="tpdb-subpage",
+        ) as executor:
+            futures = [executor.submit(load_page, page) for page in pages]
+            loaded = [future.result() for future in futures]
+        if self.pooled is None:
+            return [source for source, _ in loaded]
+        return [
+            source if source is not None else self._load_or_none(self, url, page_kind, timeout, http_challenged)
+            for (source, http_challenged), (url, page_kind) in zip(loaded, pages)
+        ]
+
+    def _load_without_browser(self, url, page_kind):
+        """Serve `url` from the page cache or over HTTP; None when it would need a browser."""
+        cached = tpdb_page_cache.get(url, page_kind) if TPDB_PAGE_CACHE_ENABLED else None
+        if cached and cached['fresh']:
+            return cached['body']
+        if not TPDB_HTTP_FIRST:
+            return None
+        return self._load_over_http(url, page_kind, cached=cached)
+
+    @staticmethod
+    def _load_or_none(loader, url, page_kind, timeout, http_challenged=False):
+        try:
+            return loader.load(url, page_kind, timeout=timeout, http_challenged=http_challenged)
+        except TimeoutError:
+            logging.debug("Timed out loading TPDB %s page %s.", page_kind, url)
+            return None
+
+    def _load_over_http(self, url, page_kind, cached=None):
+        self.http_challenged = False
+        if not get_selenium_cookies_as_dict():
+            _record_tpdb_fetch(fallback_reason="no_cookies")
+            return None
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        tpdb_rate_scheduler.acquire('page', background=self.background)
+        try:
+            response = _get_tpdb_http_session().get(url, headers=headers, timeout=15)
+        except requests.RequestException as http_error:
+            logging.debug("HTTP load failed for TPDB %s page %s: %s", page_kind, url, http_error)
+            _record_tpdb_fetch(fallback_reason="http_error")
+            return None
+
+        if _is_login_url(response.url):
+            logging.debug("HTTP load of TPDB %s page redirected to login; using Selenium.", page_kind)
+            _record_tpdb_fetch(fallback_reason="login_redirect")
+            return None
+        if response.status_code == 304 and cached:
+            tpdb_page_cache.mark_revalidated(url)
+            self.current_url = response.url
+            _record_tpdb_fetch("http")
+            tpdb_rate_scheduler.record_success('page')
+            return cached['body']
+        if response.status_code == 429:
+            self.http_challenged = True
+        if response.status_code != 200:
+            logging.debug("HTTP load of TPDB %s page returned %s; using Selenium.", page_kind, response.status_code)
+            _record_tpdb_fetch(fallback_reason=f"status_{response.status_code}")
+            return None
+
+        page_source = response.text
+        try:
+            _raise_if_rate_limited(page_source, response.url, f"{page_kind}_http")
+        except TPDBRateLimited as challenge:
+            logging.debug("HTTP load of TPDB %s page got a challenge; using Selenium: %s", page_kind, challenge)
+            self.http_challenged = True
+            _record_tpdb_fetch(fallback_reason="challenge")
+            return None
+        if not _tpdb_html_is_ready(page_source, page_kind):
+            _record_tpdb_fetch(fallback_reason="not_ready")
+            return None
+
+        self.current_url = response.url
+        _record_tpdb_fetch("http")
+        tpdb_rate_scheduler.record_success('page')
+        if TPDB_PAGE_CACHE_ENABLED:
+            tpdb_page_cache.put(
+                url,
+                page_kind,
+                page_source,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            )
+        return page_source
+
+    def _load_in_browser(self, url, page_kind, timeout):
+        driver = self._browser()
+        tpdb_rate_scheduler.acquire('page', background=self.background)
+        driver.get(url)
+        _record_tpdb_fetch("browser")
+        current_url = driver.current_url
+        self.current_url = current_url
+        if _is_login_url(current_url):
+            logging.warning("TPDB session expired on %s page for '%s' (%s).", page_kind, self.item_title, current_url)
+            raise TPDBSessionExpired(f"TPDB session expired while loading {page_kind} page.")
+
+        page_source = driver.page_source
+        _raise_if_rate_limited(page_source, current_url, f"{page_kind}_page")
+        if _tpdb_html_is_ready(page_source, page_kind):
+            return page_source
+        if page_kind == "search":
+            return _wait_for_search_results_ready(driver, timeout=timeout)
+        return _wait_for_item_posters_ready(driver, timeout=timeout)
+
+
+class TPDBSearchResultCache:
+    """
+    In-memory LRU of finished poster-group searches, bounded by entry count, bytes and TTL.
+    Each entry keeps the results built per `max_posters` (one built with previews also
+    answers requests without them) plus the search's scrape state: the chosen candidates
+    and the poster cards parsed from every page. A request for another `max_posters` is
+    rebuilt from that state: a smaller one needs no page loads, a larger one only loads the
+    extra sets and cards. The TTL runs from the first scrape, so the state never outlives it.
+    """
+
+    def __init__(self, ttl_sec, max_entries, max_bytes):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'rebuilt': 0, 'extended': 0, 'evictions': 0}
+
+    def _drop(self, key):
+        # Caller must hold self._lock.
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry['size']
+
+    def _live_entry(self, key):
+        # Caller must hold self._lock.
+        entry = self._entries.get(key)
+        if entry and time.time() - entry['created_at'] > self.ttl_sec:
+            self._drop(key)
+            return None
+        return entry
+
+    def get(self, key, max_posters, include_base64):
+        """Return a copy of the result built for exactly `max_posters`, or None."""
+        with self._lock:
+            entry = self._live_entry(key)
+            cached = entry['results'].get(max_posters) if entry else None
+            if cached and (cached['include_base64'] or not include_base64):
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return copy.deepcopy(cached['result'])
+            if not entry:
+                self._stats['misses'] += 1
+            return None
+
+    def scrape_state(self, key, max_posters):
+        """
+        Return a copy of the entry's scrape state to rebuild or extend from, or None.
+        Counted as 'extended' when `max_posters` is above every cached result, else 'rebuilt'.
+        """
+        with self._lock:
+            entry = self._live_entry(key)
+            if not entry:
+                return None
+            self._entries.move_to_end(key)
+            self._stats['extended' if max_posters > max(entry['results']) else 'rebuilt'] += 1
+            return copy.deepcopy(entry['state'])
+
+    def known_previews(self, key):
+        """Preview data URLs from the cached results, so a rebuild with previews skips those downloads."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if not entry:
+                return {}
+            return {
+                poster['url']: poster['base64']
+                for cached in entry['results'].values()
+                for group in cached['result'].get('groups', [])
+                for poster in group.get('show_posters', []) + group.get('season_posters', [])
+                if poster.get('base64')
+            }
+
+    def put(self, key, result, max_posters, include_base64, state):
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                entry = {'results': {}, 'state': None, 'created_at': time.time(), 'size': 0}
+            cached = entry['results'].get(max_posters)
+            if not (cached and cached['include_base64'] and not include_base64):
+                entry['results'][max_posters] = {'result': copy.deepcopy(result), 'include_base64': include_base64}
+            # The new state started from the cached one, so it covers at least as many pages.
+            entry['state'] = copy.deepcopy(state)
+            self._drop(key)
+            entry['size'] = len(json.dumps({'results': entry['results'], 'state': entry['state']}, default=str))
+            if entry['size'] > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += entry['size']
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries), 'bytes': self._bytes}
+
+
+tpdb_search_result_cache = TPDBSearchResultCache(
+    TPDB_SEARCH_RESULT_CACHE_TTL_SEC,
+    TPDB_SEARCH_RESULT_CACHE_MAX_ENTRIES,
+    TPDB_SEARCH_RESULT_CACHE_MAX_BYTES,
+)
+
+
+def get_tpdb_search_result_cache_stats():
+    return tpdb_search_result_cache.stats()
+
+
+def _search_result_cache_key(search_query, item_type, season_by_key, max_groups, requested_set_urls):
+    return (
+        normalize_title_for_comparison(search_query),
+        extract_title_year(search_query),
+        item_type,
+        tuple(sorted(season_by_key)),
+        max_groups,
+        tuple(sorted(requested_set_urls)),
+    )
+
+
+def _reuse_cached_search_result(result, season_by_key, max_posters):
+    """Refresh Jellyfin season state on a cached result built for the same `max_posters`."""
+    for group in result.get('groups', []):
+        for poster in group.get('season_posters', []):
+            season = season_by_key.get(_season_key_from_jellyfin(poster))
+            if season:
+                poster.update({
+                    'season_id': season.get('id'),
+                    'season_number': season.get('number'),
+                    'season_title': season.get('title'),
+                    'is_special': season.get('is_special', False),
+                    'season_has_poster': season.get('has_poster', False),
+                })
+    best_group = result['groups'][0] if result.get('groups') else None
+    result['best_group'] = best_group
+    result['posters'] = best_group['show_posters'][:max_posters] if best_group else []
+    return result
+
+
+def _rank_tpdb_search_results(search_result_links, search_query, item_year=None, max_groups=6):
+    """Pick up to `max_groups` item pages to check from the search result links, exact matches first."""
+    expected_year = extract_title_year(search_query) or (str(item_year) if item_year else None)
+    expected_title = strip_title_year(search_query)
+    expected_title_norm = normalize_title_for_comparison(expected_title)
+    candidate_links = []
+    year_mismatch_count = 0
+    for index, link in enumerate(search_result_links):
+        try:
+            title_element = link.find(class_="text-truncate") or link.find("span") or link
+            result_title = title_element.get_text(strip=True) if title_element else link.get_text(strip=True)
+            display_title = format_title_year_spacing(result_title)
+            result_year = extract_title_year(result_title)
+            result_title_norm = normalize_title_for_comparison(strip_title_year(result_title))
+            exact_title_match = bool(expected_title_norm and expected_title_norm == result_title_norm)
+            if expected_year and result_year and result_year != expected_year:
+                year_mismatch_count += 1
+                logging.debug("Skipping TPDB result for '%s' due to year mismatch: %s", search_query, display_title)
+                continue
+            item_page_path = link.get('href')
+            target_item_page_url = item_page_path if item_page_path and item_page_path.startswith('http') else (
+                Config.TPDB_BASE_URL + item_page_path if item_page_path and item_page_path.startswith('/') else None
+            )
+            if not target_item_page_url:
+                continue
+            candidate_links.append({
+                'title': display_title,
+                'year': result_year,
+                'score': calculate_title_match_score(search_query, result_title),
+                'exact_title_match': exact_title_match,
+                'exact_year_match': exact_title_match and (not expected_year or result_year == expected_year),
+                'url': target_item_page_url,
+                'index': index,
+            })
+        except Exception:
+            continue
+
+    if year_mismatch_count:
+        logging.debug("Skipped %d TPDB result(s) for '%s' due to year mismatch.", year_mismatch_count, search_query)
+
+    exact_matches = sorted(
+        [candidate for candidate in candidate_links if candidate['exact_year_match']],
+        key=lambda candidate: candidate['index'],
+    )
+    strong_matches = [candidate for candidate in candidate_links if candidate['score'] >= 0.8]
+    fallback_matches = sorted(
+        strong_matches or candidate_links,
+        key=lambda candidate: (-candidate['score'], candidate['index'])
+    )
+    if exact_matches:
+        logging.info(
+            "Found %d exact TPDB result(s) for '%s'; checking exact matches first.",
+            len(exact_matches),
+            search_query,
+        )
+
+    queued_candidate_indexes = set()
+    candidates_to_check = []
+    for candidate in exact_matches + fallback_matches:
+        if candidate['index'] in queued_candidate_indexes:
+            continue
+        candidates_to_check.append(candidate)
+        queued_candidate_indexes.add(candidate['index'])
+        if len(candidates_to_check) >= max_groups:
+            break
+    return candidates_to_check
 
 
 def search_tpdb_for_poster_groups(
@@ -599,9 +2328,17 @@ def search_tpdb_for_poster_groups(
     max_groups=6,
     include_base64=True,
     requested_set_urls=None,
+    progress_callback=None,
+    background=False,
 ):
-    """Return grouped TPDB poster candidates plus a flat show-poster list."""
-    global selenium_driver
+    """
+    Return grouped TPDB poster candidates plus a flat show-poster list.
+
+    `progress_callback`, when given, receives event dicts ('query', 'phase', 'candidate',
+    'poster', 'group') while the search runs; the return value is unchanged.
+    `background` searches (prefetch) yield to foreground ones and raise TPDBPrefetchDeferred
+    rather than check out a browser.
+    """
     eligible_seasons = eligible_seasons or []
     requested_set_urls = set(requested_set_urls or [])
     season_by_key = {
@@ -609,98 +2346,103 @@ def search_tpdb_for_poster_groups(
         for season in eligible_seasons
         if _season_key_from_jellyfin(season)
     }
+    _emit_tpdb_progress(progress_callback, 'phase', phase='query')
     search_query = _resolve_tpdb_search_query(item_title, item_type=item_type, tmdb_id=tmdb_id)
+    _emit_tpdb_progress(progress_callback, 'query', search_query=search_query)
+    cache_key = _search_result_cache_key(search_query, item_type, season_by_key, max_groups, requested_set_urls)
+    cached_result = tpdb_search_result_cache.get(cache_key, max_posters, include_base64)
+    if cached_result is not None:
+        logging.info("Using cached TPDB search result for '%s'.", search_query)
+        _emit_tpdb_progress(progress_callback, 'phase', phase='cached')
+        return _reuse_cached_search_result(cached_result, season_by_key, max_posters)
+    # Another poster limit was cached: rebuild from its pages, loading only what this limit adds.
+    scrape_state = tpdb_search_result_cache.scrape_state(cache_key, max_posters) or {}
+
+    with (nullcontext() if background else tpdb_rate_scheduler.foreground_search()):
+        result = _scrape_tpdb_poster_groups(
+            item_title,
+            search_query,
+            item_year=item_year,
+            item_type=item_type,
+            season_by_key=season_by_key,
+            max_posters=max_posters,
+            max_groups=max_groups,
+            include_base64=include_base64,
+            requested_set_urls=requested_set_urls,
+            known_previews=tpdb_search_result_cache.known_previews(cache_key) if include_base64 else {},
+            scrape_state=scrape_state,
+            progress_callback=progress_callback,
+            background=background,
+        )
+    tpdb_search_result_cache.put(cache_key, result, max_posters, include_base64, scrape_state)
+    return result
+
+
+def _scrape_tpdb_poster_groups(
+    item_title,
+    search_query,
+    item_year=None,
+    item_type=None,
+    season_by_key=None,
+    max_posters=18,
+    max_groups=6,
+    include_base64=True,
+    requested_set_urls=None,
+    known_previews=None,
+    scrape_state=None,
+    progress_callback=None,
+    background=False,
+):
+    """
+    Scrape TPDB for `search_query` and build the poster groups.
+    `scrape_state` holds the candidates and page cards of earlier scrapes of the same search;
+    it is filled in place, and only pages it does not cover far enough are loaded.
+    """
+    scrape_state = scrape_state if scrape_state is not None else {}
+    scrape_state.setdefault('candidates', None)
+    scrape_state.setdefault('page_cards', {})
+    known_fingerprints = scrape_state.setdefault('fingerprints', {})
+    season_by_key = season_by_key or {}
+    requested_set_urls = requested_set_urls or set()
+    known_previews = known_previews or {}
     search_url = _build_tpdb_search_url(search_query, item_type=item_type)
     logging.info(f"TPDB search URL: {search_url}")
 
+    loader = None
     try:
         groups = []
         poster_id = 1
+        dropped = 0
         for attempt in range(3):
             try:
-                with selenium_lock:
-                    if not selenium_driver:
-                        setup_selenium_and_login()
-
-                    selenium_driver.get(search_url)
-                    current_url = selenium_driver.current_url
-                    if _is_login_url(current_url):
-                        logging.warning("TPDB session expired on search page for '%s' (%s).", item_title, current_url)
-                        raise TPDBSessionExpired("TPDB session expired while loading search page.")
-
-                    _raise_if_rate_limited(selenium_driver.page_source, current_url, "search_page")
-                    _wait_for_search_results_ready(selenium_driver, timeout=15)
-                    soup = BeautifulSoup(selenium_driver.page_source, 'html.parser')
-
-                    search_result_links = soup.select(SEARCH_RESULT_SELECTOR)
-                    if not search_result_links:
+                with TPDBPageLoader(item_title, background=background) as loader:
+                    if scrape_state['candidates'] is None:
+                        _emit_tpdb_progress(progress_callback, 'phase', phase='search', attempt=attempt + 1)
+                        search_source = loader.load(search_url, "search", timeout=15)
+                        soup = _parse_tpdb_html(search_source, "search")
+                        scrape_state['candidates'] = _rank_tpdb_search_results(
+                            soup.select(SEARCH_RESULT_SELECTOR),
+                            search_query,
+                            item_year=item_year,
+                            max_groups=max_groups,
+                        )
+                        soup.decompose()
+                    candidates_to_check = scrape_state['candidates']
+                    if not candidates_to_check:
                         logging.info(f"No TPDB search results for '{search_query}'.")
                         return {'posters': [], 'groups': [], 'best_group': None, 'search_query': search_query}
 
-                    expected_year = extract_title_year(search_query) or (str(item_year) if item_year else None)
-                    expected_title = strip_title_year(search_query)
-                    expected_title_norm = normalize_title_for_comparison(expected_title)
-                    candidate_links = []
-                    year_mismatch_count = 0
-                    for index, link in enumerate(search_result_links):
-                        try:
-                            title_element = link.find(class_="text-truncate") or link.find("span") or link
-                            result_title = title_element.get_text(strip=True) if title_element else link.get_text(strip=True)
-                            display_title = format_title_year_spacing(result_title)
-                            result_year = extract_title_year(result_title)
-                            result_title_norm = normalize_title_for_comparison(strip_title_year(result_title))
-                            exact_title_match = bool(expected_title_norm and expected_title_norm == result_title_norm)
-                            if expected_year and result_year and result_year != expected_year:
-                                year_mismatch_count += 1
-                                logging.debug("Skipping TPDB result for '%s' due to year mismatch: %s", search_query, display_title)
-                                continue
-                            item_page_path = link.get('href')
-                            target_item_page_url = item_page_path if item_page_path and item_page_path.startswith('http') else (
-                                Config.TPDB_BASE_URL + item_page_path if item_page_path and item_page_path.startswith('/') else None
-                            )
-                            if not target_item_page_url:
-                                continue
-                            candidate_links.append({
-                                'title': display_title,
-                                'year': result_year,
-                                'score': calculate_title_match_score(search_query, result_title),
-                                'exact_title_match': exact_title_match,
-                                'exact_year_match': exact_title_match and (not expected_year or result_year == expected_year),
-                                'url': target_item_page_url,
-                                'index': index,
-                            })
-                        except Exception:
-                            continue
-
-                    if year_mismatch_count:
-                        logging.debug("Skipped %d TPDB result(s) for '%s' due to year mismatch.", year_mismatch_count, search_query)
-
-                    exact_matches = sorted(
-                        [candidate for candidate in candidate_links if candidate['exact_year_match']],
-                        key=lambda candidate: candidate['index'],
-                    )
-                    strong_matches = [candidate for candidate in candidate_links if candidate['score'] >= 0.8]
-                    fallback_matches = sorted(
-                        strong_matches or candidate_links,
-                        key=lambda candidate: (-candidate['score'], candidate['index'])
-                    )
-                    if exact_matches:
-                        logging.info(
-                            "Found %d exact TPDB result(s) for '%s'; checking exact matches first.",
-                            len(exact_matches),
-                            search_query,
+                    for candidate in candidates_to_check:
+                        _emit_tpdb_progress(
+                            progress_callback,
+                            'candidate',
+                            title=candidate['title'],
+                            year=candidate['year'],
+                            url=candidate['url'],
+                            score=candidate['score'],
+                            exact_match=candidate['exact_year_match'],
                         )
 
-                    queued_candidate_indexes = set()
-                    candidates_to_check = []
-                    for candidate in exact_matches + fallback_matches:
-                        if candidate['index'] in queued_candidate_indexes:
-                            continue
-                        candidates_to_check.append(candidate)
-                        queued_candidate_indexes.add(candidate['index'])
-                        if len(candidates_to_check) >= max_groups:
-                            break
-
                     for candidate in candidates_to_check:
                         logging.info(
                             "Checking TPDB result for '%s': %s (%d%% match)",
@@ -708,20 +2450,15 @@ def search_tpdb_for_poster_groups(
                             candidate['title'],
                             round(candidate['score'] * 100),
                         )
-                        _open_tpdb_page_with_delay(candidate['url'])
-                        current_url = selenium_driver.current_url
-                        if _is_login_url(current_url):
-                            logging.warning("TPDB session expired on item page for '%s' (%s).", item_title, current_url)
-                            raise TPDBSessionExpired("TPDB session expired while loading item page.")
-
-                        _raise_if_rate_limited(selenium_driver.page_source, current_url, "item_page")
-                        try:
-                            _wait_for_item_posters_ready(selenium_driver, timeout=15)
-                        except TimeoutError:
-                            logging.warning("Timed out checking TPDB result '%s' for '%s'; trying next result.", candidate['title'], search_query)
-                            continue
-
-                        item_soup = BeautifulSoup(selenium_driver.page_source, 'html.parser')
+                        _emit_tpdb_progress(progress_callback, 'phase', phase='item', title=candidate['title'])
+                        item_cards = _stored_tpdb_cards(scrape_state, candidate['url'], "item", Config.MAX_POSTERS_PER_ITEM)
+                        if item_cards is None:
+                            try:
+                                item_source = loader.load(candidate['url'], "item", timeout=15)
+                            except TimeoutError:
+                                logging.warning("Timed out checking TPDB result '%s' for '%s'; trying next result.", candidate['title'], search_query)
+                                continue
+                            item_cards = _index_tpdb_page(scrape_state, candidate['url'], "item", item_source, Config.MAX_POSTERS_PER_ITEM)
                         group = {
                             'id': f"group-{candidate['index']}",
                             'title': candidate['title'],
@@ -735,17 +2472,15 @@ def search_tpdb_for_poster_groups(
                             'covered_season_keys': [],
                             'available_sets': [],
                         }
+                        # Near-duplicates are dropped as posters are added, before they are streamed.
+                        kept_fingerprints = {}
                         discovered_set_urls = []
                         discovered_set_lookup = {}
                         discovered_set_order = {}
 
-                        for poster_link in item_soup.select(ITEM_POSTER_SELECTOR)[:Config.MAX_POSTERS_PER_ITEM]:
-                            href = poster_link.get('href')
-                            poster_url = _tpdb_absolute_url(href)
-                            if not poster_url:
-                                continue
-
-                            metadata = _extract_tpdb_card_metadata(poster_link)
+                        for card in item_cards:
+                            poster_url = card['poster_url']
+                            metadata = card['metadata']
                             set_url = metadata.get('set_url')
                             if set_url and set_url not in discovered_set_lookup:
                                 discovered_set_order[set_url] = len(discovered_set_urls)
@@ -760,8 +2495,8 @@ def search_tpdb_for_poster_groups(
                                 continue
                             if not requested_set_urls and set_url and discovered_set_order.get(set_url, 0) >= max_posters:
                                 continue
-                            base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'))
-                            season_key = _extract_tpdb_season_key(poster_link)
+                            base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'), known_previews, known_fingerprints, background)
+                            season_key = card['season_key']
                             if season_key and season_key in season_by_key:
                                 season = season_by_key[season_key]
                                 group['season_posters'].append(_poster_dict(
@@ -797,30 +2532,34 @@ def search_tpdb_for_poster_groups(
                             }
                             for set_url in set_urls_to_load:
                                 logging.info("Checking TPDB poster set for '%s': %s", search_query, set_url)
-                                _open_tpdb_page_with_delay(set_url)
-                                current_url = selenium_driver.current_url
-                                if _is_login_url(current_url):
-                                    logging.warning("TPDB session expired on set page for '%s' (%s).", item_title, current_url)
-                                    raise TPDBSessionExpired("TPDB session expired while loading set page.")
-
-                                _raise_if_rate_limited(selenium_driver.page_source, current_url, "set_page")
-                                try:
-                                    _wait_for_item_posters_ready(selenium_driver, timeout=10)
-                                except TimeoutError:
+                            _emit_tpdb_progress(progress_callback, 'phase', phase='sets', page_count=len(set_urls_to_load))
+                            set_cards_by_page = _load_tpdb_page_cards(
+                                loader,
+                                scrape_state,
+                                [(set_url, "set") for set_url in set_urls_to_load],
+                                limit=max(max_posters * max(len(season_by_key) + 1, 1), max_posters),
+                                timeout=10,
+                            )
+                            # Item posters go first so set posters are compared against them;
+                            # their previews were fetched while the set pages loaded.
+                            dropped += _dedup_new_tpdb_posters(group, 0, 0, kept_fingerprints, known_fingerprints)
+                            _emit_new_tpdb_posters(progress_callback, group, 0, 0)
+                            for set_cards in set_cards_by_page:
+                                if set_cards is None:
                                     continue
 
-                                set_soup = BeautifulSoup(selenium_driver.page_source, 'html.parser')
-                                for poster_link in set_soup.select(ITEM_POSTER_SELECTOR)[:max(max_posters * max(len(season_by_key) + 1, 1), max_posters)]:
-                                    poster_url = _tpdb_absolute_url(poster_link.get('href'))
-                                    if not poster_url or poster_url in seen_poster_urls:
+                                show_count, season_count = len(group['show_posters']), len(group['season_posters'])
+                                for card in set_cards:
+                                    poster_url = card['poster_url']
+                                    if poster_url in seen_poster_urls:
                                         continue
 
-                                    metadata = _extract_tpdb_card_metadata(poster_link)
-                                    season_key = _extract_tpdb_season_key(poster_link)
+                                    metadata = card['metadata']
+                                    season_key = card['season_key']
                                     poster_type = (metadata.get('tpdb_poster_type') or '').lower()
                                     if season_key and season_key in season_by_key:
                                         season = season_by_key[season_key]
-                                        base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'))
+                                        base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'), known_previews, known_fingerprints, background)
                                         group['season_posters'].append(_poster_dict(
                                             poster_id,
                                             poster_url,
@@ -833,7 +2572,7 @@ def search_tpdb_for_poster_groups(
                                         poster_id += 1
                                         seen_poster_urls.add(poster_url)
                                     elif poster_type == 'show':
-                                        base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'))
+                                        base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'), known_previews, known_fingerprints, background)
                                         group['show_posters'].append(_poster_dict(
                                             poster_id,
                                             poster_url,
@@ -844,6 +2583,11 @@ def search_tpdb_for_poster_groups(
                                         ))
                                         poster_id += 1
                                         seen_poster_urls.add(poster_url)
+                                dropped += _dedup_new_tpdb_posters(group, show_count, season_count, kept_fingerprints, known_fingerprints)
+                                _emit_new_tpdb_posters(progress_callback, group, show_count, season_count)
+                        else:
+                            dropped += _dedup_new_tpdb_posters(group, 0, 0, kept_fingerprints, known_fingerprints)
+                            _emit_new_tpdb_posters(progress_callback, group, 0, 0)
 
                         should_fallback_to_season_pages = season_by_key and (
                             not discovered_set_urls or not group['season_posters']
@@ -854,6 +2598,7 @@ def search_tpdb_for_poster_groups(
                                 search_query,
                             )
 
+                        season_pages = []
                         for season_key, season in (season_by_key.items() if should_fallback_to_season_pages else []):
                             season_param = 0 if season_key == "specials" else season_key
                             season_url = _tpdb_url_with_query_params(
@@ -870,71 +2615,81 @@ def search_tpdb_for_poster_groups(
                                 candidate['title'],
                                 season_param,
                             )
-                            _open_tpdb_page_with_delay(season_url)
-                            current_url = selenium_driver.current_url
-                            if _is_login_url(current_url):
-                                logging.warning("TPDB session expired on season page for '%s' (%s).", item_title, current_url)
-                                raise TPDBSessionExpired("TPDB session expired while loading season page.")
-
-                            _raise_if_rate_limited(selenium_driver.page_source, current_url, "season_page")
-                            try:
-                                _wait_for_item_posters_ready(selenium_driver, timeout=10)
-                            except TimeoutError:
+                            season_pages.append((season_key, season, season_url))
+                        if season_pages:
+                            _emit_tpdb_progress(progress_callback, 'phase', phase='seasons', page_count=len(season_pages))
+                        season_cards_by_page = _load_tpdb_page_cards(
+                            loader,
+                            scrape_state,
+                            [(season_url, "season") for _, _, season_url in season_pages],
+                            # With dedup every card is indexed, so dropped posters can be replaced.
+                            limit=None if _tpdb_dedup_enabled() else max_posters,
+                            timeout=10,
+                        )
+                        for (season_key, season, _), season_cards in zip(season_pages, season_cards_by_page):
+                            if season_cards is None:
                                 continue
 
-                            season_soup = BeautifulSoup(selenium_driver.page_source, 'html.parser')
+                            season_count = len(group['season_posters'])
                             seen_season_urls = {
                                 poster.get('url')
                                 for poster in group['season_posters']
                                 if _season_key_from_jellyfin(poster) == season_key
                             }
-                            for poster_link in season_soup.select(ITEM_POSTER_SELECTOR)[:max_posters]:
-                                href = poster_link.get('href')
-                                poster_url = _tpdb_absolute_url(href)
-                                if not poster_url or poster_url in seen_season_urls:
-                                    continue
-
-                                metadata = _extract_tpdb_card_metadata(poster_link)
-                                base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'))
-                                group['season_posters'].append(_poster_dict(
-                                    poster_id,
-                                    poster_url,
-                                    base64_image=base64_image,
-                                    target_type='season',
-                                    season=season,
-                                    group_id=group['id'],
-                                    metadata=metadata,
-                                ))
-                                seen_season_urls.add(poster_url)
-                                poster_id += 1
+                            pending_cards = [card for card in season_cards if card['poster_url'] not in seen_season_urls]
+                            # Take up to max_posters posters per season page that survive dedup.
+                            while pending_cards and len(group['season_posters']) - season_count < max_posters:
+                                batch_count = len(group['season_posters'])
+                                batch_size = max_posters - (batch_count - season_count)
+                                for card in pending_cards[:batch_size]:
+                                    poster_url = card['poster_url']
+                                    if poster_url in seen_season_urls:
+                                        continue
 
-                        covered_keys = {
-                            _season_key_from_jellyfin(poster)
-                            for poster in group['season_posters']
-                            if _season_key_from_jellyfin(poster)
-                        }
-                        group['covered_season_keys'] = sorted(covered_keys)
-                        group['covered_season_count'] = len(covered_keys)
+                                    metadata = card['metadata']
+                                    base64_image = _get_tpdb_preview_image(poster_url, include_base64, metadata.get('preview_url'), known_previews, known_fingerprints, background)
+                                    group['season_posters'].append(_poster_dict(
+                                        poster_id,
+                                        poster_url,
+                                        base64_image=base64_image,
+                                        target_type='season',
+                                        season=season,
+                                        group_id=group['id'],
+                                        metadata=metadata,
+                                    ))
+                                    seen_season_urls.add(poster_url)
+                                    poster_id += 1
+                                pending_cards = pending_cards[batch_size:]
+                                dropped += _dedup_new_tpdb_posters(group, len(group['show_posters']), batch_count, kept_fingerprints, known_fingerprints)
+                            _emit_new_tpdb_posters(progress_callback, group, len(group['show_posters']), season_count)
+
+                        _update_group_season_coverage(group)
                         if (group['show_posters'] or group['season_posters']) and group not in groups:
                             groups.append(group)
+                            _emit_tpdb_progress(progress_callback, 'group', group=_tpdb_group_summary(group))
                             break
 
                     break
             except TPDBSessionExpired:
                 if attempt == 0:
+                    # The pool re-authenticates the expired driver on the next checkout.
                     logging.warning("TPDB session expired; re-authenticating and retrying once for '%s'.", item_title)
-                    setup_selenium_and_login(force=True)
                     continue
                 raise
-            except TPDBRateLimited:
+            except TPDBRateLimited as challenge:
+                # TPDBPageLoader.load() already backed off for challenges it raised.
+                backoff_sec = getattr(challenge, 'backoff_sec', None)
+                if backoff_sec is None:
+                    backoff_sec = tpdb_rate_scheduler.record_challenge('page')
                 if attempt < 2:
-                    backoff_sec = 2 + attempt * 2
+                    # The scheduler holds back every TPDB page request for the cool-down.
                     logging.warning("TPDB challenge/rate-limit detected for '%s'; retrying in %ss.", item_title, backoff_sec)
-                    time.sleep(backoff_sec)
                     continue
                 raise
 
         groups = sorted(groups, key=lambda group: (-group['covered_season_count'], -group['match_score'], group['source_index']))
+        if dropped:
+            logging.info("Dropped %d near-duplicate TPDB poster(s) for '%s'.", dropped, item_title)
         best_group = groups[0] if groups else None
         posters = []
         if best_group:
@@ -949,8 +2704,14 @@ def search_tpdb_for_poster_groups(
             'best_group': best_group,
             'search_query': search_query,
         }
+    except TPDBPrefetchDeferred:
+        raise
     except Exception:
-        logging.exception("Error during TPDB scraping: search_url=%s current_url=%s", search_url, _get_selenium_current_url())
+        logging.exception(
+            "Error during TPDB scraping: search_url=%s current_url=%s",
+            search_url,
+            loader.current_url if loader else _get_selenium_current_url(),
+        )
         raise
 
 
@@ -971,6 +2732,71 @@ def search_tpdb_for_posters_multiple(item_title, item_year=None, item_type=None,
     )
     return result.get('posters', [])
 
+
+class TPDBPrefetchQueue:
+    """
+    One background thread that runs queued poster searches at background priority, so
+    the search-result cache is warm before the user opens the item. Each new batch
+    replaces whatever is still pending; the search already running is left to finish.
+    """
+
+    def __init__(self, max_pending):
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._running_key = None
+        self._thread = None
+        self._stats = {'queued': 0, 'completed': 0, 'deferred': 0, 'failed': 0}
+
+    def replace(self, searches):
+        """
+        Queue `(key, item_title, build_kwargs)` searches in order, dropping older pending ones.
+        `build_kwargs()` runs on the prefetch thread and returns search_tpdb_for_poster_groups kwargs.
+        """
+        with self._lock:
+            self._pending.clear()
+            for key, item_title, build_kwargs in searches[:self.max_pending]:
+                if key == self._running_key or key in self._pending:
+                    continue
+                self._pending[key] = (item_title, build_kwargs)
+                self._stats['queued'] += 1
+            if self._pending and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(target=self._run, name="tpdb-prefetch", daemon=True)
+                self._thread.start()
+            return len(self._pending)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._running_key = None
+                    return
+                key, (item_title, build_kwargs) = self._pending.popitem(last=False)
+                self._running_key = key
+            try:
+                search_tpdb_for_poster_groups(item_title, background=True, **build_kwargs())
+                outcome = 'completed'
+            except TPDBPrefetchDeferred as e:
+                logging.debug("Skipped TPDB prefetch for '%s': %s", item_title, e)
+                outcome = 'deferred'
+            except Exception as e:
+                logging.warning("TPDB prefetch failed for '%s': %s", item_title, e)
+                outcome = 'failed'
+            with self._lock:
+                self._stats[outcome] += 1
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, 'pending': len(self._pending), 'running': self._running_key is not None}
+
+
+tpdb_prefetch_queue = TPDBPrefetchQueue(max_pending=max(TPDB_PREFETCH_COUNT, 1) * 2)
+
+
+def get_tpdb_prefetch_stats():
+    return tpdb_prefetch_queue.stats()
+
+
 def extract_poster_metadata(poster_element):
     try:
         title_elem = poster_element.find('title') or poster_element.get('title', '')
@@ -1035,37 +2861,190 @@ def normalize_title_for_comparison(title):
     normalized = re.sub(r'\s+', ' ', normalized)
     return normalized.strip()
 
-def upload_image_to_jellyfin_improved(item_id, image_path):
-    """Upload image to Jellyfin with improved logic"""
+class JellyfinUploadLedger:
+    """
+    SQLite record of the image we last uploaded per (item, image type): its content hash and
+    the Jellyfin ImageTag seen right after. While the tag is unchanged the current Jellyfin
+    image is known to be ours, so identical-image checks need no image download.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0}
+
+    def _connect(self):
+        # Caller must hold self._lock.
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "item_id TEXT NOT NULL, image_type TEXT NOT NULL, content_hash TEXT NOT NULL, "
+                "image_tag TEXT NOT NULL, uploaded_at REAL NOT NULL, PRIMARY KEY (item_id, image_type))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, item_id, image_type, image_tag):
+        """Return the content hash recorded for `item_id` if Jellyfin still reports `image_tag`, else None."""
+        if not image_tag:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT content_hash FROM uploads WHERE item_id = ? AND image_type = ? AND image_tag = ?",
+                    (item_id, image_type, image_tag),
+                ).fetchone()
+                self._stats['hits' if row else 'misses'] += 1
+        except sqlite3.Error as ledger_error:
+            logging.warning(f"Jellyfin upload ledger read failed for {item_id}: {ledger_error}")
+            return None
+        return row[0] if row else None
+
+    def record(self, item_id, image_type, content_hash, image_tag):
+        if not content_hash or not image_tag:
+            return
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT OR REPLACE INTO uploads (item_id, image_type, content_hash, image_tag, uploaded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (item_id, image_type, content_hash, image_tag, time.time()),
+                )
+                connection.commit()
+                self._stats['writes'] += 1
+        except sqlite3.Error as ledger_error:
+            logging.warning(f"Jellyfin upload ledger write failed for {item_id}: {ledger_error}")
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            try:
+                stats['entries'] = self._connect().execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+            except sqlite3.Error:
+                stats['entries'] = None
+        return stats
+
+
+jellyfin_upload_ledger = JellyfinUploadLedger(JELLYFIN_UPLOAD_LEDGER_PATH)
+
+
+def get_jellyfin_upload_ledger_stats():
+    return jellyfin_upload_ledger.stats()
+
+
+class _Base64Reader:
+    """
+    File-like view that base64-encodes `file_obj` as it is read. Having a length lets
+    requests send it with a Content-Length instead of chunked encoding.
+    """
+
+    def __init__(self, file_obj, size):
+        self._file = file_obj
+        self._length = 4 * ((size + 2) // 3)
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return base64.b64encode(self._file.read())
+        # Whole 3-byte groups keep the pieces concatenable; only the last one is padded.
+        return base64.b64encode(self._file.read(max(size // 4, 1) * 3))
+
+
+def _open_tpdb_cache_entry(entry):
+    """Open a cache entry's body under 'file'; the open handle stays readable if LRU eviction deletes the file."""
+    if not entry:
+        return None
     try:
-        if not os.path.exists(image_path):
-            logging.warning(f"Image file not found: {image_path}")
-            return False
+        entry['file'] = open(entry['path'], 'rb')
+    except OSError:
+        return None
+    return entry
+
+
+def download_tpdb_image_for_upload(url):
+    """
+    Return an upload source for a TPDB image: the image cache entry ({'path', 'content_type',
+    'content_hash', 'size'}) with its body already open under 'file', or the downloaded bytes
+    under 'data' when the cache is disabled (or the entry was evicted before it was opened).
+    Pass it to upload_image_source_to_jellyfin(), which closes the file.
+    Returns None when the download fails. At most TPDB_DOWNLOAD_CONCURRENCY downloads run at once.
+    """
+    try:
+        if TPDB_IMAGE_CACHE_ENABLED:
+            cached = _open_tpdb_cache_entry(tpdb_image_cache.lookup(url))
+            if cached:
+                return cached
+        with tpdb_download_slots:
+            image = _open_tpdb_cache_entry(fetch_tpdb_image_file(url, timeout=30))
+            if image is None:
+                image = fetch_tpdb_image(url, timeout=30)
+                image['size'] = len(image['data'])
+        return image
+    except requests.HTTPError as e:
+        logging.warning(f"Failed to download image from {url} (status {e.response.status_code if e.response is not None else 'unknown'})")
+        return None
+    except Exception as e:
+        logging.error(f"Error downloading image from {url}: {e}")
+        return None
+
+
+def upload_image_source_to_jellyfin(item_id, image):
+    """
+    Upload an image from download_tpdb_image_for_upload() as the item's Primary image.
+    The base64 body is encoded while it streams from the cache file, so no temp file or
+    full-size encoded copy is made. The upload ledger answers the identical-image check
+    while the item's ImageTag is unchanged; otherwise the current image is downloaded and hashed.
+    At most JELLYFIN_UPLOAD_CONCURRENCY uploads talk to Jellyfin at once.
+    """
+    try:
+        with jellyfin_upload_slots:
+            return _upload_image_source_to_jellyfin(item_id, image)
+    finally:
+        if image.get('file'):
+            image['file'].close()
 
-        # Check if images are identical
-        if are_images_identical(item_id, image_path, 'Primary'):
+
+def _upload_image_source_to_jellyfin(item_id, image):
+    try:
+        content_hash = image.get('content_hash')
+        current_tag = get_jellyfin_image_tag(item_id, 'Primary')
+        uploaded_hash = jellyfin_upload_ledger.get(item_id, 'Primary', current_tag)
+        if uploaded_hash:
+            # Jellyfin still holds our last upload; a different hash means upload without comparing.
+            if uploaded_hash == content_hash:
+                logging.info(f"Image for item {item_id} is identical to existing (upload ledger).")
+                return True
+        elif content_hash and current_tag != '' and content_hash == get_jellyfin_image_hash(item_id, 'Primary'):
+            jellyfin_upload_ledger.record(item_id, 'Primary', content_hash, current_tag)
             logging.info(f"Image for item {item_id} is identical to existing.")
             return True
 
-        # Read and encode the image
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
-        
-        encoded_data = base64.b64encode(image_data)
-
-        # Prepare the upload
+        content_type = image.get('content_type') or ''
         url = f"{Config.JELLYFIN_URL}/Items/{item_id}/Images/Primary/0"
         headers = {
             'X-Emby-Token': Config.JELLYFIN_API_KEY,
-            'Content-Type': get_content_type(image_path),
+            'Content-Type': content_type if content_type.startswith('image/') else 'image/jpeg',
             'Connection': 'keep-alive'
         }
-
-        # Send the POST request
-        response = requests.post(url, headers=headers, data=encoded_data, timeout=30)
+        if image.get('file'):
+            image_file = image['file']
+        else:
+            image_file = open(image['path'], 'rb') if image.get('path') else BytesIO(image['data'])
+        with image_file:
+            response = requests.post(url, headers=headers, data=_Base64Reader(image_file, image['size']), timeout=30)
 
         if response.status_code in [200, 204]:
             logging.info("Artwork uploaded successfully.")
+            jellyfin_upload_ledger.record(item_id, 'Primary', content_hash, get_jellyfin_image_tag(item_id, 'Primary'))
             return True
         else:
             logging.warning(f"Failed to upload artwork: {response.status_code}")
@@ -1074,10 +3053,6 @@ def upload_image_to_jellyfin_improved(item_id, image_path):
     except Exception as e:
         logging.error(f"Error during image upload: {e}")
         return False
-    finally:
-        # Clean up memory
-        if 'encoded_data' in locals():
-            del encoded_data
 
 
 def _parse_jellyfin_datetime(value):
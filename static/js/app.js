@@ -138,6 +138,8 @@ let activeFailedItemIds = new Set();
 let activeFailedItemDetails = new Map();
 let activeProcessedItemDetails = new Map();
 let autoBatchPollTimer = null;
+let uploadAllJobId = null;
+let retryAllJobId = null;
 let currentAutoBatchJobId = null;
 let autoBatchStartedAt = null;
 let manualSelectionVisible = false;
@@ -258,32 +260,55 @@ function sortContent(sortBy) {
     window.location.href = url.toString();
 }
 
+const POSTER_SEARCH_PHASES = {
+    query: 'Resolving the search title...',
+    search: 'Searching TPDB for matching entries...',
+    item: 'Opening the best match and reading posters...',
+    sets: 'Checking linked sets for matching season posters...',
+    seasons: 'Checking season-specific poster pages...',
+    previews: 'Downloading poster previews...',
+    cached: 'Using recent search results...'
+};
+
+let posterSearchPhaseText = POSTER_SEARCH_PHASES.query;
+
 function startPosterSearchProgress() {
     stopPosterSearchProgress();
 
     const loadingText = document.getElementById('loadingText');
     const loadingSubtext = document.getElementById('loadingSubtext');
     const startedAt = Date.now();
-    const steps = [
-        { at: 0, text: 'Searching TPDB for matching entries...' },
-        { at: 5, text: 'Opening the best match and reading posters...' },
-        { at: 10, text: 'Checking linked sets for matching season posters...' },
-        { at: 18, text: 'Checking season-specific poster pages...' },
-        { at: 25, text: 'Downloading poster previews...' },
-        { at: 40, text: 'Still working. TPDB is being checked gently to avoid rate limits...' }
-    ];
+    posterSearchPhaseText = POSTER_SEARCH_PHASES.query;
 
     const update = () => {
         const elapsed = Math.floor((Date.now() - startedAt) / 1000);
-        const currentStep = [...steps].reverse().find(step => elapsed >= step.at) || steps[0];
         if (loadingText) loadingText.textContent = 'Searching for posters...';
-        if (loadingSubtext) loadingSubtext.textContent = currentStep.text;
+        if (loadingSubtext) loadingSubtext.textContent = elapsed > 0 ? `${posterSearchPhaseText} (${elapsed}s)` : posterSearchPhaseText;
+        const streamingStatus = document.getElementById('posterStreamStatus');
+        if (streamingStatus) streamingStatus.textContent = posterSearchPhaseText;
     };
 
     update();
     posterSearchProgressTimer = setInterval(update, 1000);
 }
 
+function updatePosterSearchPhase(event) {
+    let text = POSTER_SEARCH_PHASES[event.phase] || posterSearchPhaseText;
+    if (event.phase === 'item' && event.title) {
+        text = `Reading posters for ${event.title}...`;
+    } else if ((event.phase === 'sets' || event.phase === 'seasons') && event.page_count) {
+        const noun = event.phase === 'sets' ? 'linked set' : 'season page';
+        text = `Checking ${event.page_count} ${noun}${event.page_count !== 1 ? 's' : ''}...`;
+    } else if (event.phase === 'search' && event.attempt > 1) {
+        text = `${POSTER_SEARCH_PHASES.search} (retry ${event.attempt - 1})`;
+    }
+    posterSearchPhaseText = text;
+    const loadingSubtext = document.getElementById('loadingSubtext');
+    if (loadingSubtext) loadingSubtext.textContent = text;
+    const streamingStatus = document.getElementById('posterStreamStatus');
+    if (streamingStatus) streamingStatus.textContent = text;
+}
+
 function stopPosterSearchProgress() {
     if (posterSearchProgressTimer) {
         clearInterval(posterSearchProgressTimer);
@@ -294,6 +319,100 @@ function stopPosterSearchProgress() {
     if (loadingSubtext) loadingSubtext.textContent = 'This may take a few moments';
 }
 
+// Run a poster search through the NDJSON stream, passing progress events to onEvent; resolves with the final result.
+async function streamPosterSearch(itemId, params, onEvent) {
+    const query = new URLSearchParams(params).toString();
+    const response = await fetch(`/item/${itemId}/posters/stream?${query}`);
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!response.body || !contentType.includes('application/x-ndjson')) {
+        // Errors (session, readiness) are answered as plain JSON.
+        const data = await response.json();
+        if (data.error) throw new Error(data.error);
+        return data;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+        let newline;
+        while ((newline = buffer.indexOf('\n')) >= 0) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (!line) continue;
+            const event = JSON.parse(line);
+            if (event.event === 'result') return event;
+            if (event.event === 'error') throw new Error(event.error);
+            onEvent(event);
+        }
+        if (done) break;
+    }
+    throw new Error('Poster search ended before returning results');
+}
+
+// Show posters in the modal as the stream reports them; the final result replaces this view.
+function displayStreamingPosters(posters) {
+    const modalBody = document.getElementById('posterModalBody');
+    const modalTitle = document.querySelector('#posterModal .modal-title');
+    const modalFooter = document.getElementById('posterModalFooter');
+    if (!modalBody) return;
+    if (modalTitle) modalTitle.innerHTML = '<i class="fas fa-images me-2"></i>Searching for posters...';
+    if (modalFooter) modalFooter.style.display = 'none';
+
+    let html = `
+        <div class="mb-3 d-flex align-items-center gap-2">
+            <div class="spinner-border spinner-border-sm text-primary" role="status"></div>
+            <small class="text-muted" id="posterStreamStatus">${escapeHtml(posterSearchPhaseText)}</small>
+            <small class="text-muted ms-auto">
+                <i class="fas fa-images me-1"></i>
+                ${posters.length} poster${posters.length !== 1 ? 's' : ''} so far
+            </small>
+        </div>
+        <div class="row">
+    `;
+    posters.forEach((poster, index) => {
+        const imageSource = poster.base64 || poster.preview_url || '';
+        const label = poster.target_type === 'season' ? (poster.season_title || `Season ${poster.season_number}`) : '';
+        html += `
+            <div class="col-lg-2 col-md-3 col-sm-4 col-6 mb-3">
+                <div class="card poster-card h-100">
+                    <div class="poster-container">
+                        <img src="${escapeHtml(imageSource)}"
+                            class="card-img-top poster-image"
+                            alt="Poster ${index + 1}"
+                            loading="lazy"
+                            style="${!imageSource ? 'display: none;' : ''}">
+                    </div>
+                    ${label ? `<div class="card-footer py-1"><small class="text-muted">${escapeHtml(label)}</small></div>` : ''}
+                </div>
+            </div>
+        `;
+    });
+    html += '</div>';
+    modalBody.innerHTML = html;
+}
+
+const PREFETCH_NEIGHBOUR_COUNT = 6;
+
+// Ask the server to warm poster searches for the next visible items; it picks the ones without posters first.
+function prefetchNeighbourPosters(itemId) {
+    const wrappers = [...document.querySelectorAll('.item-card-wrapper[data-item-id]')]
+        .filter(wrapper => wrapper.offsetParent !== null);
+    const index = wrappers.findIndex(wrapper => wrapper.getAttribute('data-item-id') === itemId);
+    if (index < 0) return;
+    const itemIds = wrappers
+        .slice(index + 1, index + 1 + PREFETCH_NEIGHBOUR_COUNT)
+        .map(wrapper => wrapper.getAttribute('data-item-id'));
+    if (!itemIds.length) return;
+    fetch('/prefetch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ item_ids: itemIds })
+    }).catch(error => console.debug('Poster prefetch request failed:', error));
+}
+
 // Load posters for item
 async function loadPosters(itemId, setLimit = 3) {
     if (currentPosterSearchItem?.id !== itemId) {
@@ -305,22 +424,35 @@ async function loadPosters(itemId, setLimit = 3) {
     currentPosterSetLimit = setLimit;
     startPosterSearchProgress();
     if (loadingModal) loadingModal.show();
+    prefetchNeighbourPosters(itemId);
+
+    const streamedPosters = [];
+    const onSearchEvent = event => {
+        if (event.event === 'phase') {
+            if (event.phase === 'search' && event.attempt > 1) streamedPosters.length = 0;
+            updatePosterSearchPhase(event);
+        } else if (event.event === 'poster' && currentItemId === itemId) {
+            streamedPosters.push(event.poster);
+            if (streamedPosters.length === 1) {
+                if (loadingModal) loadingModal.hide();
+                if (posterModal) posterModal.show();
+            }
+            displayStreamingPosters(streamedPosters);
+        }
+    };
 
     try {
-        const response = await fetch(`/item/${itemId}/posters?set_limit=${encodeURIComponent(setLimit)}`);
-        const data = await response.json();
-
-        if (data.error) {
-            throw new Error(data.error);
-        }
+        const data = await streamPosterSearch(itemId, { set_limit: setLimit, preview: 'url' }, onSearchEvent);
 
         if (loadingModal) loadingModal.hide();
+        if (currentItemId !== itemId) return;
         currentPosterSetLimit = data.poster_set_limit || setLimit;
         canBrowseMorePosterSets = Boolean(data.can_browse_more_sets);
         displayPosters(data.item, data.posters, data.poster_groups || [], data.eligible_seasons || []);
     } catch (error) {
         console.error('Error loading posters:', error);
         if (loadingModal) loadingModal.hide();
+        if (streamedPosters.length && posterModal) posterModal.hide();
         showAlert('Failed to load posters: ' + error.message, 'danger');
     } finally {
         stopPosterSearchProgress();
@@ -371,12 +503,12 @@ function displayPosters(item, posters, posterGroups = [], eligibleSeasons = [])
         `;
 
         posters.forEach((poster, index) => {
-            const imageSource = poster.base64 || '';
+            const imageSource = poster.base64 || poster.preview_url || '';
             html += `
                 <div class="col-lg-2 col-md-3 col-sm-4 col-6 mb-3">
                     <div class="card poster-card h-100" data-poster-id="${poster.id}" onclick="selectPoster('${poster.url}', ${poster.id})">
                         <div class="poster-container">
-                            ${!poster.base64 ? `
+                            ${!imageSource ? `
                                 <div class="poster-loading d-flex align-items-center justify-content-center">
                                     <div class="text-center">
                                         <i class="fas fa-exclamation-triangle text-warning mb-2"></i>
@@ -389,7 +521,7 @@ function displayPosters(item, posters, posterGroups = [], eligibleSeasons = [])
                                 class="card-img-top poster-image"
                                 alt="Poster ${index + 1}"
                                 loading="lazy"
-                                style="${!poster.base64 ? 'display: none;' : ''}">
+                                style="${!imageSource ? 'display: none;' : ''}">
                         </div>
                     </div>
                 </div>
@@ -654,7 +786,7 @@ async function loadPosterSet(setUrl) {
     displayPosterGroups(currentPosterSearchItem, posterSearchGroups, currentPosterEligibleSeasons);
 
     try {
-        const response = await fetch(`/item/${currentItemId}/posters?set_limit=${encodeURIComponent(currentPosterSetLimit)}&set_url=${encodeURIComponent(setUrl)}`);
+        const response = await fetch(`/item/${currentItemId}/posters?set_limit=${encodeURIComponent(currentPosterSetLimit)}&set_url=${encodeURIComponent(setUrl)}&preview=url`);
         const data = await response.json();
         if (data.error) throw new Error(data.error);
         mergePosterGroups(data.poster_groups || []);
@@ -713,7 +845,7 @@ function mergeSetsByUrl(existingSets, newSets) {
 }
 
 function renderGroupedPosterCard(poster, index, targetType, groupId) {
-    const imageSource = poster.base64 || '';
+    const imageSource = poster.base64 || poster.preview_url || '';
     const label = targetType === 'season' ? (poster.season_title || 'Season') : 'Series';
     return `
         <div class="col-lg-2 col-md-3 col-sm-4 col-6 mb-3">
@@ -723,7 +855,7 @@ function renderGroupedPosterCard(poster, index, targetType, groupId) {
                 data-target-type="${escapeHtml(targetType)}"
                 data-season-id="${escapeHtml(poster.season_id || '')}">
                 <div class="poster-container">
-                    ${!poster.base64 ? `
+                    ${!imageSource ? `
                         <div class="poster-loading d-flex align-items-center justify-content-center">
                             <div class="text-center">
                                 <i class="fas fa-exclamation-triangle text-warning mb-2"></i>
@@ -736,7 +868,7 @@ function renderGroupedPosterCard(poster, index, targetType, groupId) {
                         class="card-img-top poster-image"
                         alt="${escapeHtml(label)} poster ${index + 1}"
                         loading="lazy"
-                        style="${!poster.base64 ? 'display: none;' : ''}">
+                        style="${!imageSource ? 'display: none;' : ''}">
                 </div>
                 <div class="poster-target-label">${escapeHtml(label)}</div>
             </div>
@@ -1074,8 +1206,52 @@ async function uploadPoster(itemId) {
     }
 }
 
+// Poll a background job (/upload-all, /failed-items/retry-all) until it is done
+function pollBackgroundJob(jobId, onProgress) {
+    return new Promise((resolve, reject) => {
+        const poll = async () => {
+            try {
+                const response = await fetch(`/jobs/${jobId}`);
+                const data = await response.json();
+                if (!response.ok || !data.success) throw new Error(data.error || 'Failed to load job progress');
+                if (onProgress) onProgress(data.job);
+                if (data.job.done) {
+                    resolve(data.job);
+                } else {
+                    setTimeout(poll, 1000);
+                }
+            } catch (error) {
+                reject(error);
+            }
+        };
+        poll();
+    });
+}
+
+async function cancelBackgroundJob(jobId, button) {
+    if (button) {
+        button.disabled = true;
+        button.innerHTML = '<i class="fas fa-spinner fa-spin me-1"></i>Cancelling...';
+    }
+    try {
+        const response = await fetch(`/jobs/${jobId}/cancel`, { method: 'POST' });
+        const data = await response.json();
+        if (!response.ok || !data.success) throw new Error(data.error || 'Failed to cancel job');
+    } catch (error) {
+        console.error('Job cancel error:', error);
+        showAlert('Failed to cancel: ' + error.message, 'danger');
+        if (button) button.disabled = false;
+    }
+}
+
 // Upload all selected posters (batch)
 async function uploadAllSelected() {
+    const uploadBtn = document.getElementById('uploadAllBtn');
+    if (uploadAllJobId) {
+        if (confirm('Cancel the running upload?')) cancelBackgroundJob(uploadAllJobId, uploadBtn);
+        return;
+    }
+
     const selectedCount = Object.keys(selectedPosters).length;
     if (selectedCount === 0) {
         showAlert('No posters selected', 'warning');
@@ -1091,24 +1267,29 @@ async function uploadAllSelected() {
     const progressText = document.getElementById('progressText');
 
     if (progressContainer) progressContainer.style.display = 'block';
-    if (progressBar) progressBar.style.width = '20%';
+    if (progressBar) progressBar.style.width = '0%';
     if (progressText) progressText.textContent = 'Starting...';
 
-    const uploadBtn = document.getElementById('uploadAllBtn');
-    if (uploadBtn) {
-        uploadBtn.disabled = true;
-        uploadBtn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Uploading...';
-    }
-
     try {
         const response = await fetch('/upload-all', { method: 'POST' });
         const data = await response.json();
+        if (!response.ok || !data.job_id) throw new Error(data.error || 'Batch upload failed');
 
-        if (progressBar) progressBar.style.width = '80%';
-        if (!data.results) throw new Error(data.error || 'Batch upload failed');
+        uploadAllJobId = data.job_id;
+        if (uploadBtn) {
+            uploadBtn.disabled = false;
+            uploadBtn.innerHTML = '<i class="fas fa-stop me-2"></i>Cancel Upload';
+        }
+
+        const job = await pollBackgroundJob(data.job_id, progress => {
+            const percent = progress.total_items ? Math.round((progress.processed / progress.total_items) * 100) : 0;
+            if (progressBar) progressBar.style.width = `${percent}%`;
+            if (progressText) progressText.textContent = `${progress.processed}/${progress.total_items} - ${progress.message}`;
+        });
+        if (job.status === 'failed') throw new Error(job.error || 'Batch upload failed');
 
         // Reflect results in UI
-        data.results.forEach(result => {
+        job.results.forEach(result => {
             if (result.success) {
                 updateItemStatus(result.item_id, 'uploaded');
             } else {
@@ -1117,9 +1298,9 @@ async function uploadAllSelected() {
         });
 
         if (progressBar) progressBar.style.width = '100%';
-        if (progressText) progressText.textContent = '100%';
+        if (progressText) progressText.textContent = job.message;
 
-        showBatchResults(data.results);
+        showBatchResults(job.results);
         loadFailedItems({ autoExpand: true });
         loadProcessedItems();
 
@@ -1134,6 +1315,7 @@ async function uploadAllSelected() {
         showAlert('Batch upload failed: ' + error.message, 'danger');
         if (progressContainer) progressContainer.style.display = 'none';
     } finally {
+        uploadAllJobId = null;
         if (uploadBtn) {
             uploadBtn.disabled = false;
             uploadBtn.innerHTML = '<i class="fas fa-cloud-upload-alt me-2"></i>Upload All Selected';
@@ -1258,7 +1440,8 @@ function updateUploadAllButton() {
     if (selectedCountSpan) selectedCountSpan.textContent = selectedCount;
     if (toolbarCount) toolbarCount.textContent = selectedCount;
 
-    if (uploadBtn) {
+    // While an upload job runs the button doubles as its cancel button
+    if (uploadBtn && !uploadAllJobId) {
         if (selectedCount > 0) {
             uploadBtn.disabled = false;
             uploadBtn.innerHTML = `<i class="fas fa-cloud-upload-alt me-2"></i>Upload All Selected (${selectedCount})`;
@@ -1647,6 +1830,10 @@ async function retryFailedItem(itemId, button) {
 
 async function retryAllFailedItems() {
     const retryAllBtn = document.getElementById('retryAllFailedBtn');
+    if (retryAllJobId) {
+        if (confirm('Cancel the running retry?')) cancelBackgroundJob(retryAllJobId, retryAllBtn);
+        return;
+    }
     if (!confirm('Retry poster fetch and upload for all recent failed items?')) return;
 
     if (retryAllBtn) {
@@ -1661,15 +1848,25 @@ async function retryAllFailedItems() {
             body: JSON.stringify({ limit: 100 })
         });
         const data = await response.json();
-        if (!response.ok) throw new Error(data.error || 'Retry all failed');
+        if (!response.ok || !data.job_id) throw new Error(data.error || 'Retry all failed');
 
-        showBatchResults(data.results || []);
+        retryAllJobId = data.job_id;
+        const job = await pollBackgroundJob(data.job_id, progress => {
+            if (!retryAllBtn || progress.cancel_requested) return;
+            retryAllBtn.disabled = false;
+            retryAllBtn.innerHTML = `<i class="fas fa-stop me-1"></i>Cancel (${progress.processed}/${progress.total_items})`;
+        });
+        if (job.status === 'failed') throw new Error(job.error || 'Retry all failed');
+
+        showBatchResults(job.results || []);
+        if (job.phase === 'rate_limited') showAlert(job.message, 'warning');
         loadFailedItems({ autoExpand: true });
         loadProcessedItems();
     } catch (error) {
         console.error('Retry all failed items error:', error);
         showAlert('Retry all failed: ' + error.message, 'danger');
     } finally {
+        retryAllJobId = null;
         if (retryAllBtn) {
             retryAllBtn.disabled = false;
             retryAllBtn.innerHTML = '<i class="fas fa-rotate-right me-1"></i>Retry All';
@@ -1765,6 +1962,16 @@ function updateAutoBatchProgress(job) {
     document.getElementById('autoBatchPhase').textContent = formatPhaseLabel(job.phase);
     document.getElementById('autoBatchEta').textContent = calculateAutoBatchEta(job, processed, remaining);
     updateAutoBatchCurrentPoster(job.old_poster_url);
+
+    const stagesEl = document.getElementById('autoBatchStages');
+    if (stagesEl) stagesEl.textContent = formatAutoBatchStages(job.stages);
+}
+
+function formatAutoBatchStages(stages) {
+    if (!stages) return '';
+    return Object.entries(stages).map(([name, stage]) =>
+        `${formatOperationLabel(name)}: ${stage.active} active, ${stage.queued} queued, ${stage.per_minute}/min`
+    ).join(' · ');
 }
 
 function stopAutoBatchPolling() {